@@ -0,0 +1,7 @@
+# -*- coding: UTF-8 -*-
+"""
+Benchmarks of grailkit modules.
+
+:copyright: (c) 2017-2020 by Oleksii Lytvyn (http://alexlitvin.name).
+:license: MIT, see LICENSE for more details.
+"""
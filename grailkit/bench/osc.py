@@ -0,0 +1,276 @@
+# -*- coding: UTF-8 -*-
+"""
+Benchmark of OSC codec and loopback round trip.
+
+Run with `python -m grailkit.bench.osc`, use `--json` to save results
+for comparison between releases.
+
+:copyright: (c) 2017-2020 by Oleksii Lytvyn (http://alexlitvin.name).
+:license: MIT, see LICENSE for more details.
+"""
+from __future__ import annotations
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import sys
+import json
+import time
+import queue
+import platform
+import argparse
+import threading
+
+import grailkit
+from grailkit.osc import OSCMessage, OSCBundle, OSCClient, OSCServer
+
+# typical argument mixes
+ARGUMENTS = {
+    'empty': [],
+    'int': [1, 2, 3, 4],
+    'float': [0.5, 1.5, 2.5, 3.5],
+    'string': ['value', 'another value'],
+    'mixed': [1, 0.5, 'value', b'\x01\x02\x03', True, None],
+}
+
+# argument mixes measured in localhost round trip
+ROUND_TRIP_ARGUMENTS = ('empty', 'mixed')
+
+# sizes of blob argument in bytes
+PAYLOAD_SIZES = (16, 256, 4096)
+
+# depth of nested bundles
+BUNDLE_DEPTH = 3
+
+# messages in every bundle
+BUNDLE_WIDTH = 4
+
+
+def percentile(values: List[int], fraction: float) -> int:
+    """Return value at given fraction of sorted list using nearest rank.
+
+    Args:
+        values (list): sorted values
+        fraction (float): value between 0 and 1
+    Returns:
+        value from list
+    """
+    if not values:
+        return 0
+
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def histogram(values: List[int]) -> Dict[str, int]:
+    """Count values in power of two buckets.
+
+    Args:
+        values (list): latencies in nanoseconds
+    Returns:
+        dict of upper bound of bucket in nanoseconds to count of values
+    """
+    buckets: Dict[str, int] = {}
+
+    for value in values:
+        bound = str(1 << max(0, value).bit_length())
+        buckets[bound] = buckets.get(bound, 0) + 1
+
+    return buckets
+
+
+def measure(name: str, func: Callable[[], Any], iterations: int, warmup: int = 100) -> Dict[str, Any]:
+    """Call `func` many times and collect latency of every call.
+
+    Args:
+        name (str): name of benchmark
+        func (callable): function without arguments
+        iterations (int): number of measured calls
+        warmup (int): number of calls before measurement
+    Returns:
+        dict with ops per second, percentiles in nanoseconds and histogram
+    """
+    clock = time.perf_counter_ns
+
+    for _ in range(warmup):
+        func()
+
+    latencies = [0] * iterations
+    started = clock()
+
+    for index in range(iterations):
+        begin = clock()
+        func()
+        latencies[index] = clock() - begin
+
+    elapsed = clock() - started
+    latencies.sort()
+
+    return {
+        'name': name,
+        'iterations': iterations,
+        'ops_per_sec': iterations * 1e9 / elapsed if elapsed else 0.0,
+        'p50_ns': percentile(latencies, 0.5),
+        'p99_ns': percentile(latencies, 0.99),
+        'p999_ns': percentile(latencies, 0.999),
+        'max_ns': latencies[-1] if latencies else 0,
+        'histogram': histogram(latencies),
+    }
+
+
+def nested_bundle(depth: int, width: int) -> OSCBundle:
+    """Create bundle with `width` messages and nested bundle `depth` levels deep."""
+    bundle = OSCBundle(messages=[OSCMessage('/level/%d/item/%d' % (depth, index), ARGUMENTS['mixed'])
+                                 for index in range(width)])
+
+    if depth > 1:
+        bundle.add(nested_bundle(depth - 1, width))
+
+    return bundle
+
+
+def codec_cases() -> Dict[str, Callable[[], Any]]:
+    """Return benchmarks of building and parsing messages and bundles."""
+    cases: Dict[str, Callable[[], Any]] = {}
+    messages = {name: OSCMessage('/bench/%s' % name, args) for name, args in ARGUMENTS.items()}
+
+    for size in PAYLOAD_SIZES:
+        messages['blob_%d' % size] = OSCMessage('/bench/blob', [b'\xff' * size])
+
+    for name, message in messages.items():
+        dgram = message.build().dgram
+
+        cases['message.build/%s' % name] = message.build
+        cases['message.parse/%s' % name] = lambda dgram=dgram: OSCMessage.parse(dgram).args
+        cases['message.parse_lazy/%s' % name] = lambda dgram=dgram: OSCMessage.parse(dgram, True).address
+
+    bundle = nested_bundle(BUNDLE_DEPTH, BUNDLE_WIDTH)
+    dgram = bundle.build().dgram
+
+    cases['bundle.build/nested'] = bundle.build
+    cases['bundle.parse/nested'] = lambda: OSCBundle.parse(dgram)
+    cases['bundle.parse_lazy/nested'] = lambda: OSCBundle.parse(dgram, True)
+
+    return cases
+
+
+class _EchoServer(OSCServer):
+    """Put every received message into queue."""
+
+    def __init__(self, *args, **kwargs):
+        super(_EchoServer, self).__init__(*args, **kwargs)
+
+        self.received: queue.Queue = queue.Queue()
+
+    def handle(self, address, message, date):
+        self.received.put(message)
+
+
+def round_trip(iterations: int, warmup: int = 100,
+               names: Iterable[str] = ROUND_TRIP_ARGUMENTS) -> List[Dict[str, Any]]:
+    """Measure latency of OSCClient to OSCServer delivery on localhost.
+
+    Args:
+        iterations (int): number of messages for every argument mix
+        warmup (int): number of messages before measurement
+        names (list): names of argument mixes from ARGUMENTS
+    Returns:
+        list of results
+    """
+    server = _EchoServer('127.0.0.1', 0)
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+
+    client = OSCClient(*server.server_address)
+    results = []
+
+    try:
+        for name in names:
+            message = OSCMessage('/bench/%s' % name, ARGUMENTS[name])
+
+            def send_and_receive():
+                client.send(message)
+                server.received.get(timeout=1.0)
+
+            results.append(measure('round_trip/%s' % name, send_and_receive, iterations, warmup))
+    finally:
+        client.close()
+        server.shutdown()
+        server.server_close()
+
+    return results
+
+
+def run(iterations: int = 10000, network: bool = True, match: Optional[str] = None) -> Dict[str, Any]:
+    """Run all benchmarks.
+
+    Args:
+        iterations (int): measured calls of every benchmark
+        network (bool): include localhost round trip
+        match (str): run only benchmarks which names contain this string
+    Returns:
+        dict with environment description and list of results
+    """
+    results = []
+
+    for name, func in codec_cases().items():
+        if not match or match in name:
+            results.append(measure(name, func, iterations))
+
+    names = [name for name in ROUND_TRIP_ARGUMENTS if not match or match in 'round_trip/%s' % name]
+
+    if network and names:
+        # round trip is slower, keep run time reasonable
+        results.extend(round_trip(max(1, iterations // 10), names=names))
+
+    return {
+        'grailkit': grailkit.__version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'time': time.time(),
+        'results': results,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Parse command line, run benchmarks and print report.
+
+    Args:
+        argv (list): command line arguments
+    Returns:
+        exit code
+    """
+    parser = argparse.ArgumentParser(prog='python -m grailkit.bench.osc',
+                                     description='Benchmark OSC codec and loopback round trip.')
+    parser.add_argument('-n', '--iterations', type=int, default=10000,
+                        help='measured calls of every benchmark')
+    parser.add_argument('-k', '--match', default=None,
+                        help='run only benchmarks which names contain this string')
+    parser.add_argument('--no-network', action='store_true',
+                        help='skip localhost round trip')
+    parser.add_argument('--json', metavar='PATH', default=None,
+                        help='write results as JSON to file, "-" for stdout')
+    args = parser.parse_args(argv)
+
+    report = run(args.iterations, not args.no_network, args.match)
+
+    if args.json == '-':
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+
+        return 0
+
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump(report, file, indent=2)
+
+    print('%-36s %14s %10s %10s %10s' % ('benchmark', 'ops/sec', 'p50 us', 'p99 us', 'p999 us'))
+
+    for result in report['results']:
+        print('%-36s %14.0f %10.2f %10.2f %10.2f' % (result['name'], result['ops_per_sec'],
+                                                     result['p50_ns'] / 1000, result['p99_ns'] / 1000,
+                                                     result['p999_ns'] / 1000))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -6,6 +6,7 @@
 """
 from typing import Union, Callable, Any, List, Dict, Tuple, Type
 
+import itertools
 import weakref
 import logging
 
@@ -32,6 +33,8 @@ class Signal(object):
         self._args: List[type] = [object_type(x) for x in args]
         self._fns: Dict[str, Tuple[Any, Any]] = {}
         self._flush_keys: List[str] = []
+        # names of unnamed slots, not reused after disconnect
+        self._names = itertools.count()
 
     def __len__(self):
         """Return number of connected slots."""
@@ -59,7 +62,7 @@ class Signal(object):
         ref = self._wrap(fn)
 
         if len(name) == 0:
-            name = str(len(self._fns))
+            name = str(next(self._names))
 
         self._fns[name] = ref
 
@@ -72,7 +75,9 @@ class Signal(object):
         found_key = None
 
         for key, value in self._fns.items():
-            if value[0] and fn == value[1]():
+            # functions are kept as they are, bound methods as references to object and function
+            if value[0] is None and value[1] is fn or value[0] and \
+                    value[0]() is getattr(fn, '__self__', None) and value[1]() is getattr(fn, '__func__', None):
                 found_key = key
 
                 break
@@ -204,6 +209,14 @@ class Signalable(object):
         if message in self.__slots:
             self.__slots[message].disconnect(fn)
 
+    def slot_length(self, message: str) -> int:
+        """Return number of listeners connected to slot `message`.
+
+        Args:
+            message (str): slot name
+        """
+        return len(self.__slots[message]) if message in self.__slots else 0
+
     def emit(self, message: str, *args) -> None:
         """Trigger all listeners of message.
 
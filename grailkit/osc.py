@@ -5,28 +5,57 @@
 :license: MIT, see LICENSE for more details.
 """
 from __future__ import annotations
-from typing import Any, Union, Optional, List, Tuple, Iterable
+from typing import Any, Union, Optional, List, Tuple, Iterable, Callable, Dict, Deque, Type
 
+import os
 import re
+import sys
 import time
+import heapq
+import queue
+import array
+import ctypes
+import select
 import struct
 import socket
+import asyncio
 import logging
-import decimal
-import datetime
 import builtins
-import calendar
+import itertools
+import collections
+import threading
 import socketserver
+import multiprocessing
+
+from grailkit.core import Signalable
 
 __all__ = [
     'OSCType',
+    'OSCCodec',
     'OSCPacket',
     'OSCMessage',
     'OSCBundle',
+    'OSCTemplate',
+    'OSCParseCache',
+    'OSCMetrics',
+    'OSCClockSync',
     'OSCClient',
+    'OSCRecorder',
+    'OSCReplayer',
     'OSCServer',
+    'OSCServerPool',
+    'OSCStreamClient',
+    'OSCStreamServer',
+    'OSCStreamDecoder',
+    'OSCScheduler',
+    'OSCCoalescer',
+    'OSCDispatcher',
+    'OSCIngestQueue',
+    'AsyncOSCClient',
+    'AsyncOSCServer',
 
     'OSCImpulse',
+    'IMPULSE',
     'OSCColor',
     'OSCMidi',
     'IMMEDIATELY',
@@ -43,9 +72,24 @@ class NTPError(Exception):
 
 
 class OSCParseError(Exception):
-    """Exception raised when a datagram parsing error occurs."""
+    """Exception raised when a datagram parsing error occurs.
 
-    pass
+    Attributes:
+        reason (str): short name of failure, one of `TRUNCATED`, `BAD_ADDRESS`,
+            `BAD_TYPETAG`, `BAD_STRING`, `BAD_SIZE`, `NOT_OSC` or `INVALID`
+    """
+
+    TRUNCATED = 'truncated'
+    BAD_ADDRESS = 'bad_address'
+    BAD_TYPETAG = 'bad_typetag'
+    BAD_STRING = 'bad_string'
+    BAD_SIZE = 'bad_size'
+    NOT_OSC = 'not_osc'
+    INVALID = 'invalid'
+
+    def __init__(self, *args: Any, reason: str = INVALID):
+        super(OSCParseError, self).__init__(*args)
+        self.reason = reason
 
 
 class OSCBuildError(Exception):
@@ -55,9 +99,13 @@ class OSCBuildError(Exception):
 
 
 NTP_IMMEDIATELY = struct.pack('>q', 1)
-_NTP_SYSTEM_EPOCH = datetime.date(*time.gmtime(0)[0:3])
-_NTP_EPOCH = datetime.date(1900, 1, 1)
-_NTP_DELTA = (_NTP_SYSTEM_EPOCH - _NTP_EPOCH).days * 24 * 3600
+# seconds between NTP epoch 1900-01-01 and system epoch 1970-01-01
+_NTP_DELTA = 2208988800
+_NTP_DELTA_NS = _NTP_DELTA * 1000000000
+_NTP_FRACTION = 1 << 32
+_NTP_FRACTION_HALF = 1 << 31
+_NTP_LIMIT = 1 << 64
+_NTP_STRUCT = struct.Struct('>Q')
 
 
 def ntp_to_time(date: float) -> float:
@@ -81,18 +129,104 @@ def time_to_ntp(date: float) -> bytes:
     Args:
         date: System time to be converted
     Returns:
-        NTP time in seconds
+        NTP time datagram
     Raises:
         NTPError if date is invalid
     """
+    if not isinstance(date, (int, float)):
+        raise NTPError('Invalid date: {!r}'.format(date))
+
     try:
-        ntp = date + _NTP_DELTA
-    except TypeError as ve:
+        # scaling by power of two is exact, so float is rounded only once
+        ntp = round(date * _NTP_FRACTION) + (_NTP_DELTA << 32)
+    except (ValueError, OverflowError) as ve:
         raise NTPError('Invalid date: {}'.format(ve))
 
-    num_secs, fraction = str(ntp).split('.')
+    if not 0 <= ntp < _NTP_LIMIT:
+        raise NTPError('Date is out of NTP range: {}'.format(date))
+
+    return _NTP_STRUCT.pack(ntp)
+
+
+def ntp_to_ns(ntp: int) -> int:
+    """Convert a 64-bit NTP time tag to nanoseconds since the epoch in UTC.
+
+    Args:
+        ntp (int): time tag, seconds in high 32 bits and fraction in low 32 bits
+    Returns:
+        system time in nanoseconds
+    """
+    return ((ntp * 1000000000 + _NTP_FRACTION_HALF) >> 32) - _NTP_DELTA_NS
+
+
+def ns_to_ntp(ns: int) -> int:
+    """Convert nanoseconds since the epoch in UTC to a 64-bit NTP time tag.
+
+    Args:
+        ns (int): system time in nanoseconds
+    Returns:
+        time tag, seconds in high 32 bits and fraction in low 32 bits
+    Raises:
+        NTPError if time is out of NTP range
+    """
+    ntp = (((ns + _NTP_DELTA_NS) << 32) + 500000000) // 1000000000
+
+    if not 0 <= ntp < _NTP_LIMIT:
+        raise NTPError('Time is out of NTP range: {}'.format(ns))
+
+    return ntp
+
+
+def ntp_to_ns_batch(timetags: Iterable[int]) -> List[int]:
+    """Convert many 64-bit NTP time tags to nanoseconds since the epoch.
+
+    Args:
+        timetags: time tags as integers
+    Returns:
+        list of system times in nanoseconds
+    """
+    return [((ntp * 1000000000 + _NTP_FRACTION_HALF) >> 32) - _NTP_DELTA_NS for ntp in timetags]
+
+
+def ns_to_ntp_batch(times: Iterable[int]) -> List[int]:
+    """Convert many system times in nanoseconds to 64-bit NTP time tags.
+
+    Args:
+        times: system times in nanoseconds
+    Returns:
+        list of time tags as integers
+    Raises:
+        NTPError if any time is out of NTP range
+    """
+    result = [(((ns + _NTP_DELTA_NS) << 32) + 500000000) // 1000000000 for ns in times]
+
+    if result and not (0 <= min(result) and max(result) < _NTP_LIMIT):
+        raise NTPError('Time is out of NTP range')
+
+    return result
+
+
+def timetags_unpack(data: bytes, index: int = 0, count: Optional[int] = None) -> List[int]:
+    """Read consecutive big-endian time tags and convert them to nanoseconds.
+
+    Args:
+        data: datagram or buffer
+        index (int): offset of the first time tag
+        count (int): number of time tags, all remaining by default
+    Returns:
+        list of system times in nanoseconds
+    Raises:
+        OSCParseError if the datagram is too short
+    """
+    if count is None:
+        count = (len(data) - index) // _TIMETAG_DGRAM_LEN
 
-    return struct.pack('>I', int(num_secs)) + struct.pack('>I', int(fraction))
+    try:
+        timetags = struct.unpack_from('>%dQ' % count, data, index)
+    except struct.error as e:
+        raise OSCParseError('Could not parse datagram: %s' % e, reason=OSCParseError.TRUNCATED)
+
+    return ntp_to_ns_batch(timetags)
 
 
 IMMEDIATELY = 0
@@ -110,10 +244,73 @@ _INT64_DGRAM_LEN = 8
 _CHAR_DGRAM_LEN = 4
 
 
+def _string_unpack(data: bytes, index: int, end: int, encoding: str = 'ascii') -> Tuple[str, int]:
+    """Read padded OSC string from `data` between `index` and `end`.
+
+    Args:
+        data (bytes): datagram
+        index (int): index where string starts
+        end (int): index where string must end at most
+        encoding (str): string encoding
+    Returns:
+        A tuple containing the string and the new end index.
+    Raises:
+        OSCParseError if the datagram could not be parsed.
+    """
+    try:
+        stop = data.index(b'\x00', index, end)
+        value = data[index:stop].decode(encoding)
+    except (ValueError, TypeError, AttributeError) as e:
+        raise OSCParseError('Could not parse string: %s' % e, reason=OSCParseError.BAD_STRING)
+
+    index = stop + _STRING_DGRAM_PAD - (stop - index) % _STRING_DGRAM_PAD
+
+    if index > end:
+        raise OSCParseError('Datagram is too short', reason=OSCParseError.TRUNCATED)
+
+    return value, index
+
+
+def _as_bytes(dgram: Union[bytes, bytearray, memoryview]) -> bytes:
+    """Return immutable datagram, parsed objects may keep views of it."""
+    if isinstance(dgram, bytes):
+        return dgram
+
+    return bytes(dgram)
+
+
+# max size of UDP payload which is not fragmented on ethernet with IPv4
+_UDP_SAFE_SIZE = 1472
+
+# size of bundle prefix and time tag
+_BUNDLE_HEADER_LEN = 16
+
+# do not block on receive when socket is ready, not available on all platforms
+_MSG_DONTWAIT = getattr(socket, 'MSG_DONTWAIT', 0)
+
+
 class OSCImpulse(object):
-    """Representation of Impulse OSC type."""
+    """Representation of Impulse OSC type.
 
-    pass
+    Impulse carries no data, so all instances are the same object.
+    """
+
+    __slots__ = ()
+
+    _instance: Optional[OSCImpulse] = None
+
+    def __new__(cls) -> OSCImpulse:
+        if cls._instance is None:
+            cls._instance = super(OSCImpulse, cls).__new__(cls)
+
+        return cls._instance
+
+    def __repr__(self) -> str:
+        return 'OSCImpulse()'
+
+
+# the only instance of OSCImpulse
+IMPULSE = OSCImpulse()
 
 
 class OSCMidi(object):
@@ -176,6 +373,10 @@ class OSCColor(object):
         return cls(*struct.unpack('>BBBB', data))
 
 
+# array typecodes of unsigned integers by size, used to swap byte order
+_SWAP_TYPECODES = {2: 'H', 4: 'I', 8: 'Q'}
+
+
 class OSCType(object):
     """Reading and writing OSC types."""
 
@@ -195,6 +396,29 @@ class OSCType(object):
     TYPE_DOUBLE = 'd'
     TYPE_INT64 = 'h'
     TYPE_UTF8_STRING = 'S'
+    TYPE_ARRAY_BEGIN = '['
+    TYPE_ARRAY_END = ']'
+
+    # OSC types of items of buffers by struct format character
+    _ELEMENT_TYPES = {
+        'f': TYPE_FLOAT,
+        'd': TYPE_DOUBLE,
+        'b': TYPE_INT,
+        'h': TYPE_INT,
+        'i': TYPE_INT,
+        'l': TYPE_INT,
+        'q': TYPE_INT,
+        'n': TYPE_INT,
+        'H': TYPE_UINT,
+        'I': TYPE_UINT,
+        'L': TYPE_UINT,
+        'Q': TYPE_UINT,
+        'N': TYPE_UINT,
+        'B': TYPE_BLOB,
+        'c': TYPE_BLOB}
+
+    # struct formats supported by memoryview.tolist
+    _NATIVE_FORMATS = frozenset('bBhHiIlLqQnNfd?cP')
 
     # list of all supported types
     _SUPPORTED_TYPES = (
@@ -236,8 +460,11 @@ class OSCType(object):
         """Check if given type is supported.
 
         Args:
-            _type (str): OSC type tag
+            _type (str): OSC type tag, or array of types in square brackets
         """
+        if isinstance(_type, str) and _type.startswith(cls.TYPE_ARRAY_BEGIN):
+            return _type.endswith(cls.TYPE_ARRAY_END) and not OSCCodec.compile(_type).unknown
+
         return _type in cls._SUPPORTED_TYPES
 
     @classmethod
@@ -275,9 +502,114 @@ class OSCType(object):
             arg_type = cls.TYPE_MIDI
         elif isinstance(value, OSCImpulse):
             arg_type = cls.TYPE_IMPULSE
+        elif builtin_type == builtins.bytearray:
+            arg_type = cls.TYPE_BLOB
+        elif builtin_type == builtins.list or builtin_type == builtins.tuple:
+            arg_type = cls.TYPE_ARRAY_BEGIN + ''.join(cls.tag(item) for item in value) + cls.TYPE_ARRAY_END
+        else:
+            arg_type = cls._buffer_tag(value) or arg_type
 
         return arg_type
 
+    @classmethod
+    def _buffer_tag(cls, value: Any) -> Optional[str]:
+        """Get type tag of array.array, memoryview or NumPy array.
+
+        Buffers of bytes are blobs, buffers of numbers are OSC arrays.
+
+        Returns:
+            type tag or None if value is not a supported buffer
+        """
+        try:
+            view = memoryview(value)
+        except TypeError:
+            return None
+
+        element = cls._ELEMENT_TYPES.get(view.format.lstrip('@=<>!'))
+
+        if element is None:
+            return None
+
+        if element == cls.TYPE_BLOB:
+            return element
+
+        if element == cls.TYPE_INT and view.itemsize == 8:
+            element = cls.TYPE_INT64
+        elif element == cls.TYPE_UINT and view.itemsize == 8:
+            element = cls.TYPE_INT64
+        elif element == cls.TYPE_UINT and view.itemsize < 4:
+            element = cls.TYPE_INT
+
+        return cls.TYPE_ARRAY_BEGIN + element * (view.nbytes // view.itemsize) + cls.TYPE_ARRAY_END
+
+    @staticmethod
+    def array_values(value: Any) -> Union[List[Any], Tuple[Any, ...]]:
+        """Return items of array.array, memoryview, NumPy array or sequence as a flat list.
+
+        Args:
+            value: sequence of values
+        Returns:
+            list or tuple of values
+        """
+        if isinstance(value, (list, tuple)):
+            return value
+
+        if isinstance(value, memoryview):
+            if value.ndim != 1 or value.format not in OSCType._NATIVE_FORMATS:
+                value = value.cast('B').cast(value.format.lstrip('@=<>!'))
+
+            return value.tolist()
+
+        # NumPy arrays of any shape
+        if hasattr(value, 'ravel'):
+            return value.ravel().tolist()
+
+        return value.tolist() if hasattr(value, 'tolist') else list(value)
+
+    @staticmethod
+    def blob_from_array(value: Any) -> bytes:
+        """Pack array.array, memoryview or NumPy array into typed blob.
+
+        Typed blob holds items of array in little-endian byte order
+        without any conversion, receiver reads it with `blob_to_array`.
+
+        Args:
+            value: object supporting buffer protocol
+        Returns:
+            blob data
+        """
+        view = memoryview(value)
+        data = view.tobytes()
+
+        if sys.byteorder == 'big' and view.itemsize in _SWAP_TYPECODES:
+            swapped = array.array(_SWAP_TYPECODES[view.itemsize], data)
+            swapped.byteswap()
+            data = swapped.tobytes()
+
+        return data
+
+    @staticmethod
+    def blob_to_array(blob: Union[bytes, memoryview], typecode: str) -> memoryview:
+        """Return typed blob as view of numbers without copying.
+
+        Use `OSCMessage.typed_blob` to read items right from received datagram.
+
+        Args:
+            blob (bytes): data of typed blob
+            typecode (str): struct format of items, for example 'f' or 'h'
+        Returns:
+            memoryview of items, usable with numpy.frombuffer or array.array
+        """
+        view = memoryview(blob).cast('B').cast(typecode)
+
+        if sys.byteorder == 'big' and view.itemsize in _SWAP_TYPECODES:
+            swapped = array.array(_SWAP_TYPECODES[view.itemsize])
+            swapped.frombytes(blob)
+            swapped.byteswap()
+            view = memoryview(swapped).cast('B').cast(typecode)
+
+        return view
+
     @classmethod
     def has_datagram(cls, _type: str) -> bool:
         """Check if this type has i/o method.
@@ -336,29 +668,10 @@ class OSCType(object):
             OSCParseError if the datagram could not be parsed.
             OSCBuildError if datagram could not be build.
         """
-        offset = 0
+        if index < len(data) and data[index] == 0:
+            raise OSCParseError('OSC string cannot begin with a null byte', reason=OSCParseError.BAD_STRING)
 
-        try:
-            while data[index + offset] != 0:
-                offset += 1
-
-            if offset == 0:
-                raise OSCParseError('OSC string cannot begin with a null byte: %s' %
-                                    str(data[index:]))
-
-            if offset % _STRING_DGRAM_PAD == 0:
-                offset += _STRING_DGRAM_PAD
-            else:
-                offset += (-offset % _STRING_DGRAM_PAD)
-
-            if offset > len(data[index:]):
-                raise OSCParseError('Datagram is too short')
-
-            data_str = data[index:index + offset]
-
-            return data_str.replace(b'\x00', b'').decode('ascii'), index + offset
-        except (IndexError, TypeError) as ex:
-            raise OSCParseError('Could not parse datagram %s' % ex)
+        return _string_unpack(data, index, len(data), 'ascii')
 
     @classmethod
     def string_pack(cls, data: str) -> bytes:
@@ -387,29 +700,10 @@ class OSCType(object):
             OSCParseError if the datagram could not be parsed.
             OSCBuildError if datagram could not be build.
         """
-        offset = 0
-
-        try:
-            while data[index + offset] != 0:
-                offset += 1
-
-            if offset == 0:
-                raise OSCParseError('OSC string cannot begin with a null byte: %s' %
-                                    str(data[index:]))
-
-            if offset % _STRING_DGRAM_PAD == 0:
-                offset += _STRING_DGRAM_PAD
-            else:
-                offset += (-offset % _STRING_DGRAM_PAD)
+        if index < len(data) and data[index] == 0:
+            raise OSCParseError('OSC string cannot begin with a null byte', reason=OSCParseError.BAD_STRING)
 
-            if offset > len(data[index:]):
-                raise OSCParseError('Datagram is too short')
-
-            data_str = data[index:index + offset]
-
-            return data_str.replace(b'\x00', b'').decode('utf-8'), index + offset
-        except (IndexError, TypeError) as ex:
-            raise OSCParseError('Could not parse datagram %s' % ex)
+        return _string_unpack(data, index, len(data), 'utf-8')
 
     @classmethod
     def utf8_string_pack(cls, data: str) -> bytes:
@@ -440,12 +734,12 @@ class OSCType(object):
             OSCBuildError if the int could not be converted.
         """
         try:
-            if len(data[index:]) < _INT_DGRAM_LEN:
-                raise OSCParseError('Datagram is too short')
-            return (struct.unpack('>i', data[index:index + _INT_DGRAM_LEN])[0],
+            if len(data) - index < _INT_DGRAM_LEN:
+                raise OSCParseError('Datagram is too short', reason=OSCParseError.TRUNCATED)
+            return (struct.unpack_from('>i', data, index)[0],
                     index + _INT_DGRAM_LEN)
         except (struct.error, TypeError) as e:
-            raise OSCParseError('Could not parse datagram %s' % e)
+            raise OSCParseError('Could not parse datagram %s' % e, reason=OSCParseError.TRUNCATED)
 
     @classmethod
     def int_pack(cls, data: int) -> bytes:
@@ -471,12 +765,12 @@ class OSCType(object):
             OSCBuildError if the int could not be converted.
         """
         try:
-            if len(data[index:]) < _UINT_DGRAM_LEN:
-                raise OSCParseError('Datagram is too short')
-            return (struct.unpack('>I', data[index:index + _UINT_DGRAM_LEN])[0],
+            if len(data) - index < _UINT_DGRAM_LEN:
+                raise OSCParseError('Datagram is too short', reason=OSCParseError.TRUNCATED)
+            return (struct.unpack_from('>I', data, index)[0],
                     index + _UINT_DGRAM_LEN)
         except (struct.error, TypeError) as e:
-            raise OSCParseError('Could not parse datagram %s' % e)
+            raise OSCParseError('Could not parse datagram %s' % e, reason=OSCParseError.TRUNCATED)
 
     @classmethod
     def uint_pack(cls, data: int) -> bytes:
@@ -503,7 +797,7 @@ class OSCType(object):
             return (struct.unpack('>q', data[index:index + _INT64_DGRAM_LEN])[0],
                     index + _INT64_DGRAM_LEN)
         except (struct.error, TypeError) as e:
-            raise OSCParseError('Could not parse datagram %s' % e)
+            raise OSCParseError('Could not parse datagram %s' % e, reason=OSCParseError.TRUNCATED)
 
     @classmethod
     def int64_pack(cls, data: int) -> bytes:
@@ -530,7 +824,7 @@ class OSCType(object):
             return (struct.unpack('>d', data[index:index + _DOUBLE_DGRAM_LEN])[0],
                     index + _DOUBLE_DGRAM_LEN)
         except (struct.error, TypeError) as e:
-            raise OSCParseError('Could not parse datagram %s' % e)
+            raise OSCParseError('Could not parse datagram %s' % e, reason=OSCParseError.TRUNCATED)
 
     @classmethod
     def double_pack(cls, data: float) -> bytes:
@@ -556,13 +850,13 @@ class OSCType(object):
             OSCBuildError if the float could not be converted.
         """
         try:
-            if len(data[index:]) < _FLOAT_DGRAM_LEN:
-                data += b'\x00' * (_FLOAT_DGRAM_LEN - len(data[index:]))
+            if len(data) - index < _FLOAT_DGRAM_LEN:
+                data += b'\x00' * (_FLOAT_DGRAM_LEN - len(data) + index)
 
             return (struct.unpack('>f', data[index:index + _FLOAT_DGRAM_LEN])[0],
                     index + _FLOAT_DGRAM_LEN)
         except (struct.error, TypeError) as e:
-            raise OSCParseError('Could not parse datagram %s' % e)
+            raise OSCParseError('Could not parse datagram %s' % e, reason=OSCParseError.TRUNCATED)
 
     @classmethod
     def float_pack(cls, data: Union[float, int]) -> bytes:
@@ -593,21 +887,17 @@ class OSCType(object):
             OSCParseError if the datagram could not be parsed.
             NTPError if time cant be converted
         """
-        # Check for the special case first.
-        if data[index:index + _TIMETAG_DGRAM_LEN] == NTP_IMMEDIATELY:
-            return IMMEDIATELY, index + _TIMETAG_DGRAM_LEN
+        if len(data) - index < _TIMETAG_DGRAM_LEN:
+            raise OSCParseError('Datagram is too short', reason=OSCParseError.TRUNCATED)
 
-        if len(data[index:]) < _TIMETAG_DGRAM_LEN:
-            raise OSCParseError('Datagram is too short')
+        ntp = _NTP_STRUCT.unpack_from(data, index)[0]
 
-        num_secs, index = OSCType.int_unpack(data, index)
-        fraction, index = OSCType.int_unpack(data, index)
-        # Get a decimal representation from those two values.
-        dec = decimal.Decimal(str(num_secs) + '.' + str(fraction))
-        # And convert it to float simply.
-        system_time = float(dec)
+        # Check for the special case first.
+        if ntp == 1:
+            return IMMEDIATELY, index + _TIMETAG_DGRAM_LEN
 
-        return ntp_to_time(system_time), index
+        # exact integer shift of epoch, float is rounded once on division
+        return (ntp - (_NTP_DELTA << 32)) / _NTP_FRACTION, index + _TIMETAG_DGRAM_LEN
 
     @classmethod
     def timetag_pack(cls, data: float) -> bytes:
@@ -637,7 +927,7 @@ class OSCType(object):
             return OSCColor.unpack(data[index:index + _COLOR_DGRAM_LEN]),\
                    index + _COLOR_DGRAM_LEN
         except (struct.error, TypeError) as e:
-            raise OSCParseError('Could not parse datagram %s' % e)
+            raise OSCParseError('Could not parse datagram %s' % e, reason=OSCParseError.TRUNCATED)
 
     @classmethod
     def color_pack(cls, data: OSCColor) -> bytes:
@@ -663,7 +953,7 @@ class OSCType(object):
         try:
             return OSCMidi.unpack(data[index:index + _MIDI_DGRAM_LEN]), index + _MIDI_DGRAM_LEN
         except (struct.error, TypeError) as e:
-            raise OSCParseError('Could not parse datagram %s' % e)
+            raise OSCParseError('Could not parse datagram %s' % e, reason=OSCParseError.TRUNCATED)
 
     @classmethod
     def midi_pack(cls, data: OSCMidi) -> bytes:
@@ -689,7 +979,7 @@ class OSCType(object):
         try:
             return bytes(data[index]).decode('ascii'), index + _CHAR_DGRAM_LEN
         except (struct.error, TypeError) as e:
-            raise OSCParseError('Could not parse datagram %s' % e)
+            raise OSCParseError('Could not parse datagram %s' % e, reason=OSCParseError.TRUNCATED)
 
     @classmethod
     def char_pack(cls, data: str) -> bytes:
@@ -724,8 +1014,8 @@ class OSCType(object):
         total_size = size + (-size % _BLOB_DGRAM_PAD)
         end_index = offset + size
 
-        if end_index - index > len(data[index:]):
-            raise OSCParseError('Datagram is too short.')
+        if end_index > len(data):
+            raise OSCParseError('Datagram is too short.', reason=OSCParseError.TRUNCATED)
 
         return data[offset:offset + size], offset + total_size
 
@@ -744,6 +1034,428 @@ class OSCType(object):
         return dgram
 
 
+# shared argument pairs of types without value
+_CONSTANT_ARGS: Dict[str, Tuple[str, Any]] = {
+    OSCType.TYPE_TRUE: (OSCType.TYPE_TRUE, True),
+    OSCType.TYPE_FALSE: (OSCType.TYPE_FALSE, False),
+    OSCType.TYPE_NULL: (OSCType.TYPE_NULL, None),
+    OSCType.TYPE_IMPULSE: (OSCType.TYPE_IMPULSE, IMPULSE)}
+
+
+class OSCCodec(object):
+    """Compiled packer and unpacker of OSC arguments for a single type tag string.
+
+    Type tags are compiled once into a plan of segments: runs of fixed size
+    arguments are packed with one `struct.Struct`, strings and blobs are handled
+    separately as they have variable length. Use `OSCCodec.compile` to get a
+    cached codec instead of creating new instances.
+
+    Array brackets don't produce segments, items of arrays are packed in
+    runs together with surrounding arguments, so an array of numbers is
+    packed and unpacked with one struct call.
+    """
+
+    __slots__ = ['typetag', 'types', 'arguments', 'unknown', 'fixed', 'constant',
+                 '_tag_dgram', '_segments', '_shape']
+
+    # segment kinds
+    _STRUCT = 0
+    _STRING = 1
+    _BLOB = 2
+    _CONST = 3
+    _IMPULSE = 4
+
+    # struct formats of fixed size types
+    _FORMATS = {
+        OSCType.TYPE_INT: 'i',
+        OSCType.TYPE_UINT: 'I',
+        OSCType.TYPE_FLOAT: 'f',
+        OSCType.TYPE_DOUBLE: 'd',
+        OSCType.TYPE_INT64: 'q',
+        OSCType.TYPE_CHAR: 'c3x',
+        OSCType.TYPE_COLOR: '4s',
+        OSCType.TYPE_MIDI: '4s',
+        OSCType.TYPE_TIMETAG: '8s'}
+
+    # value converters applied before packing and after unpacking
+    _PACKERS = {
+        OSCType.TYPE_CHAR: lambda value: value.encode('ascii'),
+        OSCType.TYPE_COLOR: lambda value: value.pack(),
+        OSCType.TYPE_MIDI: lambda value: value.pack(),
+        OSCType.TYPE_TIMETAG: lambda value: OSCType.timetag_pack(value)}
+
+    _UNPACKERS = {
+        OSCType.TYPE_CHAR: lambda data: data.decode('ascii'),
+        OSCType.TYPE_COLOR: lambda data: OSCColor.unpack(data),
+        OSCType.TYPE_MIDI: lambda data: OSCMidi.unpack(data),
+        OSCType.TYPE_TIMETAG: lambda data: OSCType.timetag_unpack(data, 0)[0]}
+
+    # values of types without datagram
+    _CONSTANTS = {
+        OSCType.TYPE_TRUE: True,
+        OSCType.TYPE_FALSE: False,
+        OSCType.TYPE_NULL: None}
+
+    _cache = {}
+    _CACHE_SIZE = 1024
+
+    def __init__(self, typetag: str):
+        """Compile type tag string.
+
+        Args:
+            typetag (str): OSC type tags with or without leading comma
+        """
+        if typetag.startswith(','):
+            typetag = typetag[1:]
+
+        self.typetag = typetag
+        self.types = ''
+        self.unknown = ''
+        self._tag_dgram = OSCType.string_pack(',' + typetag) if typetag else b''
+        self._segments: List[tuple] = []
+        self._shape: Optional[Tuple[Any, ...]] = None
+
+        run = ''
+
+        for _type in typetag:
+            if _type == OSCType.TYPE_ARRAY_BEGIN or _type == OSCType.TYPE_ARRAY_END:
+                continue
+
+            if _type in self._FORMATS:
+                run += _type
+                self.types += _type
+                continue
+
+            self._flush_run(run)
+            run = ''
+
+            if _type in (OSCType.TYPE_STRING, OSCType.TYPE_UTF8_STRING):
+                self._segments.append((self._STRING, 'ascii' if _type == OSCType.TYPE_STRING else 'utf-8'))
+            elif _type == OSCType.TYPE_BLOB:
+                self._segments.append((self._BLOB,))
+            elif _type in self._CONSTANTS:
+                self._segments.append((self._CONST, self._CONSTANTS[_type]))
+            elif _type == OSCType.TYPE_IMPULSE:
+                self._segments.append((self._IMPULSE,))
+            else:
+                self.unknown += _type
+                continue
+
+            self.types += _type
+
+        self._flush_run(run)
+
+        # type tags of top level arguments, arrays are one argument
+        self.arguments: Union[str, Tuple[str, ...]] = self.types
+
+        if OSCType.TYPE_ARRAY_BEGIN in typetag or OSCType.TYPE_ARRAY_END in typetag:
+            self._compile_arrays(typetag)
+
+        # whether some arguments are values of types without datagram
+        self.constant = any(segment[0] in (self._CONST, self._IMPULSE) for segment in self._segments)
+
+        # size of arguments if all of them are fixed size, None otherwise
+        self.fixed = None
+
+        if all(segment[0] in (self._STRUCT, self._CONST, self._IMPULSE) for segment in self._segments):
+            self.fixed = sum(segment[1].size for segment in self._segments if segment[0] == self._STRUCT)
+
+    def __len__(self) -> int:
+        """Return number of arguments handled by this codec."""
+        return len(self.types)
+
+    def _compile_arrays(self, typetag: str) -> None:
+        """Split type tags into top level arguments and describe nesting of arrays.
+
+        Shape of argument is None for single value, number of items for array
+        of single values and tuple of shapes for array with nested arrays.
+        """
+        stack: List[List[Any]] = [[]]
+        tags: List[str] = []
+        start = 0
+
+        for index, _type in enumerate(typetag):
+            if _type == OSCType.TYPE_ARRAY_BEGIN:
+                if len(stack) == 1:
+                    start = index
+
+                stack.append([])
+            elif _type == OSCType.TYPE_ARRAY_END:
+                if len(stack) == 1:
+                    self.unknown += _type
+                    continue
+
+                items = stack.pop()
+                stack[-1].append(len(items) if all(item is None for item in items) else tuple(items))
+
+                if len(stack) == 1:
+                    tags.append(typetag[start:index + 1])
+            elif _type in self.types:
+                stack[-1].append(None)
+
+                if len(stack) == 1:
+                    tags.append(_type)
+
+        if len(stack) > 1:
+            self.unknown += OSCType.TYPE_ARRAY_BEGIN
+
+        self.arguments = tuple(tags)
+        self._shape = tuple(stack[0])
+
+    @classmethod
+    def _flatten(cls, shape: Tuple[Any, ...], values: List[Any], flat: List[Any]) -> None:
+        """Append values of arguments and items of arrays to `flat` list."""
+        if len(values) != len(shape):
+            raise OSCBuildError('Expected {} values, got {}'.format(len(shape), len(values)))
+
+        for item, value in zip(shape, values):
+            if item is None:
+                flat.append(value)
+            elif isinstance(item, int):
+                items = OSCType.array_values(value)
+
+                if len(items) != item:
+                    raise OSCBuildError('Expected array of {} items, got {}'.format(item, len(items)))
+
+                flat.extend(items)
+            else:
+                cls._flatten(item, OSCType.array_values(value), flat)
+
+    @classmethod
+    def _group(cls, shape: Tuple[Any, ...], values: List[Any], index: int) -> Tuple[List[Any], int]:
+        """Collect flat values back into arguments and arrays."""
+        result = []
+
+        for item in shape:
+            if item is None:
+                result.append(values[index])
+                index += 1
+            elif isinstance(item, int):
+                result.append(values[index:index + item])
+                index += item
+            else:
+                items, index = cls._group(item, values, index)
+                result.append(items)
+
+        return result, index
+
+    def _flush_run(self, run: str) -> None:
+        """Add segment for a run of fixed size types."""
+        if not run:
+            return
+
+        packers = tuple(self._PACKERS.get(_type) for _type in run)
+        unpackers = tuple(self._UNPACKERS.get(_type) for _type in run)
+
+        self._segments.append((
+            self._STRUCT,
+            struct.Struct('>' + ''.join(self._FORMATS[_type] for _type in run)),
+            len(run),
+            packers if any(packers) else None,
+            unpackers if any(unpackers) else None))
+
+    @classmethod
+    def compile(cls, typetag: str) -> OSCCodec:
+        """Return cached codec for the given type tag string.
+
+        Args:
+            typetag (str): OSC type tags with or without leading comma
+        Returns:
+            OSCCodec instance
+        """
+        codec = cls._cache.get(typetag)
+
+        if codec is None:
+            if len(cls._cache) >= cls._CACHE_SIZE:
+                cls._cache.clear()
+
+            codec = cls._cache[typetag] = cls(typetag)
+
+        return codec
+
+    def pack(self, address: str, values: List[Any]) -> bytes:
+        """Build message datagram.
+
+        Args:
+            address (str): OSC address of message
+            values (list): argument values, one for each type
+        Returns:
+            datagram of OSCMessage
+        Raises:
+            OSCBuildError if values can't be packed
+        """
+        return bytes(self._pack_values(OSCType.string_pack(address) + self._tag_dgram, values))
+
+    def _pack_values(self, header: bytes, values: List[Any], buffer: Optional[bytearray] = None) -> bytearray:
+        """Pack header and arguments into a preallocated buffer.
+
+        When `buffer` is given datagram is appended to it instead.
+        """
+        if self.unknown:
+            raise OSCBuildError('Incorrect parameter type found {}'.format(self.unknown))
+
+        if self._shape is not None:
+            flat: List[Any] = []
+            self._flatten(self._shape, values, flat)
+            values = flat
+
+        if len(values) != len(self.types):
+            raise OSCBuildError('Expected {} arguments, got {}'.format(len(self.types), len(values)))
+
+        try:
+            if self.fixed is not None:
+                encoded = None
+                size = len(header) + self.fixed
+            else:
+                encoded = []
+                size = len(header)
+                index = 0
+
+                # encode variable length values first to know the total size
+                for segment in self._segments:
+                    kind = segment[0]
+
+                    if kind == self._STRUCT:
+                        size += segment[1].size
+                        index += segment[2]
+                        continue
+                    elif kind == self._STRING:
+                        data = values[index].encode(segment[1])
+                        data += b'\x00' * (_STRING_DGRAM_PAD - len(data) % _STRING_DGRAM_PAD)
+                    elif kind == self._BLOB:
+                        value = values[index]
+
+                        if not isinstance(value, bytes):
+                            value = OSCType.blob_from_array(value)
+
+                        if not value:
+                            raise OSCBuildError('Blob value cannot be empty')
+
+                        data = struct.pack('>i', len(value)) + value + b'\x00' * (-len(value) % _BLOB_DGRAM_PAD)
+                    else:
+                        index += 1
+                        continue
+
+                    encoded.append(data)
+                    size += len(data)
+                    index += 1
+
+            if buffer is None:
+                buffer = bytearray(size)
+                offset = 0
+            else:
+                offset = len(buffer)
+                buffer.extend(bytes(size))
+
+            buffer[offset:offset + len(header)] = header
+            self._pack_into(buffer, offset + len(header), values, encoded)
+
+            return buffer
+        except (struct.error, UnicodeEncodeError, AttributeError, TypeError) as e:
+            raise OSCBuildError('Wrong argument value passed: {}'.format(e))
+
+    def _pack_into(self, buffer: bytearray, offset: int, values: List[Any],
+                   encoded: Optional[List[bytes]]) -> None:
+        """Write values into buffer, variable length values must be already encoded."""
+        index = 0
+        position = 0
+
+        for segment in self._segments:
+            kind = segment[0]
+
+            if kind == self._STRUCT:
+                count = segment[2]
+                packers = segment[3]
+                args = values[index:index + count]
+
+                if packers:
+                    args = [fn(value) if fn else value for fn, value in zip(packers, args)]
+
+                segment[1].pack_into(buffer, offset, *args)
+                offset += segment[1].size
+                index += count
+            elif kind == self._STRING or kind == self._BLOB:
+                data = encoded[position]
+                buffer[offset:offset + len(data)] = data
+                offset += len(data)
+                position += 1
+                index += 1
+            else:
+                index += 1
+
+    def unpack(self, data: bytes, index: int, end: Optional[int] = None,
+               views: bool = False) -> Tuple[List[Any], int]:
+        """Parse arguments from datagram.
+
+        Args:
+            data (bytes): datagram
+            index (int): index where arguments start in datagram
+            end (int): index where arguments must end at most, end of `data` by default
+            views (bool): return blobs as memoryviews of `data` instead of copies
+        Returns:
+            tuple with list of values and the new end index
+        Raises:
+            OSCParseError if datagram could not be parsed
+        """
+        values: List[Any] = []
+        # view of datagram, created on first blob
+        view: Optional[memoryview] = None
+
+        if end is None:
+            end = len(data)
+
+        if self.unknown:
+            logging.warning('Unhandled parameter types: {0}'.format(self.unknown))
+
+        try:
+            for segment in self._segments:
+                kind = segment[0]
+
+                if kind == self._STRUCT:
+                    raw = segment[1].unpack_from(data, index)
+                    index += segment[1].size
+                    unpackers = segment[4]
+
+                    if index > end:
+                        raise OSCParseError('Datagram is too short', reason=OSCParseError.TRUNCATED)
+
+                    if unpackers:
+                        values.extend(fn(value) if fn else value for fn, value in zip(unpackers, raw))
+                    else:
+                        values.extend(raw)
+                elif kind == self._STRING:
+                    value, index = _string_unpack(data, index, end, segment[1])
+                    values.append(value)
+                elif kind == self._BLOB:
+                    size = struct.unpack_from('>i', data, index)[0]
+                    index += _INT_DGRAM_LEN
+
+                    if size < 0 or index + size > end:
+                        raise OSCParseError('Datagram is too short', reason=OSCParseError.TRUNCATED)
+
+                    if not views:
+                        values.append(bytes(data[index:index + size]))
+                    else:
+                        if view is None:
+                            view = memoryview(data)
+
+                        values.append(view[index:index + size])
+                    index += size + (-size % _BLOB_DGRAM_PAD)
+                elif kind == self._CONST:
+                    values.append(segment[1])
+                else:
+                    values.append(IMPULSE)
+        except struct.error as e:
+            raise OSCParseError('Could not parse datagram %s' % e, reason=OSCParseError.TRUNCATED)
+        except ValueError as e:
+            raise OSCParseError('Could not parse datagram %s' % e)
+
+        if self._shape is not None:
+            values = self._group(self._shape, values, 0)[0]
+
+        return values, index
+
+
 class OSCPacket(object):
     """Unit of transmission of the OSC protocol.
 
@@ -751,29 +1463,35 @@ class OSCPacket(object):
     Any application that receives OSC Packets is an OSC Server.
     """
 
-    def __init__(self, dgram: bytes):
+    __slots__ = ['time', 'dgram', 'message']
+
+    def __init__(self, dgram: bytes, lazy: bool = False, cache: Optional[OSCParseCache] = None):
         """Initialize an OSCPacket with the given UDP datagram.
 
         Args:
             dgram: the raw UDP datagram holding the OSC packet.
+            lazy (bool): decode only addresses, arguments of messages are decoded on first access
+            cache (OSCParseCache): take parsed message or bundle from cache
         Raises:
             OSCParseError if the datagram could not be parsed.
         """
-        self.time = calendar.timegm(time.gmtime())
+        self.time = time.time()
         self.dgram = dgram
         self.message: Optional[Union[OSCMessage, OSCBundle]] = None
 
         try:
-            if OSCBundle.is_valid(dgram):
-                self.message = OSCBundle.parse(dgram)
+            if cache is not None and (OSCBundle.is_valid(dgram) or OSCMessage.is_valid(dgram)):
+                self.message = cache.parse(dgram, lazy)
+            elif OSCBundle.is_valid(dgram):
+                self.message = OSCBundle.parse(dgram, lazy)
             elif OSCMessage.is_valid(dgram):
-                self.message = OSCMessage.parse(dgram)
+                self.message = OSCMessage.parse(dgram, lazy)
             else:
                 # Empty packet, should not happen as per the spec but heh, UDP...
                 raise OSCParseError("OSC Packet should at least contain an OSCMessage "
-                                    "or an OSCBundle.")
+                                    "or an OSCBundle.", reason=OSCParseError.NOT_OSC)
         except OSCParseError as pe:
-            raise OSCParseError("Could not parse packet: %s" % pe)
+            raise OSCParseError("Could not parse packet: %s" % pe, reason=pe.reason)
 
     def __cmp__(self, other):
         """Compare two OSCPacket's.
@@ -792,7 +1510,20 @@ class OSCPacket(object):
 
 
 class OSCMessage(object):
-    """Builds arbitrary OSCMessage instances."""
+    """Builds arbitrary OSCMessage instances.
+
+    Arguments are kept as (type tag, value) pairs, arguments of types
+    without value (true, false, null, impulse) share one pair per type.
+    Messages created by `parse` can be returned with `release` into a pool
+    of `pool_size` messages, which `parse` reuses instead of allocating.
+    """
+
+    __slots__ = ['_address', '_arguments', '_pending', '_dgram', '_source', '_prefix']
+
+    # max number of released messages kept for reuse, 0 disables pool
+    pool_size = 0
+
+    _pool: List[OSCMessage] = []
 
     def __init__(self, address: str = "/", args: List[Any] = None):
         """Initialize a new OSCMessage.
@@ -802,8 +1533,12 @@ class OSCMessage(object):
             args (list): list of args to add to message
         """
         self._address = "/"
-        self._args: List[Tuple[str, Any]] = []
-        self._dgram = b''
+        self._arguments: List[Tuple[str, Any]] = []
+        self._pending: Optional[Tuple[bytes, int, int]] = None
+        self._dgram: Optional[bytes] = b''
+        self._source: Optional[memoryview] = None
+        # address, codec and their encoded datagram
+        self._prefix: Optional[Tuple[str, OSCCodec, bytes]] = None
 
         # OSC address will be checked here
         self.address = address
@@ -882,16 +1617,48 @@ class OSCMessage(object):
         return self.build().dgram == other.build().dgram
 
     @property
-    def address(self) -> str:
-        """Return the OSC address this message will be sent to."""
-        return self._address
+    def _args(self) -> List[Tuple[str, Any]]:
+        """Return list of (type, value) pairs, decode them if message was parsed lazily."""
+        if self._pending is not None:
+            self._decode()
 
-    @address.setter
-    def address(self, value: str) -> None:
-        """Set the OSC address this message will be sent to.
+        return self._arguments
 
-        Args:
-            value (str): OSC message address pattern
+    @_args.setter
+    def _args(self, value: List[Tuple[str, Any]]) -> None:
+        """Set list of (type, value) pairs."""
+        self._arguments = value
+        self._pending = None
+
+    @property
+    def is_decoded(self) -> bool:
+        """Return False if arguments of lazily parsed message are not decoded yet."""
+        return self._pending is None
+
+    @property
+    def typetag(self) -> str:
+        """Return OSC type tags of arguments without leading comma.
+
+        Arguments of lazily parsed message are not decoded.
+        """
+        if self._pending is not None:
+            dgram, index, end = self._pending
+
+            return self._unpack_typetag(dgram, index, end)[0]
+
+        return "".join([arg[0] for arg in self._arguments])
+
+    @property
+    def address(self) -> str:
+        """Return the OSC address this message will be sent to."""
+        return self._address
+
+    @address.setter
+    def address(self, value: str) -> None:
+        """Set the OSC address this message will be sent to.
+
+        Args:
+            value (str): OSC message address pattern
         """
         if not value.startswith('/'):
             raise ValueError("Given '%s' OSC address doesn't start with /." % str(value))
@@ -909,13 +1676,44 @@ class OSCMessage(object):
     @property
     def size(self) -> int:
         """Return length of the datagram for this message."""
+        if self._dgram is None:
+            return self._source.nbytes
+
         return len(self._dgram)
 
     @property
     def dgram(self) -> bytes:
         """Return datagram from which this message was built."""
+        if self._dgram is None:
+            self._dgram = self._source.tobytes()
+            self._source = None
+
         return self._dgram
 
+    def typed_blob(self, index: int, typecode: str) -> memoryview:
+        """Return blob argument as view of numbers in datagram without copying.
+
+        Args:
+            index (int): index of blob argument
+            typecode (str): struct format of items, for example 'f' or 'h'
+        Returns:
+            memoryview of items, see `OSCType.blob_to_array`
+        Raises:
+            OSCParseError if datagram could not be parsed
+            ValueError if argument is not a blob
+        """
+        dgram = self.dgram or self.build().dgram
+        end = len(dgram)
+
+        position = _string_unpack(dgram, 0, end)[1]
+        typetag, position = self._unpack_typetag(dgram, position, end)
+        codec = OSCCodec.compile(typetag)
+
+        if codec.arguments[index] != OSCType.TYPE_BLOB:
+            raise ValueError('Argument {} is not a blob'.format(index))
+
+        return OSCType.blob_to_array(codec.unpack(dgram, position, end, True)[0][index], typecode)
+
     # todo: Remove this method?
     def add(self, value: Any, _type: Optional[str] = None) -> None:
         """Add a typed argument to this message.
@@ -945,7 +1743,7 @@ class OSCMessage(object):
         if not _type:
             _type = OSCType.tag(value)
 
-        self._args.append((_type, value))
+        self._args.append(_CONSTANT_ARGS.get(_type) or (_type, value))
 
     def extend(self, values: List[Any]) -> None:
         """Extend arguments list, all values will be added using auto type.
@@ -1035,102 +1833,189 @@ class OSCMessage(object):
     def build(self) -> OSCMessage:
         """Build OSCMessage datagram and return current instance.
 
+        Datagram is packed into a buffer of its exact size, immutable
+        copy of it is kept as `dgram`.
+
         Returns:
             an OSCMessage instance.
         Raises:
             OSCBuildError: if the message could not be build or if the address was empty.
         """
-        if not self._address:
-            raise OSCBuildError('OSC addresses cannot be empty')
-
-        dgram = b''
+        header, codec, values = self._plan()
 
         try:
-            # Write the address.
-            dgram += OSCType.string_pack(self._address)
-
-            if not self._args:
-                self._dgram = dgram
+            self._dgram = bytes(codec._pack_values(header, values)) if values else header
+        except OSCBuildError as be:
+            raise OSCBuildError('Could not build the message: {}'.format(be))
 
-                return self
+        self._source = None
 
-            # Write the parameters.
-            types = "".join([arg[0] for arg in self._args])
-            dgram += OSCType.string_pack(',' + types)
+        return self
 
-            for _type, value in self._args:
-                # if type in list use function to create datagram
-                if OSCType.has_datagram(_type):
-                    dgram += OSCType.type_pack(_type, value)
-                # process arg without datagram
-                elif OSCType.is_supported(_type):
-                    continue
-                # otherwise type not supported
-                else:
-                    raise OSCBuildError('Incorrect parameter type found {}'.format(_type))
+    def _write(self, buffer: bytearray) -> None:
+        """Append datagram of this message to buffer.
 
-            self._dgram = dgram
+        Raises:
+            OSCBuildError: if the message could not be build or if the address was empty.
+        """
+        header, codec, values = self._plan()
 
-            return self
+        try:
+            if values:
+                codec._pack_values(header, values, buffer)
+            else:
+                buffer += header
         except OSCBuildError as be:
             raise OSCBuildError('Could not build the message: {}'.format(be))
 
-    def _parse(self, dgram: bytes) -> None:
+    def _plan(self) -> Tuple[bytes, OSCCodec, List[Any]]:
+        """Return encoded address with type tags, codec and values of arguments.
+
+        Encoded address and type tags are kept until address or types change.
+
+        Raises:
+            OSCBuildError: if the address was empty.
+        """
+        if not self._address:
+            raise OSCBuildError('OSC addresses cannot be empty')
+
+        args = self._args
+        codec = OSCCodec.compile("".join([arg[0] for arg in args]))
+        prefix = self._prefix
+
+        if prefix is None or prefix[0] != self._address or prefix[1] is not codec:
+            prefix = self._prefix = (self._address, codec, OSCType.string_pack(self._address) + codec._tag_dgram)
+
+        return prefix[2], codec, [arg[1] for arg in args]
+
+    def _parse(self, dgram: bytes, start: int = 0, end: Optional[int] = None,
+               view: Optional[memoryview] = None, lazy: bool = False) -> None:
         """Parse datagram.
 
+        When message is a part of larger datagram only offsets are used for parsing,
+        datagram of message itself is created on first access to `dgram`.
+
         Args:
             dgram (bytes): datagram of OSCMessage
+            start (int): index where message starts in `dgram`
+            end (int): index where message ends in `dgram`
+            view (memoryview): view of whole `dgram`
+            lazy (bool): decode only address, arguments are decoded on first access
         """
-        self._dgram = dgram
+        if end is None:
+            end = len(dgram)
+
+        if start == 0 and end == len(dgram):
+            self._dgram = dgram
+        else:
+            self._dgram = None
+            self._source = (view or memoryview(dgram))[start:end]
 
         try:
-            self._address, index = OSCType.string_unpack(self._dgram, 0)
+            self._address, index = _string_unpack(dgram, start, end)
 
-            if not self._dgram[index:]:
+            if not self._address:
+                raise OSCParseError('OSC string cannot begin with a null byte', reason=OSCParseError.BAD_ADDRESS)
+
+            if index >= end:
                 # No params is legit, just return now.
                 return
 
-            # Get the parameters types.
-            typetag, index = OSCType.string_unpack(self._dgram, index)
-
-            if typetag.startswith(','):
-                typetag = typetag[1:]
-
-            # Parse each parameter given its type.
-            for _type in typetag:
-
-                if OSCType.has_datagram(_type):
-                    value, index = OSCType.type_unpack(_type, self._dgram, index)
-                elif _type == OSCType.TYPE_TRUE:
-                    value = True
-                elif _type == OSCType.TYPE_FALSE:
-                    value = False
-                elif _type == OSCType.TYPE_NULL:
-                    value = None
-                elif _type == OSCType.TYPE_IMPULSE:
-                    value = OSCImpulse()
-                else:
-                    logging.warning('Unhandled parameter type: {0}'.format(_type))
-                    continue
+            if lazy:
+                self._pending = (dgram, index, end)
+            else:
+                self._args = self._unpack_args(dgram, index, end)
+        except OSCParseError as pe:
+            raise OSCParseError('Found incorrect datagram, ignoring it', pe, reason=pe.reason)
+
+    def _decode(self) -> None:
+        """Decode arguments of lazily parsed message.
+
+        Raises:
+            OSCParseError if arguments could not be parsed
+        """
+        dgram, index, end = self._pending
 
-                self._args.append((_type, value))
+        try:
+            self._args = self._unpack_args(dgram, index, end)
         except OSCParseError as pe:
-            raise OSCParseError('Found incorrect datagram, ignoring it', pe)
+            raise OSCParseError('Found incorrect datagram, ignoring it', pe, reason=pe.reason)
+
+    @staticmethod
+    def _unpack_typetag(dgram: bytes, index: int, end: int) -> Tuple[str, int]:
+        """Read type tag string without leading comma."""
+        typetag, index = _string_unpack(dgram, index, end)
+
+        if not typetag:
+            raise OSCParseError('OSC string cannot begin with a null byte', reason=OSCParseError.BAD_TYPETAG)
+
+        if typetag.startswith(','):
+            typetag = typetag[1:]
+
+        return typetag, index
+
+    @classmethod
+    def _unpack_args(cls, dgram: bytes, index: int, end: int) -> List[Tuple[str, Any]]:
+        """Read type tags and arguments from datagram."""
+        # Get the parameters types.
+        typetag, index = cls._unpack_typetag(dgram, index, end)
+
+        # Parse all parameters at once using compiled type tags.
+        codec = OSCCodec.compile(typetag)
+        values, index = codec.unpack(dgram, index, end)
+
+        if codec.constant:
+            return [_CONSTANT_ARGS.get(tag) or (tag, value) for tag, value in zip(codec.arguments, values)]
+
+        return list(zip(codec.arguments, values))
 
     @staticmethod
-    def parse(dgram: bytes) -> OSCMessage:
+    def parse(dgram: bytes, lazy: bool = False) -> OSCMessage:
         """Create OSCMessage from datagram.
 
         Args:
             dgram (bytes): from what to build OSCMessage
+            lazy (bool): decode only address, arguments are decoded on first access
         Returns:
             OSCMessage parsed from datagram
         """
-        message = OSCMessage()
-        message._parse(dgram)
+        message = OSCMessage._acquire()
+        message._parse(_as_bytes(dgram), lazy=lazy)
+
+        return message
+
+    @staticmethod
+    def _acquire() -> OSCMessage:
+        """Return empty message from pool or new one, without validation of address."""
+        try:
+            message = OSCMessage._pool.pop()
+        except IndexError:
+            message = OSCMessage.__new__(OSCMessage)
+
+        message._address = '/'
+        message._arguments = []
+        message._pending = None
+        message._dgram = b''
+        message._source = None
+        message._prefix = None
 
         return message
 
+    def release(self) -> None:
+        """Return message into pool for reuse by `parse`.
+
+        Message must not be used after release. Nothing happens when
+        pool is full or disabled.
+        """
+        pool = OSCMessage._pool
+
+        if type(self) is OSCMessage and len(pool) < OSCMessage.pool_size:
+            self._arguments = []
+            self._pending = None
+            self._dgram = b''
+            self._source = None
+            pool.append(self)
+
     @staticmethod
     def is_valid(dgram: bytes) -> bool:
         """Check datagram to be valid OSCMessage.
@@ -1154,9 +2039,156 @@ class OSCMessage(object):
         return address == '/' or bool(re.compile(r"^/[a-zA-Z0-9/_\-?*\[\]]+").match(address))
 
 
+class OSCTemplate(object):
+    """Preallocated datagram of OSCMessage with mutable arguments.
+
+    Address and type tags are encoded once, arguments are overwritten
+    in place, for example `template[0] = 0.5`. Only messages with fixed
+    size arguments can be used as templates. Boolean arguments can be
+    changed between True and False as it only changes the type tag.
+    """
+
+    __slots__ = ['_address', '_types', '_buffer', '_codec', '_header', '_tags', '_slots']
+
+    def __init__(self, message: OSCMessage):
+        """Create template from message.
+
+        Args:
+            message (OSCMessage): message to take address, types and initial values from
+        Raises:
+            OSCBuildError if message has variable size arguments or could not be built
+        """
+        dgram = message.build().dgram
+        address_size = len(OSCType.string_pack(message.address))
+
+        self._address = message.address
+        self._types = message.typetag
+        self._codec = OSCCodec.compile(self._types)
+
+        if self._codec.fixed is None or OSCType.TYPE_ARRAY_BEGIN in self._types:
+            raise OSCBuildError('Template supports only fixed size arguments, got {}'.format(self._types))
+
+        self._buffer = bytearray(dgram)
+        self._tags = address_size + 1
+        self._header = len(dgram) - self._codec.fixed
+        self._slots: List[Tuple[int, Optional[struct.Struct], Optional[Callable], Optional[Callable]]] = []
+
+        offset = self._header
+
+        for _type in self._types:
+            if _type in OSCCodec._FORMATS:
+                packer = struct.Struct('>' + OSCCodec._FORMATS[_type])
+                self._slots.append((offset, packer, OSCCodec._PACKERS.get(_type), OSCCodec._UNPACKERS.get(_type)))
+                offset += packer.size
+            else:
+                self._slots.append((offset, None, None, None))
+
+    def __len__(self) -> int:
+        """Return number of arguments."""
+        return len(self._slots)
+
+    def __getitem__(self, key: int) -> Any:
+        """Read argument from datagram.
+
+        Args:
+            key (int): index of argument
+        """
+        offset, packer, _, unpacker = self._slots[key]
+
+        if packer is None:
+            tag = chr(self._buffer[self._tags + key])
+
+            return IMPULSE if tag == OSCType.TYPE_IMPULSE else OSCCodec._CONSTANTS[tag]
+
+        value = packer.unpack_from(self._buffer, offset)[0]
+
+        return unpacker(value) if unpacker else value
+
+    def __setitem__(self, key: int, value: Any) -> None:
+        """Write argument into datagram in place.
+
+        Args:
+            key (int): index of argument
+            value: new value of argument, must be of the same OSC type
+        Raises:
+            OSCBuildError if value can't be written
+        """
+        offset, packer, converter, _ = self._slots[key]
+
+        if packer is None:
+            tag = self._buffer[self._tags + key]
+
+            if isinstance(value, bool) and chr(tag) in (OSCType.TYPE_TRUE, OSCType.TYPE_FALSE):
+                self._buffer[self._tags + key] = ord(OSCType.TYPE_TRUE if value else OSCType.TYPE_FALSE)
+
+                return
+
+            raise OSCBuildError('Argument {} of type {} can not be changed'.format(key, chr(tag)))
+
+        try:
+            packer.pack_into(self._buffer, offset, converter(value) if converter else value)
+        except (struct.error, UnicodeEncodeError, AttributeError, TypeError) as e:
+            raise OSCBuildError('Wrong argument value passed: {}'.format(e))
+
+    @property
+    def address(self) -> str:
+        """Return OSC address of template."""
+        return self._address
+
+    @property
+    def buffer(self) -> bytearray:
+        """Return datagram buffer, it changes when arguments are set."""
+        return self._buffer
+
+    @property
+    def dgram(self) -> bytes:
+        """Return copy of current datagram."""
+        return bytes(self._buffer)
+
+    @property
+    def size(self) -> int:
+        """Return length of datagram."""
+        return len(self._buffer)
+
+    def update(self, values: List[Any]) -> None:
+        """Write all arguments at once.
+
+        Args:
+            values (list): values of all arguments
+        Raises:
+            OSCBuildError if values can't be written
+        """
+        if len(values) != len(self._slots):
+            raise OSCBuildError('Expected {} arguments, got {}'.format(len(self._slots), len(values)))
+
+        # arguments without datagram may change type tags
+        if len(self._codec._segments) != 1:
+            for key, value in enumerate(values):
+                self[key] = value
+
+            return
+
+        try:
+            self._codec._pack_into(self._buffer, self._header, values, None)
+        except (struct.error, UnicodeEncodeError, AttributeError, TypeError) as e:
+            raise OSCBuildError('Wrong argument value passed: {}'.format(e))
+
+    def message(self) -> OSCMessage:
+        """Return OSCMessage with current values of arguments."""
+        return OSCMessage.parse(bytes(self._buffer))
+
+
+# size of bundle element precedes the element, placeholder is appended
+# first and filled in once the element is written after it
+_SIZE_STRUCT = struct.Struct('>i')
+_SIZE_PLACEHOLDER = bytes(_INT_DGRAM_LEN)
+
+
 class OSCBundle(object):
     """Builds arbitrary OSCBundle instances."""
 
+    __slots__ = ['_timestamp', '_contents', '_dgram', '_source']
+
     _BUNDLE_PREFIX = b"#bundle\x00"
 
     def __init__(self, timestamp: float = IMMEDIATELY, messages: Optional[List[OSCMessage]] = None):
@@ -1169,7 +2201,8 @@ class OSCBundle(object):
         """
         self._timestamp = timestamp
         self._contents: List[Union[OSCMessage, OSCBundle]] = []
-        self._dgram = b''
+        self._dgram: Optional[bytes] = b''
+        self._source: Optional[memoryview] = None
 
         if messages and len(messages) > 0:
             for value in messages:
@@ -1248,23 +2281,38 @@ class OSCBundle(object):
     @property
     def size(self) -> int:
         """Return length of the datagram for this bundle."""
+        if self._dgram is None:
+            return self._source.nbytes
+
         return len(self._dgram)
 
     @property
     def dgram(self) -> bytes:
         """Return datagram from which this bundle was built."""
+        if self._dgram is None:
+            self._dgram = self._source.tobytes()
+            self._source = None
+
         return self._dgram
 
     def append(self, content: Union[OSCMessage, OSCBundle]) -> None:
         """Add a new content to this bundle.
 
+        Contents are encoded by `build`, so invalid arguments of messages
+        raise OSCBuildError there. Messages are added as they are, bundles
+        are copied, so a bundle can be added into itself.
+
         Args:
             content: Either an OSCBundle or an OSCMessage
         Raises:
             OSCBuildError: if we could not build the bundle.
         """
-        if isinstance(content, OSCMessage) or isinstance(content, OSCBundle):
-            self._contents.append(content.build())
+        if isinstance(content, OSCMessage):
+            self._contents.append(content)
+        elif isinstance(content, OSCBundle):
+            nested = OSCBundle(content._timestamp)
+            nested._contents = list(content._contents)
+            self._contents.append(nested)
         else:
             raise OSCBuildError("Content must be either "
                                 "OSCBundle or OSCMessage found {}".format(type(content)))
@@ -1275,29 +2323,68 @@ class OSCBundle(object):
         self.append(content)
 
     def build(self) -> OSCBundle:
-        """Build an OSCBundle with the current state of this builder.
+        """Build OSCBundle datagram and return current instance.
+
+        Whole bundle including nested bundles is written into one buffer,
+        sizes of contents are filled in after they are written. Contents
+        get views of their part of the datagram, as parsed contents do.
 
         Raises:
             OSCBuildError: if we could not build the bundle.
         """
-        dgram = b'' + self._BUNDLE_PREFIX
+        buffer = bytearray()
+        spans: List[Tuple[Union[OSCMessage, OSCBundle], int, int]] = []
 
         try:
-            dgram += OSCType.timetag_pack(self._timestamp)
-
-            for content in self._contents:
-                if isinstance(content, OSCMessage) or isinstance(content, OSCBundle):
-                    size = content.size
-                    dgram += OSCType.int_pack(size)
-                    dgram += content.dgram
-                else:
-                    raise OSCBuildError("Content must be either "
-                                        "OSCBundle or OSCMessage found {}".format(type(content)))
-
-            return OSCBundle.parse(dgram)
+            self._write(buffer, spans)
         except OSCBuildError as be:
             raise OSCBuildError('Could not build the bundle {}'.format(be))
 
+        self._dgram = bytes(buffer)
+        self._source = None
+
+        view = memoryview(self._dgram)
+
+        for content, start, end in spans:
+            content._dgram = None
+            content._source = view[start:end]
+
+        return self
+
+    def _write(self, buffer: bytearray,
+               spans: Optional[List[Tuple[Union[OSCMessage, OSCBundle], int, int]]] = None) -> None:
+        """Append datagram of this bundle to buffer.
+
+        Args:
+            buffer (bytearray): datagram to append to
+            spans (list): list to add (content, start, end) of written contents to
+        Raises:
+            OSCBuildError: if we could not build the bundle.
+        """
+        buffer += self._BUNDLE_PREFIX
+        buffer += OSCType.timetag_pack(self._timestamp)
+
+        for content in self._contents:
+            if not isinstance(content, (OSCMessage, OSCBundle)):
+                raise OSCBuildError("Content must be either "
+                                    "OSCBundle or OSCMessage found {}".format(type(content)))
+
+            # reserve size of content and fill it in when content is written
+            index = len(buffer)
+            buffer += _SIZE_PLACEHOLDER
+            # datagrams of read only contents are already set
+            frozen = isinstance(content, (_FrozenOSCMessage, _FrozenOSCBundle))
+
+            if isinstance(content, OSCBundle) and not frozen:
+                content._write(buffer, spans)
+            else:
+                content._write(buffer)
+
+            _SIZE_STRUCT.pack_into(buffer, index, len(buffer) - index - _INT_DGRAM_LEN)
+
+            if spans is not None and not frozen:
+                spans.append((content, index + _INT_DGRAM_LEN, len(buffer)))
+
     @classmethod
     def is_valid(cls, dgram: bytes) -> bool:
         """Return whether this datagram starts like an OSC bundle.
@@ -1310,42 +2397,71 @@ class OSCBundle(object):
         return dgram.startswith(cls._BUNDLE_PREFIX)
 
     @staticmethod
-    def parse(dgram: bytes) -> OSCBundle:
+    def parse(dgram: bytes, lazy: bool = False) -> OSCBundle:
         """Parse OSCBundle from datagram.
 
         Args:
             dgram: datagram of OSCBundle
+            lazy (bool): decode only addresses of messages, arguments are decoded on first access
         Returns:
             OSCBundle instance
         """
         bundle = OSCBundle()
-        bundle._parse(dgram)
+        bundle._parse(_as_bytes(dgram), lazy=lazy)
 
         return bundle
 
-    def _parse(self, dgram: bytes) -> None:
+    def _parse(self, dgram: bytes, start: int = 0, end: Optional[int] = None,
+               view: Optional[memoryview] = None, lazy: bool = False) -> None:
         """Parse datagram and fill contents of this OSCBundle.
 
+        Nested contents are parsed using offsets in the same datagram,
+        their own datagrams are created on first access to `dgram`.
+
         Args:
             dgram (bytes): datagram of OSCBundle
+            start (int): index where bundle starts in `dgram`
+            end (int): index where bundle ends in `dgram`
+            view (memoryview): view of whole `dgram`
+            lazy (bool): decode only addresses of messages
         """
+        if end is None:
+            end = len(dgram)
+
+        if view is None:
+            view = memoryview(dgram)
+
+        if start == 0 and end == len(dgram):
+            self._dgram = dgram
+        else:
+            self._dgram = None
+            self._source = view[start:end]
+
         # Interesting stuff starts after the initial b"#bundle\x00".
-        self._dgram = dgram
-        index = len(self._BUNDLE_PREFIX)
+        index = start + len(self._BUNDLE_PREFIX)
 
         try:
-            self._timestamp, index = OSCType.timetag_unpack(self._dgram, index)
+            if end - index < _TIMETAG_DGRAM_LEN:
+                raise OSCParseError('Datagram is too short', reason=OSCParseError.TRUNCATED)
+
+            self._timestamp, index = OSCType.timetag_unpack(dgram, index)
         except OSCParseError as pe:
-            raise OSCParseError("Could not get the date from the datagram: %s" % pe)
+            raise OSCParseError("Could not get the date from the datagram: %s" % pe, reason=pe.reason)
 
         # Get the contents as a list of OSCBundle and OSCMessage.
-        self._contents = self._parse_contents(index)
+        self._contents = self._parse_contents(dgram, index, end, view, lazy)
 
-    def _parse_contents(self, index: int) -> List[Union[OSCMessage, OSCBundle]]:
+    @classmethod
+    def _parse_contents(cls, dgram: bytes, index: int, end: int, view: memoryview,
+                        lazy: bool = False) -> List[Union[OSCMessage, OSCBundle]]:
         """Parse datagram into OSCBundle.
 
         Args:
+            dgram (bytes): datagram
             index (int): start index of next OSCMessage in bundle
+            end (int): index where bundle ends
+            view (memoryview): view of whole `dgram`
+            lazy (bool): decode only addresses of messages
         Raises:
             OSCParseError: if we could not parse the bundle.
         """
@@ -1356,174 +2472,2946 @@ class OSCBundle(object):
             # The size is an int32 representing the number of 8-bit bytes in the
             # contents, and will always be a multiple of 4. The contents are either
             # an OSC Message or an OSC Bundle.
-            while self._dgram[index:]:
+            while index < end:
                 # Get the sub content size.
-                content_size, index = OSCType.int_unpack(self._dgram, index)
-                # Get the datagram for the sub content.
-                content_dgram = self._dgram[index:index + content_size]
-                # Increment our position index up to the next possible content.
-                index += content_size
+                content_size = struct.unpack_from('>i', dgram, index)[0]
+                index += _INT_DGRAM_LEN
+                # Truncated contents are parsed up to the end of bundle.
+                content_end = min(index + content_size, end)
+
+                if content_size < 0:
+                    raise OSCParseError('Content size is negative', reason=OSCParseError.BAD_SIZE)
+
                 # Parse the content into an OSC message or bundle.
-                if OSCBundle.is_valid(content_dgram):
-                    contents.append(OSCBundle.parse(content_dgram))
-                elif OSCMessage.is_valid(content_dgram):
-                    contents.append(OSCMessage.parse(content_dgram))
+                if dgram.startswith(cls._BUNDLE_PREFIX, index, content_end):
+                    content = OSCBundle()
+                    content._parse(dgram, index, content_end, view, lazy)
+                    contents.append(content)
+                elif dgram.startswith(b'/', index, content_end):
+                    content = OSCMessage._acquire()
+                    content._parse(dgram, index, content_end, view, lazy)
+                    contents.append(content)
                 else:
                     logging.warning("Could not identify content type of dgram %s"
-                                    % str(content_dgram))
-        except (OSCParseError, IndexError) as e:
-            raise OSCParseError("Could not parse a content datagram: %s" % e)
+                                    % str(dgram[index:content_end]))
+
+                # Increment our position index up to the next possible content.
+                index = content_end
+        except OSCParseError as pe:
+            raise OSCParseError("Could not parse a content datagram: %s" % pe, reason=pe.reason)
+        except struct.error as e:
+            raise OSCParseError("Could not parse a content datagram: %s" % e, reason=OSCParseError.TRUNCATED)
 
         return contents
 
 
-class OSCClient(object):
-    """Send OSCMessage's and OSCBundle's to multiple servers."""
+def _read_only(self, *args, **kwargs) -> None:
+    """Raise TypeError, used for mutating methods of cached packets."""
+    raise TypeError('%s from parse cache is read only' % self.__class__.__bases__[0].__name__)
 
-    def __init__(self, address: str = '127.0.0.1', port: Optional[int] = False):
-        """Initialize the client.
 
-        Args:
-            address (str): recipient ip address
-            port (int): recipient port
-        """
-        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        self._socket.setblocking(False)
-        self._clients: List[Tuple[str, int]] = []
-        self._closed = False
+class _FrozenOSCMessage(OSCMessage):
+    """OSCMessage which can't be modified, shared by parse cache."""
 
-        if address and port:
-            self.add(address, port)
+    __slots__ = ()
 
-    def __len__(self):
-        """Return number of clients."""
-        return len(self._clients)
+    address = property(OSCMessage.address.fget, _read_only)
+    __setitem__ = __delitem__ = _read_only
+    append = add = extend = insert = remove = clear = _read_only
 
-    def __bool__(self):
-        """Return True if at least one client is available."""
-        return len(self) > 0
+    def _write(self, buffer: bytearray) -> None:
+        """Append datagram of this message to buffer, it can't be changed since parsing."""
+        buffer += self._source if self._dgram is None else self._dgram
 
-    @property
-    def clients(self) -> List[Tuple[str, int]]:
-        """Return list of receipts."""
-        return self._clients
 
-    def add(self, address: str, port: int) -> None:
-        """Add a recipient.
+class _FrozenOSCBundle(OSCBundle):
+    """OSCBundle which can't be modified, shared by parse cache."""
 
-        Args:
-            address (str): ip address of server
-            port (int): port of server
-        Raises:
-            ValueError if one of arguments is invalid
-        """
-        if not isinstance(address, str):
-            raise ValueError("Given address is not a string")
+    __slots__ = ()
 
-        if not isinstance(port, int) or port <= 0:
-            raise ValueError("Given port number is not int or invalid")
+    __setitem__ = __delitem__ = _read_only
+    append = add = _read_only
 
-        self._clients.append((address, port))
+    def build(self) -> OSCBundle:
+        """Return this bundle, its datagram can't be changed since parsing."""
+        return self
 
-    def remove(self, address: str, port: int) -> None:
-        """Remove a recipient.
+    def _write(self, buffer: bytearray) -> None:
+        """Append datagram of this bundle to buffer."""
+        buffer += self._source if self._dgram is None else self._dgram
 
-        Args:
-            address (str): ip address of server
-            port (int): port of server
-        """
-        for client in self._clients:
-            if client[0] == address and client[1] == port:
-                self._clients.remove(client)
 
-                break
+class OSCParseCache(object):
+    """Least recently used cache of parsed OSC packets keyed by datagram.
 
-    def clear(self) -> None:
-        """Clear list of receipts."""
-        self._clients = []
+    Repeated identical datagrams are parsed only once, cached messages
+    and bundles are fully decoded and read only, as they are shared by
+    everyone who receives the same datagram, so their OSC arrays are
+    tuples instead of lists. Bundles with a time tag other
+    than IMMEDIATELY and datagrams larger than `max_dgram_size` bypass
+    the cache.
+    """
 
-    def send(self, message: Union[OSCMessage, OSCBundle]) -> None:
-        """Send an OSCBundle or OSCMessage to the servers.
+    def __init__(self, max_size: int = 1024, max_dgram_size: int = 1024):
+        """Create cache.
 
         Args:
-            message (OSCMessage, OSCBundle): a OSCMessage or OSCBundle to send
+            max_size (int): max number of cached packets
+            max_dgram_size (int): larger datagrams are not cached
         """
-        if not (isinstance(message, OSCMessage) or isinstance(message, OSCBundle)):
-            raise ValueError("Given message is not a OSCMessage or OSCBundle")
+        self.max_size = max_size
+        self.max_dgram_size = max_dgram_size
 
-        # create new socket if previously closed
-        if self._closed:
-            self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            self._socket.setblocking(False)
-            self._closed = False
+        self._entries: collections.OrderedDict = collections.OrderedDict()
+        self._lock = threading.Lock()
 
-        dgram = message.build().dgram
+        self._hits = 0
+        self._misses = 0
+        self._bypassed = 0
 
-        for address in self._clients:
-            self._socket.sendto(dgram, address)
+    def __len__(self) -> int:
+        """Return number of cached packets."""
+        return len(self._entries)
 
-    def close(self) -> None:
-        """Close socket connection."""
-        if not self._closed:
-            self._socket.close()
-            self._closed = True
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Return number of hits, misses, bypassed datagrams and cached packets."""
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'bypassed': self._bypassed,
+            'size': len(self._entries)}
 
+    def clear(self) -> None:
+        """Remove all cached packets."""
+        with self._lock:
+            self._entries.clear()
 
-class _UDPRequestHandler(socketserver.BaseRequestHandler):
-    """Handles correct UDP messages for all types of server.
+    def parse(self, dgram: bytes, lazy: bool = False) -> Union[OSCMessage, OSCBundle]:
+        """Return cached packet or parse datagram.
 
-    Whether this will be run on its own thread, the server's or a whole new
-    process depends on the server you instantiated, look at their documentation.
+        Args:
+            dgram (bytes): datagram of OSC packet
+            lazy (bool): used only for datagrams which bypass the cache
+        Returns:
+            OSCMessage or OSCBundle, read only if it came from cache
+        Raises:
+            OSCParseError if the datagram could not be parsed
+        """
+        dgram = _as_bytes(dgram)
+        is_bundle = OSCBundle.is_valid(dgram)
+
+        if len(dgram) > self.max_dgram_size or \
+                (is_bundle and dgram[8:8 + _TIMETAG_DGRAM_LEN] != NTP_IMMEDIATELY):
+            with self._lock:
+                self._bypassed += 1
+
+            return OSCBundle.parse(dgram, lazy) if is_bundle else OSCMessage.parse(dgram, lazy)
+
+        with self._lock:
+            packet = self._entries.get(dgram)
+
+            if packet is not None:
+                self._entries.move_to_end(dgram)
+                self._hits += 1
+
+                return packet
+
+        packet = OSCBundle.parse(dgram) if is_bundle else OSCMessage.parse(dgram)
+        self._freeze(packet)
+
+        with self._lock:
+            self._misses += 1
+            self._entries[dgram] = packet
+
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+        return packet
+
+    @classmethod
+    def _freeze(cls, packet: Union[OSCMessage, OSCBundle]) -> None:
+        """Make parsed message or bundle with all its contents read only."""
+        if isinstance(packet, OSCBundle):
+            packet.__class__ = _FrozenOSCBundle
+
+            for content in packet:
+                cls._freeze(content)
+        else:
+            packet.__class__ = _FrozenOSCMessage
+            args = packet._args
+
+            if any(isinstance(arg[1], list) for arg in args):
+                packet._args = [(arg[0], cls._freeze_value(arg[1])) for arg in args]
+
+    @classmethod
+    def _freeze_value(cls, value: Any) -> Any:
+        """Return OSC array and its nested arrays as tuples."""
+        if isinstance(value, list):
+            return tuple(cls._freeze_value(item) for item in value)
+
+        return value
+
+
+class OSCMetrics(object):
+    """Counters and timers of OSC traffic.
+
+    Packets and bytes are counted per peer, parse failures by reason and
+    handler time in power of two buckets of nanoseconds. Every record call
+    takes one lock, `snapshot` returns a copy which is safe to use from
+    any thread.
+    """
+
+    # peers above this limit are counted together under ('*', 0)
+    max_peers = 1024
+
+    def __init__(self):
+        """Create empty metrics."""
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset all counters."""
+        with self._lock:
+            self._received: Dict[Tuple[str, int], List[int]] = {}
+            self._sent: Dict[Tuple[str, int], List[int]] = {}
+            self._send_errors: Dict[Tuple[str, int], int] = {}
+            self._parse_errors: Dict[str, int] = {}
+            self._handler_buckets = [0] * 64
+            self._handler_count = 0
+            self._handler_total = 0
+            self._handler_max = 0
+            self._started = time.time()
+
+    def received(self, peer: Tuple[str, int], size: int) -> None:
+        """Count received packet.
+
+        Args:
+            peer: tuple (host, port) of sender
+            size (int): size of packet in bytes
+        """
+        with self._lock:
+            counter = self._counter(self._received, peer)
+            counter[0] += 1
+            counter[1] += size
+
+    def sent(self, peer: Tuple[str, int], packets: int, size: int) -> None:
+        """Count sent packets.
+
+        Args:
+            peer: tuple (host, port) of recipient
+            packets (int): number of packets
+            size (int): size of all packets in bytes
+        """
+        with self._lock:
+            counter = self._counter(self._sent, peer)
+            counter[0] += packets
+            counter[1] += size
+
+    def send_failed(self, peer: Tuple[str, int]) -> None:
+        """Count packet which could not be sent.
+
+        Args:
+            peer: tuple (host, port) of recipient
+        """
+        with self._lock:
+            self._send_errors[peer] = self._send_errors.get(peer, 0) + 1
+
+    def parse_failed(self, reason: str) -> None:
+        """Count packet which could not be parsed.
+
+        Args:
+            reason (str): short name of failure
+        """
+        with self._lock:
+            self._parse_errors[reason] = self._parse_errors.get(reason, 0) + 1
+
+    def handled(self, duration: int) -> None:
+        """Record time spent in handler.
+
+        Args:
+            duration (int): nanoseconds
+        """
+        with self._lock:
+            self._handled(duration)
+
+    def processed(self, peer: Tuple[str, int], size: int, duration: int) -> None:
+        """Count received packet and record time spent in its handler at once.
+
+        Args:
+            peer: tuple (host, port) of sender
+            size (int): size of packet in bytes
+            duration (int): nanoseconds
+        """
+        with self._lock:
+            counter = self._counter(self._received, peer)
+            counter[0] += 1
+            counter[1] += size
+            self._handled(duration)
+
+    def _handled(self, duration: int) -> None:
+        """Add handler time to histogram, lock must be held."""
+        self._handler_buckets[min(63, duration.bit_length())] += 1
+        self._handler_count += 1
+        self._handler_total += duration
+
+        if duration > self._handler_max:
+            self._handler_max = duration
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return copy of all counters.
+
+        Returns:
+            dict with totals, per peer counters, parse errors by reason
+            and handler time histogram keyed by upper bound in nanoseconds
+        """
+        with self._lock:
+            received = {peer: tuple(counter) for peer, counter in self._received.items()}
+            sent = {peer: tuple(counter) for peer, counter in self._sent.items()}
+            send_errors = dict(self._send_errors)
+            parse_errors = dict(self._parse_errors)
+            buckets = list(self._handler_buckets)
+            count, total, maximum = self._handler_count, self._handler_total, self._handler_max
+            started = self._started
+
+        return {
+            'uptime': time.time() - started,
+            'received_packets': sum(counter[0] for counter in received.values()),
+            'received_bytes': sum(counter[1] for counter in received.values()),
+            'sent_packets': sum(counter[0] for counter in sent.values()),
+            'sent_bytes': sum(counter[1] for counter in sent.values()),
+            'received': received,
+            'sent': sent,
+            'send_errors': send_errors,
+            'parse_errors': parse_errors,
+            'handler': {
+                'count': count,
+                'mean_ns': total // count if count else 0,
+                'max_ns': maximum,
+                'histogram': {1 << index: value for index, value in enumerate(buckets) if value}}}
+
+    def bundle(self, prefix: str = '/grailkit/stats', extra: Optional[Dict[str, float]] = None) -> OSCBundle:
+        """Represent current counters as OSC messages.
+
+        Args:
+            prefix (str): address prefix of messages
+            extra (dict): additional values sent as `prefix/<name>` messages
+        Returns:
+            OSCBundle with one message per counter
+        """
+        stats = self.snapshot()
+        int64 = OSCType.TYPE_INT64
+        bundle = OSCBundle()
+
+        for name in ('received', 'sent'):
+            message = OSCMessage('%s/%s' % (prefix, name))
+            message.add(stats[name + '_packets'], int64)
+            message.add(stats[name + '_bytes'], int64)
+            bundle.add(message)
+
+            for (host, port), (packets, size) in stats[name].items():
+                message = OSCMessage('%s/%s/peer' % (prefix, name), [str(host), int(port)])
+                message.add(packets, int64)
+                message.add(size, int64)
+                bundle.add(message)
+
+        for reason, count in stats['parse_errors'].items():
+            message = OSCMessage('%s/parse_errors' % prefix, [reason])
+            message.add(count, int64)
+            bundle.add(message)
+
+        message = OSCMessage('%s/send_errors' % prefix)
+        message.add(sum(stats['send_errors'].values()), int64)
+        bundle.add(message)
+
+        handler = stats['handler']
+        message = OSCMessage('%s/handler' % prefix)
+        message.add(handler['count'], int64)
+        message.add(handler['mean_ns'], int64)
+        message.add(handler['max_ns'], int64)
+        bundle.add(message)
+
+        for name, value in (extra or {}).items():
+            bundle.add(OSCMessage('%s/%s' % (prefix, name), [float(value)]))
+
+        return bundle
+
+    def _counter(self, counters: Dict[Tuple[str, int], List[int]], peer: Tuple[str, int]) -> List[int]:
+        """Return counter of peer, lock must be held by caller."""
+        counter = counters.get(peer)
+
+        if counter is None:
+            if len(counters) >= self.max_peers:
+                peer = ('*', 0)
+                counter = counters.get(peer)
+
+            if counter is None:
+                counter = counters[peer] = [0, 0]
+
+        return counter
+
+
+def _shift_timetags(dgram: bytes, offset: int) -> bytes:
+    """Return bundle datagram with time tags moved by `offset` nanoseconds.
+
+    Time tags of nested bundles are moved too, IMMEDIATELY is kept.
+    """
+    buffer = bytearray(dgram)
+    _shift_bundle(buffer, 0, len(buffer), offset * _NTP_FRACTION // 1000000000)
+
+    return bytes(buffer)
+
+
+def _shift_bundle(buffer: bytearray, start: int, end: int, shift: int) -> None:
+    """Move time tag of bundle at `start` and of its nested bundles by `shift` NTP units."""
+    index = start + len(OSCBundle._BUNDLE_PREFIX)
+
+    if end - index < _TIMETAG_DGRAM_LEN:
+        return
+
+    timetag = _NTP_STRUCT.unpack_from(buffer, index)[0]
+
+    if timetag != 1:
+        _NTP_STRUCT.pack_into(buffer, index, min(max(timetag + shift, 0), _NTP_LIMIT - 1))
+
+    index += _TIMETAG_DGRAM_LEN
+
+    while index + _INT_DGRAM_LEN <= end:
+        size = _SIZE_STRUCT.unpack_from(buffer, index)[0]
+        index += _INT_DGRAM_LEN
+
+        if size < 0 or index + size > end:
+            break
+
+        if buffer.startswith(OSCBundle._BUNDLE_PREFIX, index):
+            _shift_bundle(buffer, index, index + size, shift)
+
+        index += size
+
+
+class OSCClockSync(object):
+    """Estimate clock offset and round trip delay of peers.
+
+    Client sends ping with its send time, server replies with pong holding
+    its receive and send time, as in NTP. Every exchange gives a sample
+    of offset and delay, estimate of peer is the sample with the smallest
+    delay among the last `samples`, as it's least affected by queuing.
+
+    Offset is peer clock minus local clock in nanoseconds.
+    """
+
+    ADDRESS = '/grailkit/clock'
+
+    # ping: send time, estimated offset and delay of server or -1
+    # pong: ping send time, receive time and send time
+    _CODEC = 'hhh'
+
+    def __init__(self, samples: int = 8):
+        """Create empty estimates.
+
+        Args:
+            samples (int): number of last samples kept per peer
+        """
+        self.samples = samples
+        self._peers: Dict[Tuple[str, int], Deque[Tuple[int, int]]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return number of peers with estimate."""
+        return len(self._peers)
+
+    @property
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Return estimated offset, delay and number of samples by 'host:port' of peer."""
+        with self._lock:
+            peers = {peer: (min(samples), len(samples)) for peer, samples in self._peers.items()}
+
+        return {'%s:%d' % peer: {'offset_ns': offset, 'delay_ns': delay, 'samples': count}
+                for peer, ((delay, offset), count) in peers.items()}
+
+    def add_sample(self, peer: Tuple[str, int], t0: int, t1: int, t2: int, t3: int) -> Tuple[int, int]:
+        """Add result of ping exchange, all times are in nanoseconds since the epoch.
+
+        Args:
+            peer: tuple (host, port) of peer
+            t0 (int): local time when ping was sent
+            t1 (int): peer time when ping was received
+            t2 (int): peer time when pong was sent
+            t3 (int): local time when pong was received
+        Returns:
+            tuple of offset and delay of this sample
+        """
+        offset = ((t1 - t0) + (t2 - t3)) // 2
+        delay = max((t3 - t0) - (t2 - t1), 0)
+        self.update(peer, offset, delay)
+
+        return offset, delay
+
+    def update(self, peer: Tuple[str, int], offset: int, delay: int) -> None:
+        """Add sample of offset and delay of peer measured elsewhere.
+
+        Args:
+            peer: tuple (host, port) of peer
+            offset (int): peer clock minus local clock in nanoseconds
+            delay (int): round trip delay in nanoseconds
+        """
+        with self._lock:
+            samples = self._peers.get(peer)
+
+            if samples is None:
+                samples = self._peers[peer] = collections.deque(maxlen=self.samples)
+
+            samples.append((delay, offset))
+
+    def estimate(self, peer: Tuple[str, int]) -> Optional[Tuple[int, int]]:
+        """Return estimated offset and delay of peer.
+
+        Args:
+            peer: tuple (host, port) of peer
+        Returns:
+            tuple of offset and delay in nanoseconds or None if peer was never measured
+        """
+        samples = self._peers.get(peer)
+
+        if not samples:
+            return None
+
+        delay, offset = min(tuple(samples))
+
+        return offset, delay
+
+    def offset(self, peer: Tuple[str, int]) -> int:
+        """Return estimated offset of peer in nanoseconds, 0 if it was never measured."""
+        estimate = self.estimate(peer)
+
+        return estimate[0] if estimate else 0
+
+    def to_peer(self, peer: Tuple[str, int], timestamp: float) -> float:
+        """Convert local time in seconds since the epoch to time of peer clock.
+
+        IMMEDIATELY is returned unchanged.
+        """
+        if timestamp == IMMEDIATELY:
+            return timestamp
+
+        return timestamp + self.offset(peer) / 1e9
+
+    def from_peer(self, peer: Tuple[str, int], timestamp: float) -> float:
+        """Convert time of peer clock in seconds since the epoch to local time.
+
+        IMMEDIATELY is returned unchanged.
+        """
+        if timestamp == IMMEDIATELY:
+            return timestamp
+
+        return timestamp - self.offset(peer) / 1e9
+
+    def forget(self, peer: Tuple[str, int]) -> None:
+        """Remove samples of peer."""
+        with self._lock:
+            self._peers.pop(peer, None)
+
+    def ping(self, address: str, t0: int, peer: Tuple[str, int]) -> bytes:
+        """Return datagram of ping message sent at `t0` to peer.
+
+        Ping carries current estimate of peer, so it learns offset of sender.
+        """
+        estimate = self.estimate(peer)
+        offset, delay = estimate if estimate else (0, -1)
+
+        return OSCCodec.compile(self._CODEC).pack(address, [t0, -offset, delay])
+
+    def pong(self, address: str, data: bytes, peer: Tuple[str, int], t1: int) -> Optional[bytes]:
+        """Return datagram of pong in reply to ping received at `t1`.
+
+        Estimate of sender carried by ping is added to samples of peer.
+
+        Returns:
+            datagram or None if ping is malformed
+        """
+        values = self.unpack(data)
+
+        if values is None:
+            return None
+
+        t0, offset, delay = values
+
+        if delay >= 0:
+            self.update(peer, offset, delay)
+
+        return OSCCodec.compile(self._CODEC).pack(address + '/pong', [t0, t1, time.time_ns()])
+
+    @staticmethod
+    def unpack(data: bytes, address: Optional[str] = None) -> Optional[List[int]]:
+        """Return three integer arguments of ping or pong.
+
+        Args:
+            data (bytes): datagram of message
+            address (str): expected address of message, not checked if None
+        Returns:
+            list of times or None if message is malformed
+        """
+        try:
+            message = OSCMessage.parse(data)
+            values = message.args
+        except OSCParseError:
+            return None
+
+        if address is not None and message.address != address:
+            return None
+
+        if len(values) != 3 or any(type(value) is not int for value in values):
+            return None
+
+        return values
+
+
+class _OSCRecipients(object):
+    """List of recipients shared by OSC clients.
+
+    Recipients are kept in a tuple which is replaced on every change,
+    so senders read it without locking while other threads add or
+    remove recipients.
+    """
+
+    def __init__(self):
+        """Create empty list of recipients."""
+        self._clients: Tuple[Tuple[str, int], ...] = ()
+        self._clients_lock = threading.Lock()
+
+    def __len__(self):
+        """Return number of clients."""
+        return len(self._clients)
+
+    def __bool__(self):
+        """Return True if at least one client is available."""
+        return len(self) > 0
+
+    @property
+    def clients(self) -> List[Tuple[str, int]]:
+        """Return list of receipts."""
+        return list(self._clients)
+
+    def add(self, address: str, port: int) -> None:
+        """Add a recipient.
+
+        Args:
+            address (str): ip address of server
+            port (int): port of server
+        Raises:
+            ValueError if one of arguments is invalid
+        """
+        if not isinstance(address, str):
+            raise ValueError("Given address is not a string")
+
+        if not isinstance(port, int) or port <= 0:
+            raise ValueError("Given port number is not int or invalid")
+
+        with self._clients_lock:
+            self._clients = self._clients + ((address, port),)
+
+    def remove(self, address: str, port: int) -> None:
+        """Remove a recipient.
+
+        Args:
+            address (str): ip address of server
+            port (int): port of server
+        """
+        with self._clients_lock:
+            clients = list(self._clients)
+
+            for client in clients:
+                if client[0] == address and client[1] == port:
+                    clients.remove(client)
+                    self._clients = tuple(clients)
+
+                    break
+
+    def clear(self) -> None:
+        """Clear list of receipts."""
+        with self._clients_lock:
+            self._clients = ()
+
+
+class OSCClient(_OSCRecipients):
+    """Send OSCMessage's and OSCBundle's to multiple servers.
+
+    Messages can be sent one by one with `send` or queued with `queue`
+    and sent to all recipients at once with `flush`. When socket buffer
+    is full, send is retried once the socket is writable again, or within
+    `retry_timeout` seconds, after that the datagram is counted as dropped.
+
+    With bundling enabled messages passed to `send` are collected during
+    a time window and sent as one OSCBundle, bundle is sent earlier when
+    the next message would make it larger than `max_size` bytes.
+
+    With coalescing enabled only the newest message per address within
+    a tick is sent, see OSCCoalescer.
+
+    Recipient can be a multicast group or a broadcast address, one
+    datagram then reaches every server listening on it. Use `set_multicast`
+    to choose time to live, loopback and outgoing interface of group sends
+    and `set_broadcast` to allow sending to broadcast addresses.
+
+    With sender thread enabled `send` only appends message to a queue,
+    messages are encoded and sent in batches by the sender thread. Any
+    number of threads may send and change recipients at the same time.
+
+    `sync_clock` estimates clock offset of every recipient which is
+    OSCServer with `clock_address`. With `translate_timetags` set time
+    tags of bundles are converted to clock of each recipient.
+    """
+
+    # seconds to wait for a blocked socket before dropping datagram
+    retry_timeout = 0.01
+
+    # max size of datagram read by `sync_clock`
+    max_pong_size = 1024
+
+    def __init__(self, address: str = '127.0.0.1', port: Optional[int] = False):
+        """Initialize the client.
+
+        Args:
+            address (str): recipient ip address
+            port (int): recipient port
+        """
+        super(OSCClient, self).__init__()
+
+        self._options: Dict[Tuple[int, int], Union[int, bytes]] = {}
+        self._socket = self._create_socket()
+        self._closed = False
+        self._queue: Deque[bytes] = collections.deque()
+        self._dropped = 0
+        self._errors = 0
+        self.metrics = OSCMetrics()
+
+        self._bundle: List[bytes] = []
+        self._bundle_size = 0
+        self._bundle_window: Optional[float] = None
+        self._bundle_max_size = _UDP_SAFE_SIZE
+        self._bundle_timestamp = IMMEDIATELY
+        self._bundle_deadline: Optional[float] = None
+        self._bundle_flusher: Optional[threading.Thread] = None
+        self._bundle_condition = threading.Condition()
+        self._coalescer: Optional[OSCCoalescer] = None
+
+        self._sender: Optional[threading.Thread] = None
+        self._outbox: Deque[Union[OSCMessage, OSCBundle, OSCTemplate]] = collections.deque()
+        self._outbox_size = 0
+        self._outbox_wake = threading.Event()
+        # guards outbox against sender shutdown and counters updated by many threads
+        self._outbox_lock = threading.Lock()
+
+        self.clock = OSCClockSync()
+        # convert time tags of sent bundles to clock of recipient
+        self.translate_timetags = False
+
+        if address and port:
+            self.add(address, port)
+
+    @property
+    def dropped(self) -> int:
+        """Return number of datagrams dropped because socket was blocked."""
+        return self._dropped
+
+    @property
+    def errors(self) -> int:
+        """Return number of datagrams not sent because of socket errors."""
+        return self._errors
+
+    @property
+    def pending(self) -> int:
+        """Return number of queued datagrams."""
+        return len(self._queue)
+
+    def sync_clock(self, rounds: int = 8, timeout: float = 0.2, address: str = OSCClockSync.ADDRESS) -> int:
+        """Estimate clock offset of recipients by exchanging ping messages.
+
+        Blocks for at most `rounds` * `timeout` seconds. Pongs are read from
+        the socket of client, so recipient must reply from its own address
+        to the sender address, pongs from other addresses are ignored.
+
+        Args:
+            rounds (int): number of pings sent to every recipient
+            timeout (float): max seconds to wait for pongs of one round
+            address (str): clock address of servers
+        Returns:
+            number of recipients with estimated offset
+        Raises:
+            ValueError if client is closed
+        """
+        if self._closed:
+            raise ValueError("Could not sync clock of closed client")
+
+        pong = address + '/pong'
+        clients = self._clients
+        peers: Dict[Tuple[str, int], Tuple[str, int]] = {}
+
+        # pongs come from numeric address of recipient
+        for peer in clients:
+            try:
+                peers[peer] = socket.getaddrinfo(peer[0], peer[1], socket.AF_INET, socket.SOCK_DGRAM)[0][4][:2]
+            except OSError as e:
+                logging.warning("Could not resolve OSC clock peer %s: %s" % (str(peer), e))
+
+        for _ in range(rounds):
+            # keyed by address and send time, so equal send times of peers don't collide
+            pending: Dict[Tuple[Tuple[str, int], int], Tuple[str, int]] = {}
+
+            for peer, resolved in peers.items():
+                t0 = time.time_ns()
+
+                try:
+                    self._socket.sendto(self.clock.ping(address, t0, peer), peer)
+                except OSError as e:
+                    logging.warning("Could not send OSC clock ping to %s: %s" % (str(peer), e))
+
+                    continue
+
+                pending[(resolved, t0)] = peer
+
+            deadline = time.monotonic() + timeout
+
+            while pending:
+                remaining = deadline - time.monotonic()
+
+                if remaining <= 0 or not select.select([self._socket], [], [], remaining)[0]:
+                    break
+
+                try:
+                    data, sender = self._socket.recvfrom(self.max_pong_size)
+                except (BlockingIOError, InterruptedError):
+                    continue
+                except OSError:
+                    break
+
+                t3 = time.time_ns()
+                values = self.clock.unpack(data, pong)
+
+                if values is None:
+                    continue
+
+                t0, t1, t2 = values
+                peer = pending.pop((sender[:2], t0), None)
+
+                if peer is not None:
+                    self.clock.add_sample(peer, t0, t1, t2, t3)
+
+        return sum(1 for peer in clients if self.clock.estimate(peer) is not None)
+
+    def set_multicast(self, ttl: int = 1, loopback: bool = True, interface: Optional[str] = None) -> None:
+        """Set options of datagrams sent to multicast groups.
+
+        Args:
+            ttl (int): number of routers datagram may pass, 1 keeps it in local network
+            loopback (bool): deliver datagrams to servers on this host too
+            interface (str): ip address of outgoing interface, chosen by routing table if None
+        Raises:
+            OSError if options could not be set
+        """
+        self._set_option(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, ttl)
+        self._set_option(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, int(loopback))
+        self._set_option(socket.IPPROTO_IP, socket.IP_MULTICAST_IF,
+                         socket.inet_aton(interface or '0.0.0.0'))
+
+    def set_broadcast(self, enabled: bool = True) -> None:
+        """Allow sending datagrams to broadcast addresses, like 255.255.255.255.
+
+        Args:
+            enabled (bool): whether broadcast is allowed
+        Raises:
+            OSError if option could not be set
+        """
+        self._set_option(socket.SOL_SOCKET, socket.SO_BROADCAST, int(enabled))
+
+    def _set_option(self, level: int, option: int, value: Union[int, bytes]) -> None:
+        """Set socket option and keep it for sockets created after `close`."""
+        if not self._closed:
+            self._socket.setsockopt(level, option, value)
+
+        self._options[(level, option)] = value
+
+    def _create_socket(self) -> socket.socket:
+        """Create non blocking UDP socket with options set by user."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setblocking(False)
+
+        for (level, option), value in self._options.items():
+            sock.setsockopt(level, option, value)
+
+        return sock
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return metrics of client together with dropped and queued datagrams."""
+        stats = self.metrics.snapshot()
+        stats['dropped'] = self._dropped
+        stats['errors'] = self._errors
+        stats['pending'] = len(self._queue)
+        stats['outbox'] = len(self._outbox)
+
+        return stats
+
+    def send(self, message: Union[OSCMessage, OSCBundle, OSCTemplate]) -> None:
+        """Send an OSCBundle or OSCMessage to the servers.
+
+        Buffer of OSCTemplate is sent as is, without building a new datagram.
+        With sender thread enabled message is only queued, so it must not be
+        changed after this call.
+
+        Args:
+            message (OSCMessage, OSCBundle, OSCTemplate): a message to send
+        """
+        if self._sender is None or not self._enqueue(message):
+            self._send_now(message)
+
+    def enable_sender_thread(self, max_size: int = 65536) -> None:
+        """Encode and send messages passed to `send` in a separate thread.
+
+        Args:
+            max_size (int): max number of queued messages, newer messages are dropped
+        """
+        self.disable_sender_thread()
+
+        with self._outbox_lock:
+            self._outbox = collections.deque()
+            self._outbox_size = max_size
+            self._outbox_wake = threading.Event()
+            self._sender = threading.Thread(target=self._run_sender, name='OSCClient sender', daemon=True)
+            self._sender.start()
+
+    def disable_sender_thread(self, timeout: Optional[float] = None) -> None:
+        """Send queued messages and stop sender thread.
+
+        Args:
+            timeout (float): max seconds to wait for sender thread
+        """
+        # nothing is queued after sender is cleared, so its last drain sends everything
+        with self._outbox_lock:
+            sender = self._sender
+            self._sender = None
+
+        if sender is None:
+            return
+
+        self._outbox_wake.set()
+        sender.join(timeout)
+
+    def _enqueue(self, message: Union[OSCMessage, OSCBundle, OSCTemplate]) -> bool:
+        """Add message to queue of sender thread.
+
+        Returns:
+            False if sender thread is stopped and message must be sent by caller
+        """
+        with self._outbox_lock:
+            if self._sender is None:
+                return False
+
+            if len(self._outbox) >= self._outbox_size:
+                self._dropped += 1
+
+                return True
+
+            self._outbox.append(message)
+
+        if not self._outbox_wake.is_set():
+            self._outbox_wake.set()
+
+        return True
+
+    def _drain_outbox(self) -> List[Union[OSCMessage, OSCBundle, OSCTemplate]]:
+        """Remove and return all queued messages."""
+        outbox = self._outbox
+        messages = []
+
+        while outbox:
+            messages.append(outbox.popleft())
+
+        return messages
+
+    def _run_sender(self) -> None:
+        """Send queued messages until sender thread is disabled."""
+        wake = self._outbox_wake
+        current = threading.current_thread()
+
+        while True:
+            wake.wait()
+            wake.clear()
+            running = self._sender is current
+            messages = self._drain_outbox()
+
+            if messages:
+                self._send_batch(messages)
+
+            if not running:
+                break
+
+    def _send_batch(self, messages: List[Union[OSCMessage, OSCBundle, OSCTemplate]]) -> None:
+        """Encode messages and send them, all datagrams at once when possible."""
+        batch = self._coalescer is None and self._bundle_window is None
+        dgrams = []
+
+        # any error of one message must not stop sender thread
+        for message in messages:
+            try:
+                if batch:
+                    dgrams.append(self._build(message))
+                else:
+                    self._send_now(message)
+            except Exception as e:
+                with self._outbox_lock:
+                    self._errors += 1
+
+                logging.warning("Could not send OSC message: %s" % e)
+
+        if dgrams:
+            try:
+                self._deliver(dgrams)
+            except Exception as e:
+                with self._outbox_lock:
+                    self._errors += len(dgrams)
+
+                logging.warning("Could not send OSC messages: %s" % e)
+
+    def _send_now(self, message: Union[OSCMessage, OSCBundle, OSCTemplate]) -> None:
+        """Send message in calling thread."""
+        if self._coalescer is not None:
+            if isinstance(message, OSCBundle):
+                self._coalescer.pass_through(self._build(message))
+            else:
+                self._coalescer.put(message, self._build(message))
+        elif isinstance(message, OSCTemplate) and self._bundle_window is None:
+            self._deliver((message.buffer,))
+        else:
+            self._send_dgram(self._build(message))
+
+    def enable_coalescing(self, interval: float = 0.01, arguments: Iterable[int] = ()) -> None:
+        """Send only the newest message per address within every `interval`.
+
+        Args:
+            interval (float): length of tick in seconds
+            arguments (list): indexes of message arguments which are part of key
+        Raises:
+            ValueError if interval is not positive
+        """
+        self.disable_coalescing()
+        self._coalescer = OSCCoalescer(self._send_dgram, interval, arguments)
+
+    def disable_coalescing(self) -> None:
+        """Send pending messages and stop coalescing."""
+        if self._coalescer is not None:
+            self._coalescer.close()
+            self._coalescer = None
+
+    def enable_bundling(self, window: float = 0.002, max_size: int = _UDP_SAFE_SIZE,
+                        timestamp: float = IMMEDIATELY) -> None:
+        """Collect messages passed to `send` into bundles.
+
+        Args:
+            window (float): max seconds a message waits in bundle
+            max_size (int): max size of bundle datagram in bytes
+            timestamp (float): time tag of bundles
+        """
+        with self._bundle_condition:
+            self._send_bundle()
+            self._bundle_window = window
+            self._bundle_max_size = max_size
+            self._bundle_timestamp = timestamp
+
+    def disable_bundling(self) -> None:
+        """Send pending bundle and send messages one by one."""
+        # senders check window again under the lock, so nothing is added after flush
+        with self._bundle_condition:
+            self._send_bundle()
+            self._bundle_window = None
+
+        self._stop_bundle_flusher()
+
+    def flush_bundle(self) -> None:
+        """Send pending bundle now."""
+        with self._bundle_condition:
+            self._send_bundle()
+
+    def _send_dgram(self, dgram: bytes) -> None:
+        """Send datagram right away or add it to pending bundle."""
+        if self._bundle_window is None:
+            self._deliver((dgram,))
+        elif dgram.startswith(OSCBundle._BUNDLE_PREFIX):
+            with self._bundle_condition:
+                self._send_bundle()
+                self._deliver((dgram,))
+        else:
+            self._bundle_add(dgram)
+
+    def queue(self, message: Union[OSCMessage, OSCBundle, OSCTemplate]) -> None:
+        """Build an OSCBundle or OSCMessage and queue it until `flush` is called.
+
+        Args:
+            message (OSCMessage, OSCBundle, OSCTemplate): a message to send
+        """
+        self._queue.append(self._build(message))
+
+    def send_many(self, messages: Iterable[Union[OSCMessage, OSCBundle]]) -> int:
+        """Send many messages to the servers, each message is built only once.
+
+        Args:
+            messages (list): OSCMessage's or OSCBundle's to send
+        Returns:
+            number of datagrams sent, 0 with sender thread enabled as messages are only queued
+        """
+        if self._sender is not None:
+            for message in messages:
+                if not self._enqueue(message):
+                    self._send_now(message)
+
+            return 0
+
+        if self._bundle_window is not None or self._coalescer is not None:
+            for message in messages:
+                self.send(message)
+
+            if self._coalescer is not None:
+                self._coalescer.flush()
+
+            self.flush_bundle()
+
+            return self.flush()
+
+        for message in messages:
+            self.queue(message)
+
+        return self.flush()
+
+    def flush(self) -> int:
+        """Send all queued datagrams to every recipient.
+
+        Returns:
+            number of datagrams sent
+        """
+        queue = self._queue
+        dgrams = []
+
+        while queue:
+            dgrams.append(queue.popleft())
+
+        return self._deliver(dgrams)
+
+    def close(self) -> None:
+        """Send pending messages and bundle and close socket connection."""
+        self.disable_sender_thread()
+
+        if not self._closed:
+            self.disable_coalescing()
+            self.flush_bundle()
+            self._stop_bundle_flusher()
+            self._socket.close()
+            self._closed = True
+
+    def _bundle_add(self, dgram: bytes) -> None:
+        """Add message datagram to pending bundle."""
+        size = _INT_DGRAM_LEN + len(dgram)
+
+        with self._bundle_condition:
+            # bundling was disabled after caller checked it
+            if self._bundle_window is None:
+                self._deliver((dgram,))
+
+                return
+
+            if self._bundle and self._bundle_size + size > self._bundle_max_size:
+                self._send_bundle()
+
+            # message doesn't fit even into empty bundle
+            if _BUNDLE_HEADER_LEN + size > self._bundle_max_size:
+                self._deliver((dgram,))
+
+                return
+
+            if not self._bundle:
+                self._bundle_size = _BUNDLE_HEADER_LEN
+                self._bundle_deadline = time.monotonic() + self._bundle_window
+
+                if self._bundle_flusher is None:
+                    self._bundle_flusher = threading.Thread(target=self._run_bundle_flusher,
+                                                            name='OSCClient bundler', daemon=True)
+                    self._bundle_flusher.start()
+                else:
+                    self._bundle_condition.notify()
+
+            self._bundle.append(dgram)
+            self._bundle_size += size
+
+    def _run_bundle_flusher(self) -> None:
+        """Send pending bundle when its window ends, until flusher is stopped."""
+        current = threading.current_thread()
+        condition = self._bundle_condition
+
+        with condition:
+            while self._bundle_flusher is current:
+                if self._bundle_deadline is None:
+                    condition.wait()
+                    continue
+
+                remaining = self._bundle_deadline - time.monotonic()
+
+                if remaining > 0:
+                    condition.wait(remaining)
+                else:
+                    self._send_bundle()
+
+    def _stop_bundle_flusher(self) -> None:
+        """Stop flusher thread, it's started again by the next bundle."""
+        with self._bundle_condition:
+            flusher = self._bundle_flusher
+            self._bundle_flusher = None
+            self._bundle_condition.notify_all()
+
+        if flusher is not None and flusher is not threading.current_thread():
+            flusher.join()
+
+    def _send_bundle(self) -> None:
+        """Send pending bundle, lock must be held by caller."""
+        self._bundle_deadline = None
+
+        if not self._bundle:
+            return
+
+        dgrams = self._bundle
+        self._bundle = []
+        self._bundle_size = 0
+
+        # single message needs no bundle unless it has a time tag
+        if len(dgrams) == 1 and self._bundle_timestamp == IMMEDIATELY:
+            self._deliver(dgrams)
+
+            return
+
+        parts = [OSCBundle._BUNDLE_PREFIX, OSCType.timetag_pack(self._bundle_timestamp)]
+
+        for dgram in dgrams:
+            parts.append(struct.pack('>i', len(dgram)))
+            parts.append(dgram)
+
+        self._deliver((b''.join(parts),))
+
+    @staticmethod
+    def _build(message: Union[OSCMessage, OSCBundle, OSCTemplate]) -> bytes:
+        """Return datagram of message.
+
+        Raises:
+            ValueError if message is not OSCMessage or OSCBundle
+        """
+        if isinstance(message, OSCTemplate):
+            return message.dgram
+
+        if not (isinstance(message, OSCMessage) or isinstance(message, OSCBundle)):
+            raise ValueError("Given message is not a OSCMessage or OSCBundle")
+
+        return message.build().dgram
+
+    def _deliver(self, dgrams: Iterable[bytes]) -> int:
+        """Send datagrams to every recipient.
+
+        Args:
+            dgrams (list): datagrams to send
+        Returns:
+            number of datagrams sent
+        """
+        # create new socket if previously closed
+        if self._closed:
+            self._socket = self._create_socket()
+            self._closed = False
+
+        sendto = self._socket.sendto
+        clients = self._clients
+        counters = [[0, 0] for _ in clients]
+        translate = self.translate_timetags and len(self.clock) > 0
+
+        for data in dgrams:
+            timed = translate and data.startswith(OSCBundle._BUNDLE_PREFIX)
+
+            for address, counter in zip(clients, counters):
+                dgram = data
+                offset = self.clock.offset(address) if timed else 0
+
+                if offset:
+                    dgram = _shift_timetags(data, offset)
+
+                try:
+                    sendto(dgram, address)
+                except BlockingIOError:
+                    if not self._retry(dgram, address):
+                        self.metrics.send_failed(address)
+
+                        continue
+                except OSError as e:
+                    with self._outbox_lock:
+                        self._errors += 1
+
+                    self.metrics.send_failed(address)
+                    logging.warning("Could not send OSC datagram to %s: %s" % (str(address), e))
+
+                    continue
+
+                counter[0] += 1
+                counter[1] += len(dgram)
+
+        for address, (packets, size) in zip(clients, counters):
+            if packets:
+                self.metrics.sent(address, packets, size)
+
+        return sum(counter[0] for counter in counters)
+
+    def _retry(self, dgram: bytes, address: Tuple[str, int]) -> int:
+        """Wait until socket is writable and send datagram again.
+
+        Returns:
+            1 if datagram was sent, 0 if it was dropped
+        """
+        try:
+            if select.select([], [self._socket], [], self.retry_timeout)[1]:
+                self._socket.sendto(dgram, address)
+
+                return 1
+        except OSError:
+            pass
+
+        with self._outbox_lock:
+            self._dropped += 1
+
+        return 0
+
+
+class OSCRecorder(object):
+    """Append received datagrams to capture file.
+
+    File starts with `MAGIC`, followed by records of header, sender ip
+    address in packed form and datagram. Header holds receive time in
+    nanoseconds since the epoch, sender port, length of packed address
+    and length of datagram. Records are only appended, so capture can be
+    read while it's being written and survives crash of the writer.
+    """
+
+    MAGIC = b'GKOSCAP1'
+
+    # time ns, port, address length, datagram length
+    _HEADER = struct.Struct('>QHBI')
+
+    def __init__(self, path: str, buffering: int = 65536):
+        """Open capture file for appending.
+
+        Args:
+            path (str): path to capture file
+            buffering (int): size of write buffer in bytes
+        Raises:
+            OSCParseError if existing file is not a capture
+        """
+        self._lock = threading.Lock()
+        self._file = open(path, 'ab', buffering)
+        self._records = 0
+
+        if self._file.tell() == 0:
+            self._file.write(self.MAGIC)
+        else:
+            with open(path, 'rb') as file:
+                if file.read(len(self.MAGIC)) != self.MAGIC:
+                    self._file.close()
+
+                    raise OSCParseError('%s is not an OSC capture file' % path)
+
+    def __enter__(self) -> OSCRecorder:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """Return number of records written by this recorder."""
+        return self._records
+
+    def record(self, data: bytes, address: Tuple[str, int], timestamp: Optional[int] = None) -> None:
+        """Append datagram to capture.
+
+        Args:
+            data (bytes): datagram
+            address: tuple (host, port) of sender
+            timestamp (int): receive time in nanoseconds since the epoch, now by default
+        """
+        host, port = address[0], address[1]
+        packed = socket.inet_pton(socket.AF_INET6 if ':' in host else socket.AF_INET, host)
+        header = self._HEADER.pack(timestamp if timestamp is not None else time.time_ns(),
+                                   port, len(packed), len(data))
+
+        with self._lock:
+            self._file.write(header)
+            self._file.write(packed)
+            self._file.write(data)
+            self._records += 1
+
+    def flush(self) -> None:
+        """Write buffered records to disk."""
+        with self._lock:
+            self._file.flush()
+
+    def close(self) -> None:
+        """Flush and close capture file."""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    @classmethod
+    def read(cls, path: str) -> Iterable[Tuple[int, Tuple[str, int], bytes]]:
+        """Read records one by one without loading whole capture into memory.
+
+        Incomplete record at the end of file is ignored.
+
+        Args:
+            path (str): path to capture file
+        Returns:
+            generator of tuples (timestamp in nanoseconds, (host, port), datagram)
+        Raises:
+            OSCParseError if file is not a capture
+        """
+        header_size = cls._HEADER.size
+        unpack = cls._HEADER.unpack
+
+        with open(path, 'rb') as file:
+            if file.read(len(cls.MAGIC)) != cls.MAGIC:
+                raise OSCParseError('%s is not an OSC capture file' % path)
+
+            while True:
+                header = file.read(header_size)
+
+                if len(header) < header_size:
+                    break
+
+                timestamp, port, address_size, size = unpack(header)
+                packed = file.read(address_size)
+                data = file.read(size)
+
+                if len(packed) < address_size or len(data) < size:
+                    break
+
+                host = socket.inet_ntop(socket.AF_INET6 if address_size == 16 else socket.AF_INET, packed)
+
+                yield timestamp, (host, port), data
+
+
+class OSCReplayer(object):
+    """Send datagrams from capture file through OSCClient with original timing.
+
+    Capture is streamed from disk. Sending is paced against a monotonic
+    clock, sleeping until shortly before the due time and then spinning,
+    so gaps of well under a millisecond are reproduced.
+    """
+
+    # seconds before due time when sleeping is replaced by spinning
+    spin_threshold = 0.002
+
+    def __init__(self, path: str, client: OSCClient, speed: float = 1.0):
+        """Create replayer.
+
+        Args:
+            path (str): path to capture file
+            client (OSCClient): client which sends datagrams to its recipients
+            speed (float): 1 is original speed, 2 twice faster, 0 as fast as possible
+        """
+        self.path = path
+        self.client = client
+        self.speed = speed
+        self._stopped = threading.Event()
+
+        self.sent = 0
+        self.lateness_max = 0.0
+
+    def play(self) -> int:
+        """Send all datagrams, blocks until capture ends or `stop` is called.
+
+        Returns:
+            number of replayed datagrams
+        """
+        self._stopped.clear()
+        self.sent = 0
+        self.lateness_max = 0.0
+
+        clock = time.perf_counter
+        started = clock()
+        first = None
+
+        for timestamp, _, data in OSCRecorder.read(self.path):
+            if self._stopped.is_set():
+                break
+
+            if first is None:
+                first = timestamp
+
+            if self.speed > 0:
+                due = started + (timestamp - first) / 1e9 / self.speed
+                self._wait(due)
+                self.lateness_max = max(self.lateness_max, clock() - due)
+
+            self.client._deliver((data,))
+            self.sent += 1
+
+        return self.sent
+
+    def stop(self) -> None:
+        """Stop playing after current datagram."""
+        self._stopped.set()
+
+    def _wait(self, due: float) -> None:
+        """Sleep and spin until `due` time of performance counter."""
+        clock = time.perf_counter
+        remaining = due - clock()
+
+        if remaining > self.spin_threshold:
+            self._stopped.wait(remaining - self.spin_threshold)
+
+        while clock() < due and not self._stopped.is_set():
+            pass
+
+
+class OSCStreamDecoder(object):
+    """Split stream of bytes into OSC packets.
+
+    Supports SLIP framing of OSC 1.1 and int32 size prefixed framing of OSC 1.0.
+    Data received in parts is kept in a single buffer, already scanned
+    bytes are not scanned again when more data arrives.
+    """
+
+    SLIP = 'slip'
+    LENGTH = 'length'
+
+    _END = b'\xc0'
+    _ESC = b'\xdb'
+    _ESC_END = b'\xdb\xdc'
+    _ESC_ESC = b'\xdb\xdd'
+
+    def __init__(self, framing: str = SLIP, max_size: int = 1048576):
+        """Create decoder.
+
+        Args:
+            framing (str): OSCStreamDecoder.SLIP or OSCStreamDecoder.LENGTH
+            max_size (int): max size of a single packet in bytes
+        """
+        self.framing = framing
+        self.max_size = max_size
+        self._buffer = bytearray()
+        self._start = 0
+        self._scan = 0
+
+    def __len__(self) -> int:
+        """Return number of buffered bytes of incomplete packet."""
+        return len(self._buffer) - self._start
+
+    @classmethod
+    def encode(cls, dgram: bytes, framing: str = SLIP) -> bytes:
+        """Return framed OSC packet.
+
+        Args:
+            dgram (bytes): datagram of OSC packet
+            framing (str): OSCStreamDecoder.SLIP or OSCStreamDecoder.LENGTH
+        """
+        if framing == cls.LENGTH:
+            return struct.pack('>i', len(dgram)) + dgram
+
+        return cls._END + bytes(dgram).replace(cls._ESC, cls._ESC_ESC).replace(cls._END, cls._ESC_END) + cls._END
+
+    def feed(self, data: bytes) -> List[bytes]:
+        """Add received data and return complete packets.
+
+        Args:
+            data (bytes): received bytes
+        Returns:
+            list of datagrams
+        Raises:
+            OSCParseError if packet is too large or frame is invalid
+        """
+        buffer = self._buffer
+        buffer += data
+        frames = []
+
+        if self.framing == self.LENGTH:
+            start = self._start
+
+            while len(buffer) - start >= _INT_DGRAM_LEN:
+                size = struct.unpack_from('>i', buffer, start)[0]
+
+                if size < 0 or size > self.max_size:
+                    raise OSCParseError('Invalid size of OSC packet: %d' % size, reason=OSCParseError.BAD_SIZE)
+
+                if len(buffer) - start - _INT_DGRAM_LEN < size:
+                    break
+
+                start += _INT_DGRAM_LEN
+                frames.append(bytes(buffer[start:start + size]))
+                start += size
+
+            self._start = start
+            self._scan = len(buffer)
+        else:
+            start = self._start
+            end = buffer.find(self._END, self._scan)
+
+            while end >= 0:
+                # empty frames are produced by double END characters
+                if end > start:
+                    frames.append(bytes(buffer[start:end]).replace(self._ESC_END, self._END)
+                                  .replace(self._ESC_ESC, self._ESC))
+
+                start = end + 1
+                end = buffer.find(self._END, start)
+
+            self._start = start
+            self._scan = len(buffer)
+
+            if len(buffer) - start > self.max_size:
+                raise OSCParseError('OSC packet is larger than %d bytes' % self.max_size,
+                                    reason=OSCParseError.BAD_SIZE)
+
+        # drop consumed bytes, only incomplete packet is moved
+        if self._start:
+            del buffer[:self._start]
+            self._scan -= self._start
+            self._start = 0
+
+        return frames
+
+
+class OSCStreamClient(object):
+    """Send OSCMessage's and OSCBundle's to OSCStreamServer over TCP.
+
+    Connection is opened on first send and reopened if it was closed.
+    """
+
+    def __init__(self, address: str = '127.0.0.1', port: int = 9000, framing: str = OSCStreamDecoder.SLIP,
+                 timeout: Optional[float] = 5.0):
+        """Initialize the client.
+
+        Args:
+            address (str): server ip address
+            port (int): server port
+            framing (str): OSCStreamDecoder.SLIP or OSCStreamDecoder.LENGTH
+            timeout (float): timeout of connection and send operations in seconds
+        """
+        if framing not in (OSCStreamDecoder.SLIP, OSCStreamDecoder.LENGTH):
+            raise ValueError("Unknown OSC stream framing '%s'" % framing)
+
+        self._address = (address, port)
+        self._framing = framing
+        self._timeout = timeout
+        self._socket: Optional[socket.socket] = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """Return server address and port."""
+        return self._address
+
+    def send(self, message: Union[OSCMessage, OSCBundle, OSCTemplate]) -> None:
+        """Send an OSCBundle or OSCMessage to the server.
+
+        Args:
+            message (OSCMessage, OSCBundle, OSCTemplate): a message to send
+        Raises:
+            OSError if message can't be sent
+        """
+        self._write(OSCStreamDecoder.encode(OSCClient._build(message), self._framing))
+
+    def send_many(self, messages: Iterable[Union[OSCMessage, OSCBundle, OSCTemplate]]) -> None:
+        """Send many messages with one write.
+
+        Args:
+            messages (list): OSCMessage's or OSCBundle's to send
+        Raises:
+            OSError if messages can't be sent
+        """
+        self._write(b''.join(OSCStreamDecoder.encode(OSCClient._build(message), self._framing)
+                             for message in messages))
+
+    def close(self) -> None:
+        """Close connection."""
+        if self._socket:
+            self._socket.close()
+            self._socket = None
+
+    def _write(self, data: bytes) -> None:
+        """Write data to connection, open it if needed."""
+        if self._socket is None:
+            self._socket = socket.create_connection(self._address, self._timeout)
+            self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        try:
+            self._socket.sendall(data)
+        except OSError:
+            self.close()
+
+            raise
+
+
+class OSCCoalescer(object):
+    """Keep only the newest message per address within a tick.
+
+    Messages passed to `put` are kept until the end of current tick,
+    message with the same key replaces previous one. Key is OSC address,
+    optionally together with values of selected arguments. At the end
+    of tick callback is called for surviving messages in order they
+    were received, from one tick thread which lives until `close`.
+    """
+
+    def __init__(self, callback: Callable[..., Any], interval: float = 0.01, arguments: Iterable[int] = ()):
+        """Create coalescer.
+
+        Args:
+            callback (callable): called with arguments passed to `put` after message
+            interval (float): length of tick in seconds
+            arguments (list): indexes of message arguments which are part of key
+        Raises:
+            ValueError if interval is not positive
+        """
+        if interval <= 0:
+            raise ValueError('Coalescing interval should be positive')
+
+        self._callback = callback
+        self.interval = interval
+        self.arguments = tuple(arguments)
+
+        self._pending: collections.OrderedDict = collections.OrderedDict()
+        self._deadline: Optional[float] = None
+        self._thread: Optional[threading.Thread] = None
+        self._condition = threading.Condition()
+        # keeps order of deliveries, callbacks are called without holding `_condition`
+        self._deliver_lock = threading.RLock()
+
+        self._received = 0
+        self._delivered = 0
+
+    def __len__(self) -> int:
+        """Return number of pending messages."""
+        return len(self._pending)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Return number of received, delivered and replaced messages."""
+        with self._condition:
+            return {
+                'received': self._received,
+                'delivered': self._delivered,
+                'coalesced': self._received - self._delivered - len(self._pending)}
+
+    def key(self, message: Union[OSCMessage, OSCTemplate]) -> Tuple[Any, ...]:
+        """Return coalescing key of message.
+
+        Args:
+            message (OSCMessage, OSCTemplate): message
+        Returns:
+            tuple of address and values of selected arguments
+        """
+        if not self.arguments:
+            return message.address,
+
+        args = message.args if isinstance(message, OSCMessage) else message
+
+        return (message.address,) + tuple(args[index] for index in self.arguments if index < len(args))
+
+    def put(self, message: Union[OSCMessage, OSCTemplate], *args) -> None:
+        """Keep message until the end of tick.
+
+        Args:
+            message (OSCMessage, OSCTemplate): message used to compute key
+            *args: arguments of callback
+        """
+        key = self.key(message)
+
+        with self._condition:
+            self._received += 1
+
+            if key in self._pending:
+                del self._pending[key]
+            elif not self._pending:
+                self._deadline = time.monotonic() + self.interval
+
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name='OSCCoalescer', daemon=True)
+                    self._thread.start()
+                else:
+                    self._condition.notify()
+
+            self._pending[key] = args
+
+    def pass_through(self, *args) -> None:
+        """Deliver pending messages and then call callback right away.
+
+        Used for packets which should not be coalesced, keeping order.
+
+        Args:
+            *args: arguments of callback
+        """
+        with self._deliver_lock:
+            self._deliver(self._take())
+            self._callback(*args)
+
+    def flush(self) -> None:
+        """Deliver pending messages now."""
+        with self._deliver_lock:
+            self._deliver(self._take())
+
+    def close(self) -> None:
+        """Deliver pending messages and stop tick thread."""
+        self.flush()
+
+        with self._condition:
+            thread = self._thread
+            self._thread = None
+            self._condition.notify_all()
+
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _take(self) -> List[Tuple[Any, ...]]:
+        """Remove and return arguments of pending messages."""
+        with self._condition:
+            pending = self._pending
+            self._pending = collections.OrderedDict()
+            self._deadline = None
+            self._delivered += len(pending)
+
+        return list(pending.values())
+
+    def _deliver(self, pending: List[Tuple[Any, ...]]) -> None:
+        """Call callback for every pending message."""
+        for args in pending:
+            try:
+                self._callback(*args)
+            except Exception as e:
+                logging.warning("Could not deliver coalesced OSC message: %s" % e)
+
+    def _run(self) -> None:
+        """Flush pending messages at the end of every tick until coalescer is closed."""
+        current = threading.current_thread()
+        condition = self._condition
+
+        while True:
+            with condition:
+                if self._thread is not current:
+                    return
+
+                if self._deadline is None:
+                    condition.wait()
+                    continue
+
+                remaining = self._deadline - time.monotonic()
+
+                if remaining > 0:
+                    condition.wait(remaining)
+                    continue
+
+            self.flush()
+
+
+class OSCScheduler(object):
+    """Dispatch future dated bundles at their time tag.
+
+    Messages and bundles which should be handled immediately are passed
+    to callback right away. Bundles with a time tag in the future are kept
+    in a heap and fired from a single timer thread, or from event loop
+    timers if `loop` is given. Lateness of fired bundles is recorded.
+    """
+
+    def __init__(self, callback: Callable[[Tuple[str, int], Union[OSCMessage, OSCBundle], float], Any],
+                 loop: Optional[asyncio.AbstractEventLoop] = None):
+        """Create scheduler.
+
+        Args:
+            callback (callable): function called with (address, message, date)
+            loop: asyncio event loop to use instead of timer thread
+        """
+        self._callback = callback
+        self._loop = loop
+        self._heap: List[Tuple[float, int, Tuple[str, int], OSCBundle, float]] = []
+        self._handles: Dict[int, asyncio.TimerHandle] = {}
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+        self._scheduled = 0
+        self._fired = 0
+        self._lateness_total = 0.0
+        self._lateness_max = 0.0
+
+    def __len__(self) -> int:
+        """Return number of pending bundles."""
+        return len(self._heap) + len(self._handles)
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """Return scheduling statistics.
+
+        Returns:
+            dict with number of scheduled, fired and pending bundles,
+            mean and max lateness of fired bundles in seconds
+        """
+        return {
+            'scheduled': self._scheduled,
+            'fired': self._fired,
+            'pending': len(self),
+            'lateness_mean': self._lateness_total / self._fired if self._fired else 0.0,
+            'lateness_max': self._lateness_max}
+
+    def dispatch(self, address: Tuple[str, int], message: Union[OSCMessage, OSCBundle], date: float) -> bool:
+        """Call callback now or schedule bundle to be handled at its time tag.
+
+        Nested bundles with a later time tag than their parent are split off
+        and scheduled at their own time tag. Time tag of nested bundle which
+        is earlier than time tag of its parent is raised to it, as OSC 1.0
+        requires.
+
+        Args:
+            address: tuple (host, port) of sender
+            message: OSCMessage or OSCBundle
+            date: system time when packet was received
+        Returns:
+            True if bundle or some of its nested bundles were scheduled
+        """
+        if self.is_due(message):
+            self._callback(address, message, date)
+
+            return False
+
+        scheduled = False
+        now = time.time()
+
+        for due, part in self._split(message, IMMEDIATELY):
+            # contents of bundle were all split off
+            if not len(part) and part is not message:
+                continue
+
+            if due == IMMEDIATELY or due <= now:
+                self._callback(address, part, date)
+            else:
+                self.schedule(due, address, part, date)
+                scheduled = True
+
+        return scheduled
+
+    @classmethod
+    def is_due(cls, message: Union[OSCMessage, OSCBundle]) -> bool:
+        """Return True if message or bundle with all its nested bundles should be handled now.
+
+        Args:
+            message: OSCMessage or OSCBundle
+        """
+        due = cls._latest(message) if isinstance(message, OSCBundle) else IMMEDIATELY
+
+        return due == IMMEDIATELY or due <= time.time()
+
+    @classmethod
+    def _latest(cls, bundle: OSCBundle) -> float:
+        """Return the latest time tag of bundle and its nested bundles."""
+        due = bundle.timestamp
+
+        for content in bundle:
+            if isinstance(content, OSCBundle):
+                due = max(due, cls._latest(content))
+
+        return due
+
+    @classmethod
+    def _split(cls, bundle: OSCBundle, parent: float) -> List[Tuple[float, OSCBundle]]:
+        """Split bundle into parts handled at different times.
+
+        Args:
+            bundle (OSCBundle): bundle to split
+            parent (float): time tag of parent bundle
+        Returns:
+            list of tuples (due, bundle), first part holds contents due with bundle itself
+        """
+        due = max(bundle.timestamp, parent)
+        contents: List[Union[OSCMessage, OSCBundle]] = []
+        parts: List[Tuple[float, OSCBundle]] = []
+        changed = False
+
+        for content in bundle:
+            if not isinstance(content, OSCBundle):
+                contents.append(content)
+                continue
+
+            nested = cls._split(content, due)
+
+            if nested[0][0] == due:
+                # nested bundle left empty by splitting is dropped
+                if len(nested[0][1]) or nested[0][1] is content:
+                    contents.append(nested[0][1])
+
+                changed = changed or nested[0][1] is not content
+                nested = nested[1:]
+            else:
+                changed = True
+
+            parts.extend(nested)
+
+        if changed:
+            part = OSCBundle(bundle.timestamp)
+            part._contents = contents
+            bundle = part
+
+        return [(due, bundle)] + parts
+
+    def schedule(self, due: float, address: Tuple[str, int],
+                 message: Union[OSCMessage, OSCBundle], date: float) -> None:
+        """Schedule message to be handled at `due` system time.
+
+        Args:
+            due (float): system time in seconds since the epoch
+            address: tuple (host, port) of sender
+            message: OSCMessage or OSCBundle
+            date: system time when packet was received
+        """
+        key = next(self._counter)
+        self._scheduled += 1
+
+        if self._loop:
+            self._handles[key] = self._loop.call_later(
+                max(due - time.time(), 0.0), self._fire, key, due, address, message, date)
+
+            return
+
+        with self._condition:
+            heapq.heappush(self._heap, (due, key, address, message, date))
+
+            if not self._running:
+                self._running = True
+                self._thread = threading.Thread(target=self._run, name='OSCScheduler', daemon=True)
+                self._thread.start()
+
+            self._condition.notify()
+
+    def stop(self) -> None:
+        """Drop pending bundles and stop timer thread."""
+        for handle in self._handles.values():
+            handle.cancel()
+
+        self._handles.clear()
+
+        with self._condition:
+            self._heap.clear()
+            self._running = False
+            self._condition.notify()
+
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join()
+
+        self._thread = None
+
+    def _run(self) -> None:
+        """Fire bundles from heap when their time comes."""
+        while True:
+            with self._condition:
+                while self._running and not self._heap:
+                    self._condition.wait()
+
+                if not self._running:
+                    return
+
+                delay = self._heap[0][0] - time.time()
+
+                if delay > 0:
+                    self._condition.wait(delay)
+
+                    continue
+
+                due, key, address, message, date = heapq.heappop(self._heap)
+
+            self._fire(key, due, address, message, date)
+
+    def _fire(self, key: int, due: float, address: Tuple[str, int],
+              message: Union[OSCMessage, OSCBundle], date: float) -> None:
+        """Record lateness and call callback."""
+        lateness = time.time() - due
+
+        self._handles.pop(key, None)
+        self._fired += 1
+        self._lateness_total += lateness
+        self._lateness_max = max(self._lateness_max, lateness)
+
+        try:
+            self._callback(address, message, date)
+        except Exception as e:
+            logging.warning("Scheduled OSC bundle handler failed: %s" % e)
+
+
+class _OSCPatternNode(object):
+    """Node of OSC address pattern trie."""
+
+    __slots__ = ['literals', 'patterns', 'addresses']
+
+    def __init__(self):
+        """Create empty node."""
+        self.literals: Dict[str, _OSCPatternNode] = {}
+        self.patterns: List[Tuple[str, Any, _OSCPatternNode]] = []
+        self.addresses: List[str] = []
+
+
+class OSCDispatcher(Signalable):
+    """Call listeners connected to OSC address patterns.
+
+    Connected addresses may contain OSC 1.0 pattern matching characters:
+    `*`, `?`, `[a-z]`, `[!a-z]` and `{foo,bar}`, for example `/cue/*/go`.
+    Patterns are compiled into a trie of address parts, and matches for
+    every received address are cached.
+    """
+
+    _CACHE_SIZE = 4096
+    _PATTERN_CHARS = re.compile(r"[*?\[\]{}]")
+
+    def __init__(self):
+        """Create dispatcher."""
+        super(OSCDispatcher, self).__init__()
+
+        self._root = _OSCPatternNode()
+        self._cache: Dict[str, Tuple[str, ...]] = {}
+
+    def connect(self, message: str, fn: Callable) -> None:
+        """Connect listener `fn` to OSC address pattern.
+
+        Listener is called with OSCMessage when address of received message matches the pattern.
+
+        Args:
+            message (str): OSC address pattern
+            fn (callable): function to call
+        Raises:
+            ValueError if at least one of arguments is not supported
+        """
+        if not isinstance(message, str) or not message.startswith('/'):
+            raise ValueError("Can't connect to slot '%s', given value is not an OSC address" % message)
+
+        # invalid patterns are rejected before listener is connected
+        self._insert(message)
+
+        try:
+            super(OSCDispatcher, self).connect(message, fn)
+        except ValueError:
+            if not self.slot_length(message):
+                self._remove(message)
+
+            raise
+
+    def disconnect(self, message: str, fn: Callable) -> None:
+        """Disconnect listener `fn` from OSC address pattern.
+
+        Pattern is removed from trie when its last listener is disconnected.
+
+        Args:
+            message (str): OSC address pattern
+            fn (callable): function to disconnect
+        """
+        super(OSCDispatcher, self).disconnect(message, fn)
+
+        if isinstance(message, str) and message.startswith('/') and not self.slot_length(message):
+            self._remove(message)
+
+    def match(self, address: str) -> Tuple[str, ...]:
+        """Return connected patterns which match given OSC address.
+
+        Args:
+            address (str): OSC address of message
+        Returns:
+            tuple of matching patterns
+        """
+        patterns = self._cache.get(address)
+
+        if patterns is None:
+            nodes = [self._root]
+
+            for part in address.split('/')[1:]:
+                nodes = [child for node in nodes for child in self._children(node, part)]
+
+                if not nodes:
+                    break
+
+            patterns = tuple(pattern for node in nodes for pattern in node.addresses)
+
+            if len(self._cache) >= self._CACHE_SIZE:
+                self._cache.clear()
+
+            self._cache[address] = patterns
+
+        return patterns
+
+    def dispatch(self, message: Union[OSCMessage, OSCBundle]) -> None:
+        """Call listeners of message, or of every message in bundle.
+
+        Bundle listeners are called with bundle before messages of bundle are dispatched.
+
+        Args:
+            message: OSCMessage or OSCBundle
+        """
+        if isinstance(message, OSCBundle):
+            self.emit_bundle(message)
+
+            for content in message:
+                self.dispatch(content)
+        else:
+            for pattern in self.match(message.address):
+                self.emit(pattern, message)
+
+    def _insert(self, address: str) -> None:
+        """Add address pattern to trie.
+
+        Raises:
+            ValueError if pattern is invalid, trie is not changed then
+        """
+        parts = address.split('/')[1:]
+        matchers = {part: self._compile(part) for part in parts if self._PATTERN_CHARS.search(part)}
+        node = self._root
+
+        for part in parts:
+            if part in matchers:
+                for item in node.patterns:
+                    if item[0] == part:
+                        node = item[2]
+                        break
+                else:
+                    child = _OSCPatternNode()
+                    node.patterns.append((part, matchers[part], child))
+                    node = child
+            else:
+                node = node.literals.setdefault(part, _OSCPatternNode())
+
+        if address not in node.addresses:
+            node.addresses.append(address)
+            self._cache.clear()
+
+    def _remove(self, address: str) -> None:
+        """Remove address pattern from trie, nodes left empty are dropped."""
+        path: List[Tuple[_OSCPatternNode, str]] = []
+        node = self._root
+
+        for part in address.split('/')[1:]:
+            if self._PATTERN_CHARS.search(part):
+                child = next((item[2] for item in node.patterns if item[0] == part), None)
+            else:
+                child = node.literals.get(part)
+
+            if child is None:
+                return
+
+            path.append((node, part))
+            node = child
+
+        if address not in node.addresses:
+            return
+
+        node.addresses.remove(address)
+        self._cache.clear()
+
+        for parent, part in reversed(path):
+            if node.addresses or node.literals or node.patterns:
+                break
+
+            if self._PATTERN_CHARS.search(part):
+                parent.patterns = [item for item in parent.patterns if item[2] is not node]
+            else:
+                del parent.literals[part]
+
+            node = parent
+
+    @staticmethod
+    def _children(node: _OSCPatternNode, part: str) -> List[_OSCPatternNode]:
+        """Return child nodes which match address part."""
+        children = [item[2] for item in node.patterns if item[1](part)]
+        literal = node.literals.get(part)
+
+        if literal is not None:
+            children.append(literal)
+
+        return children
+
+    @staticmethod
+    def _compile(part: str) -> Callable[[str], Any]:
+        """Compile OSC pattern of one address part into a match function.
+
+        Args:
+            part (str): part of OSC address pattern between slashes
+        Returns:
+            function which returns True-like value if address part matches
+        """
+        expression = ''
+        index = 0
+
+        while index < len(part):
+            char = part[index]
+
+            if char == '*':
+                expression += '.*'
+            elif char == '?':
+                expression += '.'
+            elif char == '[':
+                end = part.find(']', index)
+
+                if end < 0:
+                    raise ValueError("Unclosed '[' in OSC address pattern '%s'" % part)
+
+                chars = part[index + 1:end]
+
+                if chars.startswith('!'):
+                    chars = '^' + chars[1:]
+
+                expression += '[' + chars.replace('\\', '\\\\') + ']'
+                index = end
+            elif char == '{':
+                end = part.find('}', index)
+
+                if end < 0:
+                    raise ValueError("Unclosed '{' in OSC address pattern '%s'" % part)
+
+                expression += '(?:' + '|'.join(re.escape(x) for x in part[index + 1:end].split(',')) + ')'
+                index = end
+            else:
+                expression += re.escape(char)
+
+            index += 1
+
+        return re.compile(expression + r'\Z', re.DOTALL).match
+
+
+class OSCIngestQueue(object):
+    """Bounded queue of received packets waiting for handler.
+
+    Packets are served in order of priority, packets of equal priority in
+    order of arrival. When queue is full `policy` decides what happens:
+
+    - DROP_OLDEST drops the oldest packet of the lowest priority
+    - DROP_NEWEST drops the newest packet of the lowest priority
+    - BLOCK makes `put` wait until there is free space
+
+    Incoming packet of lower priority than everything in queue is dropped
+    by both drop policies.
+    """
+
+    DROP_OLDEST = 'drop_oldest'
+    DROP_NEWEST = 'drop_newest'
+    BLOCK = 'block'
+
+    # max number of cached address priorities
+    _CACHE_SIZE = 4096
+
+    def __init__(self, max_size: int = 1024, policy: str = DROP_OLDEST,
+                 priorities: Optional[Dict[str, int]] = None):
+        """Create queue.
+
+        Args:
+            max_size (int): max number of packets in queue
+            policy (str): one of DROP_OLDEST, DROP_NEWEST or BLOCK
+            priorities (dict): OSC address prefix to priority, larger is served first,
+                default priority is 0, '#bundle' sets priority of bundles
+        Raises:
+            ValueError if policy is unknown or size is not positive
+        """
+        if policy not in (self.DROP_OLDEST, self.DROP_NEWEST, self.BLOCK):
+            raise ValueError('Unknown queue policy: %s' % policy)
+
+        if max_size < 1:
+            raise ValueError('Queue size should be positive')
+
+        self.max_size = max_size
+        self.policy = policy
+
+        # longest prefix is checked first
+        self._prefixes = sorted(((prefix.encode('ascii'), priority)
+                                 for prefix, priority in (priorities or {}).items()),
+                                key=lambda item: len(item[0]), reverse=True)
+        self._priorities: Dict[bytes, int] = {}
+        self._levels: Dict[int, Deque[Any]] = {}
+        self._size = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+        self._put = 0
+        self._dropped: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        """Return number of queued packets."""
+        return self._size
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Return queue statistics.
+
+        Returns:
+            dict with number of queued, accepted and dropped packets,
+            and dropped packets by priority
+        """
+        with self._condition:
+            return {
+                'queued': self._size,
+                'accepted': self._put,
+                'dropped': sum(self._dropped.values()),
+                'dropped_by_priority': dict(self._dropped)}
+
+    def priority(self, data: bytes) -> int:
+        """Return priority of OSC packet by its address.
+
+        Args:
+            data (bytes): datagram of OSC packet
+        Returns:
+            priority of longest matching address prefix or 0
+        """
+        if not self._prefixes:
+            return 0
+
+        end = data.find(b'\0')
+        address = bytes(data[0:end if end >= 0 else len(data)])
+        priority = self._priorities.get(address)
+
+        if priority is None:
+            priority = 0
+
+            for prefix, value in self._prefixes:
+                if address.startswith(prefix):
+                    priority = value
+                    break
+
+            if len(self._priorities) >= self._CACHE_SIZE:
+                self._priorities.clear()
+
+            self._priorities[address] = priority
+
+        return priority
+
+    def put(self, item: Any, priority: int = 0) -> bool:
+        """Add item to queue.
+
+        Args:
+            item: queued object
+            priority (int): larger priority is served first
+        Returns:
+            False if item was dropped or queue is closed
+        """
+        with self._condition:
+            if self._closed:
+                return False
+
+            if self._size >= self.max_size:
+                if self.policy == self.BLOCK:
+                    while self._size >= self.max_size and not self._closed:
+                        self._condition.wait()
+
+                    if self._closed:
+                        return False
+                elif not self._evict(priority):
+                    self._dropped[priority] = self._dropped.get(priority, 0) + 1
+
+                    return False
+
+            level = self._levels.get(priority)
+
+            if level is None:
+                level = self._levels[priority] = collections.deque()
+
+            level.append(item)
+            self._size += 1
+            self._put += 1
+            self._condition.notify_all()
+
+            return True
+
+    def get(self, timeout: Optional[float] = None) -> Any:
+        """Remove and return item of highest priority.
+
+        Args:
+            timeout (float): seconds to wait for item, forever if None
+        Returns:
+            item or None if queue is closed or timeout expired
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._size or self._closed, timeout)
+
+            if not self._size:
+                return None
+
+            priority = max(key for key, level in self._levels.items() if level)
+            item = self._levels[priority].popleft()
+            self._size -= 1
+            self._condition.notify_all()
+
+            return item
+
+    def close(self) -> None:
+        """Wake up all waiting threads, queued items are still returned by `get`."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def _evict(self, priority: int) -> bool:
+        """Drop item of the lowest priority to make space, lock must be held by caller.
+
+        Returns:
+            True if space was made for item of `priority`
+        """
+        lowest = min(key for key, level in self._levels.items() if level)
+
+        if priority < lowest or (priority == lowest and self.policy == self.DROP_NEWEST):
+            return False
+
+        level = self._levels[lowest]
+
+        if self.policy == self.DROP_OLDEST:
+            level.popleft()
+        else:
+            level.pop()
+
+        self._size -= 1
+        self._dropped[lowest] = self._dropped.get(lowest, 0) + 1
+
+        return True
+
+
+class _OSCRequestHandler(socketserver.BaseRequestHandler):
+    """Pass OSC packets to server."""
+
+    def process(self, data: bytes) -> None:
+        """Parse OSC packet and call handler callback.
+
+        Args:
+            data (bytes): datagram of OSC packet
+        """
+        self.server.process_packet(data, self.client_address)
+
+
+class _UDPRequestHandler(_OSCRequestHandler):
+    """Handles correct UDP messages for all types of server.
+
+    Whether this will be run on its own thread, the server's or a whole new
+    process depends on the server you instantiated, look at their documentation.
+
+    This method is called after a basic sanity check was done on the datagram,
+    basically whether this datagram looks like an osc message or bundle,
+    if not the server won't even bother to call it and so no new
+    threads/processes will be spawned.
+    """
+
+    def handle(self) -> None:
+        """Handle UDP request and call handler callback."""
+        self.process(self.request[0])
+
+
+class _TCPRequestHandler(_OSCRequestHandler):
+    """Handles stream connection, each connection is served in own thread."""
+
+    def handle(self) -> None:
+        """Read frames from connection until it is closed."""
+        decoder = OSCStreamDecoder(self.server.framing)
+
+        while True:
+            try:
+                data = self.request.recv(self.server.read_size)
+            except OSError:
+                break
+
+            if not data:
+                break
+
+            try:
+                frames = decoder.feed(data)
+            except OSCParseError as e:
+                logging.warning("OSCParseError: Closing OSC stream from %s: %s" % (str(self.client_address), e))
+
+                break
+
+            for frame in frames:
+                if OSCBundle.is_valid(frame) or OSCMessage.is_valid(frame):
+                    self.process(frame)
+
+
+class _OSCServerMixin(object):
+    """Parts shared by OSC servers of all transports."""
+
+    def _setup(self, lazy: bool, stats_address: Optional[str] = None,
+               ingest: Optional[OSCIngestQueue] = None, coalesce: float = 0.0,
+               coalesce_arguments: Iterable[int] = (), clock_address: Optional[str] = None) -> None:
+        """Create scheduler, dispatcher and metrics.
+
+        Args:
+            lazy (bool): decode arguments of received messages only when they are accessed
+            stats_address (str): reply with metrics to messages sent to this address
+            ingest (OSCIngestQueue): queue packets and handle them in separate thread
+            coalesce (float): length of coalescing tick in seconds, 0 disables coalescing
+            coalesce_arguments (list): indexes of message arguments which are part of coalescing key
+            clock_address (str): reply to clock pings sent to this address, see OSCClockSync
+        """
+        self.lazy = lazy
+        self.stats_address = stats_address
+        self.clock_address = clock_address
+        self.clock = OSCClockSync()
+        # convert time tags of received bundles from clock of sender
+        self.translate_timetags = False
+        self._clock_ping = OSCType.string_pack(clock_address) if clock_address else None
+        self.metrics = OSCMetrics()
+        # set to OSCRecorder to capture received datagrams
+        self.recorder: Optional[OSCRecorder] = None
+        # set to OSCParseCache to parse repeated datagrams only once
+        self.parse_cache: Optional[OSCParseCache] = None
+        self.coalescer: Optional[OSCCoalescer] = None
+
+        if coalesce > 0:
+            self.coalescer = OSCCoalescer(self._handle_timed, coalesce, coalesce_arguments)
+            self.scheduler = OSCScheduler(self._handle_coalesced)
+        else:
+            self.scheduler = OSCScheduler(self._handle_timed)
 
-    This method is called after a basic sanity check was done on the datagram,
-    basically whether this datagram looks like an osc message or bundle,
-    if not the server won't even bother to call it and so no new
-    threads/processes will be spawned.
-    """
+        self.dispatcher = OSCDispatcher()
+        self.ingest = ingest
+        self._ingest_thread: Optional[threading.Thread] = None
+
+        if ingest is not None:
+            self._ingest_thread = threading.Thread(target=self._drain_ingest, name='OSCIngest', daemon=True)
+            self._ingest_thread.start()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return metrics of server together with scheduler and queue statistics."""
+        stats = self.metrics.snapshot()
+        stats['scheduler'] = self.scheduler.stats
+
+        if self.ingest is not None:
+            stats['ingest'] = self.ingest.stats
 
-    def default_handler(self, address: Tuple[str, int],
-                        message: Union[OSCMessage, OSCBundle], date: int) -> None:
-        """Default handler for incoming OSCMessage or OSCBundle.
+        if self.coalescer is not None:
+            stats['coalescer'] = self.coalescer.stats
 
-        You can use custom handler in `OSCServer` by overriding `handle` method.
+        if self.parse_cache is not None:
+            stats['parse_cache'] = self.parse_cache.stats
+
+        if len(self.clock):
+            stats['clock'] = self.clock.stats
+
+        return stats
+
+    def send_stats(self, address: Tuple[str, int]) -> None:
+        """Send metrics as OSCBundle to `address`.
+
+        Args:
+            address: tuple (host, port) of recipient
         """
-        pass
+        prefix = self.stats_address or '/grailkit/stats'
+        bundle = self.metrics.bundle(prefix, self.scheduler.stats)
 
-    def handle(self) -> None:
-        """Handle UDP request and call handler callback."""
-        data = self.request[0]
-        callback = getattr(self.server, 'handle', self.default_handler)
+        self.reply(bundle.build().dgram, address)
+
+    def reply(self, dgram: bytes, address: Tuple[str, int]) -> None:
+        """Send datagram back to sender, not supported by default.
+
+        Args:
+            dgram (bytes): datagram of OSC packet
+            address: tuple (host, port) of recipient
+        """
+        logging.warning("%s can't reply to %s" % (self.__class__.__name__, str(address)))
+
+    def server_close(self) -> None:
+        """Stop ingest thread and scheduler and close socket."""
+        if self.ingest is not None:
+            self.ingest.close()
+            self._ingest_thread.join()
+
+        self.scheduler.stop()
+
+        if self.coalescer is not None:
+            self.coalescer.close()
+
+        super(_OSCServerMixin, self).server_close()
+
+    def process_packet(self, data: bytes, address: Tuple[str, int]) -> None:
+        """Parse OSC packet and pass it to `handle` or to scheduler.
+
+        With ingest queue packet is only queued, it's parsed and handled
+        later in ingest thread.
+
+        Args:
+            data (bytes): datagram of OSC packet
+            address: tuple (host, port) of sender
+        """
+        # pings are answered before queuing, so waiting doesn't skew the estimate
+        if self._clock_ping is not None and data.startswith(self._clock_ping):
+            self.metrics.received(address, len(data))
+            pong = self.clock.pong(self.clock_address, data, address, time.time_ns())
+
+            if pong is not None:
+                self.reply(pong, address)
+
+            return
+
+        if self.recorder is not None:
+            self.recorder.record(data, address)
+
+        if self.ingest is not None:
+            self.metrics.received(address, len(data))
+            self.ingest.put((data, address), self.ingest.priority(data))
+        else:
+            self._process_packet(data, address, False)
+
+    def _drain_ingest(self) -> None:
+        """Handle queued packets until ingest queue is closed and empty."""
+        while True:
+            item = self.ingest.get()
+
+            if item is None:
+                break
+
+            try:
+                self._process_packet(*item)
+            except Exception as e:
+                logging.warning("Could not handle OSC packet: %s" % e)
+
+    def _process_packet(self, data: bytes, address: Tuple[str, int], counted: bool = True) -> None:
+        """Parse OSC packet and pass it to scheduler.
+
+        Packet which isn't `counted` yet is counted as received here, together
+        with handler time when it's handled right away.
+        """
+        size = len(data)
+
+        if self.translate_timetags and data.startswith(OSCBundle._BUNDLE_PREFIX):
+            offset = self.clock.offset(address)
+
+            if offset:
+                data = _shift_timetags(data, -offset)
 
         # Get OSC messages from all bundles or standalone message.
         try:
-            packet = OSCPacket(data)
-            now = calendar.timegm(time.gmtime())
+            packet = OSCPacket(data, self.lazy, self.parse_cache)
+        except OSCParseError as e:
+            if not counted:
+                self.metrics.received(address, size)
 
-            # If the message is to be handled later, then so be it.
-            if packet.time > now:
-                time.sleep(packet.time - now)
-
-            callback(self.client_address, packet.message, packet.time)
-        except OSCParseError:
+            self.metrics.parse_failed(e.reason)
             logging.warning("OSCParseError: Could not parse OSC packet")
 
+            return
+
+        message = packet.message
+
+        if self.stats_address and isinstance(message, OSCMessage) and message.address == self.stats_address:
+            if not counted:
+                self.metrics.received(address, size)
+
+            self.send_stats(address)
+
+            return
+
+        if not counted and self.coalescer is None and self.scheduler.is_due(message):
+            self._handle_timed(address, message, packet.time, size)
+
+            return
+
+        if not counted:
+            self.metrics.received(address, size)
+
+        # Future bundles are handled later by scheduler.
+        self.scheduler.dispatch(address, message, packet.time)
+
+    def _handle_coalesced(self, address: Tuple[str, int],
+                          message: Union[OSCMessage, OSCBundle], date: float) -> None:
+        """Pass messages to coalescer, bundles are handled right away."""
+        if isinstance(message, OSCMessage):
+            self.coalescer.put(message, address, message, date)
+        else:
+            self.coalescer.pass_through(address, message, date)
+
+    def _handle_timed(self, address: Tuple[str, int],
+                      message: Union[OSCMessage, OSCBundle], date: float, size: Optional[int] = None) -> None:
+        """Call `handle` and record time spent in it.
+
+        If `size` is given packet is counted as received in the same update.
+        """
+        started = time.perf_counter_ns()
+
+        try:
+            self.handle(address, message, date)
+        finally:
+            if size is None:
+                self.metrics.handled(time.perf_counter_ns() - started)
+            else:
+                self.metrics.processed(address, size, time.perf_counter_ns() - started)
+
+    def handle(self, address: Tuple[str, int],
+               message: Union[OSCMessage, OSCBundle], date: float) -> None:
+        """Handle receiving of OSCMessage or OSCBundle.
+
+        Bundles with a time tag in the future are passed to this method
+        from scheduler thread when their time comes.
 
-class OSCServer(socketserver.UDPServer):
+        Args:
+            address: tuple (host, port)
+            message: OSCMessage or OSCBundle
+            date: system time when packet was received
+        """
+        self.dispatcher.dispatch(message)
+
+
+class OSCServer(_OSCServerMixin, socketserver.UDPServer):
     """Superclass for different flavors of OSCServer.
 
     You can change server logic by extending from both
     OSCServer and socketserver.ThreadingMixIn or socketserver.ForkingMixIn
+
+    In burst mode every wakeup of server loop drains up to `burst` pending
+    datagrams into preallocated buffers and processes them as a batch
+    in the server thread, bypassing request handler and mixins.
+
+    With `queue_size` set received packets are put into bounded
+    OSCIngestQueue and handled in separate thread, so a flood of packets
+    can't stall receiving. Receiving thread queues packets itself, also
+    with socketserver.ThreadingMixIn, so no thread is started per packet.
+
+    With `coalesce` set only the newest message per address within a tick
+    reaches `handle`, see OSCCoalescer.
+
+    Server receives datagrams sent to multicast groups it joined, either
+    with `groups` or `join_group`. Bind it to '0.0.0.0' or to the group
+    address to receive them, the same applies to broadcast datagrams.
     """
 
-    def __init__(self, address: str = '127.0.0.1', port: int = 9000):
+    # max size of datagram received in burst mode
+    max_packet_size = 65535
+
+    def __init__(self, address: str = '127.0.0.1', port: int = 9000, lazy: bool = False,
+                 reuse_port: bool = False, burst: int = 0, stats_address: Optional[str] = None,
+                 queue_size: int = 0, queue_policy: str = OSCIngestQueue.DROP_OLDEST,
+                 priorities: Optional[Dict[str, int]] = None, coalesce: float = 0.0,
+                 coalesce_arguments: Iterable[int] = (), groups: Iterable[str] = (),
+                 interface: str = '0.0.0.0', clock_address: Optional[str] = None):
         """Initialize OSCServer class.
 
         Args:
             address (string): string representation of ip address, for example: '127.0.0.1'
             port (int): port of server
+            lazy (bool): decode arguments of received messages only when they are accessed
+            reuse_port (bool): set SO_REUSEPORT, so many servers can bind the same port
+            burst (int): max number of datagrams received on one wakeup, 0 disables burst mode
+            stats_address (str): reply with metrics bundle to messages sent to this address
+            queue_size (int): size of ingest queue, 0 handles packets in receiving thread
+            queue_policy (str): what to do when ingest queue is full, see OSCIngestQueue
+            priorities (dict): OSC address prefix to priority in ingest queue
+            coalesce (float): pass only the newest message per address within this many seconds
+            coalesce_arguments (list): indexes of message arguments which are part of coalescing key
+            groups (list): ip addresses of multicast groups to join
+            interface (str): ip address of interface on which groups are joined, any by default
+            clock_address (str): reply to clock pings sent to this address, see OSCClockSync
         """
+        self.reuse_port = reuse_port
+        self.burst = burst
+        # joined multicast groups and their interfaces
+        self.groups: Dict[str, str] = {}
+        self._buffers = [bytearray(self.max_packet_size) for _ in range(burst)]
+        ingest = OSCIngestQueue(queue_size, queue_policy, priorities) if queue_size else None
+        self._setup(lazy, stats_address, ingest, coalesce, coalesce_arguments, clock_address)
+
         super(OSCServer, self).__init__((address, port), _UDPRequestHandler)
 
+        try:
+            for group in groups:
+                self.join_group(group, interface)
+        except OSError:
+            self.server_close()
+            raise
+
+        if burst and not _MSG_DONTWAIT:
+            self.socket.setblocking(False)
+
+    def join_group(self, group: str, interface: str = '0.0.0.0') -> None:
+        """Start receiving datagrams sent to multicast group.
+
+        Args:
+            group (str): ip address of multicast group, for example '239.255.0.1'
+            interface (str): ip address of interface on which group is joined, any by default
+        Raises:
+            OSError if group could not be joined
+        """
+        self.socket.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, self._membership(group, interface))
+        self.groups[group] = interface
+
+    def leave_group(self, group: str) -> None:
+        """Stop receiving datagrams sent to multicast group.
+
+        Args:
+            group (str): ip address of joined multicast group
+        """
+        interface = self.groups.pop(group, None)
+
+        if interface is not None:
+            self.socket.setsockopt(socket.IPPROTO_IP, socket.IP_DROP_MEMBERSHIP, self._membership(group, interface))
+
+    @staticmethod
+    def _membership(group: str, interface: str) -> bytes:
+        """Return ip_mreq structure of group and interface."""
+        return socket.inet_aton(group) + socket.inet_aton(interface)
+
+    def receive_batch(self) -> List[Tuple[bytes, Tuple[str, int]]]:
+        """Receive all pending datagrams, up to `burst` of them.
+
+        Datagrams which don't look like OSC packets are skipped.
+
+        Returns:
+            list of tuples (datagram, sender address)
+        """
+        batch = []
+        receive = self.socket.recvfrom_into
+
+        for buffer in self._buffers:
+            try:
+                size, address = receive(buffer, 0, _MSG_DONTWAIT)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError as e:
+                logging.warning("Could not receive OSC datagram: %s" % e)
+
+                break
+
+            view = memoryview(buffer)[0:size]
+
+            if view[0:1] == b'/' or view[0:len(OSCBundle._BUNDLE_PREFIX)] == OSCBundle._BUNDLE_PREFIX:
+                batch.append((bytes(view), address))
+            else:
+                self.metrics.parse_failed(OSCParseError.NOT_OSC)
+
+        return batch
+
+    def process_batch(self, batch: List[Tuple[bytes, Tuple[str, int]]]) -> None:
+        """Process received datagrams in order.
+
+        Args:
+            batch (list): tuples (datagram, sender address)
+        """
+        for data, address in batch:
+            self.process_packet(data, address)
+
+    def _handle_request_noblock(self) -> None:
+        """Handle one request or, in burst mode, all pending datagrams.
+
+        With ingest queue request is handled in receiving thread, bypassing
+        `process_request` of ThreadingMixIn or ForkingMixIn, it only queues packet.
+        """
+        if self.burst:
+            self.process_batch(self.receive_batch())
+        elif self.ingest is not None:
+            self._queue_request()
+        else:
+            super(OSCServer, self)._handle_request_noblock()
+
+    def _queue_request(self) -> None:
+        """Receive one datagram and put it into ingest queue in this thread."""
+        try:
+            request, client_address = self.get_request()
+        except OSError:
+            return
+
+        if self.verify_request(request, client_address):
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+
+        self.shutdown_request(request)
+
     def verify_request(self, request, client_address) -> bool:
         """Return True if the data looks like a valid OSC UDP datagram.
 
@@ -1535,23 +5423,394 @@ class OSCServer(socketserver.UDPServer):
         """
         data = request[0]
 
-        return OSCBundle.is_valid(data) or OSCMessage.is_valid(data)
+        if OSCBundle.is_valid(data) or OSCMessage.is_valid(data):
+            return True
+
+        self.metrics.parse_failed(OSCParseError.NOT_OSC)
+
+        return False
+
+    def reply(self, dgram: bytes, address: Tuple[str, int]) -> None:
+        """Send datagram back to sender from server socket.
+
+        Args:
+            dgram (bytes): datagram of OSC packet
+            address: tuple (host, port) of recipient
+        """
+        try:
+            self.socket.sendto(dgram, address)
+        except OSError as e:
+            self.metrics.send_failed(address)
+            logging.warning("Could not send OSC datagram to %s: %s" % (str(address), e))
+
+            return
+
+        self.metrics.sent(address, 1, len(dgram))
 
     def server_bind(self) -> None:
         """Called by constructor to bind the socket."""
         self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+
+        if self.reuse_port:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+
         self.socket.bind(self.server_address)
         self.server_address = self.socket.getsockname()
 
+
+def _attach_address_pinning(sock: socket.socket, workers: int) -> bool:
+    """Attach BPF program which selects SO_REUSEPORT socket by sender IPv4 address.
+
+    Args:
+        sock: UDP socket bound with SO_REUSEPORT
+        workers (int): number of sockets in group
+    Returns:
+        True if program was attached
+    """
+    if not sys.platform.startswith('linux') or sock.family != socket.AF_INET:
+        return False
+
+    # A = source address from IPv4 header; A = A % workers; return A
+    program = b''.join([struct.pack('=HBBI', 0x20, 0, 0, (-0x100000 + 12) & 0xffffffff),
+                        struct.pack('=HBBI', 0x94, 0, 0, workers),
+                        struct.pack('=HBBI', 0x16, 0, 0, 0)])
+    instructions = ctypes.create_string_buffer(program, len(program))
+    fprog = struct.pack('HP', 3, ctypes.addressof(instructions))
+
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, getattr(socket, 'SO_ATTACH_REUSEPORT_CBPF', 51), fprog)
+    except OSError as e:
+        logging.warning("Could not pin OSC senders to workers: %s" % e)
+
+        return False
+
+    return True
+
+
+def _serve_pool_worker(server_class: Type[OSCServer], address: str, port: int, pin: int,
+                       kwargs: Dict[str, Any], ready: Any, stop: Any) -> None:
+    """Run server in worker process of OSCServerPool until `stop` event is set.
+
+    Bound port is reported through `ready` queue.
+    """
+    server = server_class(address, port, reuse_port=True, **kwargs)
+
+    if pin:
+        _attach_address_pinning(server.socket, pin)
+
+    def wait_stop():
+        stop.wait()
+        server.shutdown()
+
+    threading.Thread(target=wait_stop, daemon=True).start()
+    ready.put(server.server_address[1])
+
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+
+
+class OSCServerPool(object):
+    """Receive OSC packets on one port in many worker processes.
+
+    Every worker process creates own `server_class` instance bound to the
+    same port with SO_REUSEPORT, kernel distributes datagrams between them.
+    Packets from one sender address and port reach the same worker
+    while number of workers doesn't change. With `pin` enabled on Linux
+    workers are selected by sender IPv4 address only.
+    """
+
+    # seconds to wait for every worker to bind socket
+    start_timeout = 10.0
+
+    def __init__(self, server_class: Type[OSCServer] = OSCServer, address: str = '127.0.0.1', port: int = 9000,
+                 workers: Optional[int] = None, pin: bool = False, **kwargs):
+        """Create pool, call `start` to run workers.
+
+        Args:
+            server_class: OSCServer subclass, instantiated in every worker
+            address (str): ip address to listen on
+            port (int): port to listen on, free port is selected if 0
+            workers (int): number of processes, number of CPUs by default
+            pin (bool): select worker by sender ip address
+            **kwargs: arguments passed to server constructor
+        Raises:
+            OSError if SO_REUSEPORT is not supported
+        """
+        if not hasattr(socket, 'SO_REUSEPORT'):
+            raise OSError("SO_REUSEPORT is not supported on this platform")
+
+        self.server_class = server_class
+        self.server_address = (address, port)
+        self.workers = workers or os.cpu_count() or 1
+        self.pin = pin
+        self._kwargs = kwargs
+        self._processes: List[multiprocessing.Process] = []
+        self._stop = multiprocessing.Event()
+
+    def __len__(self) -> int:
+        """Return number of running workers."""
+        return len([process for process in self._processes if process.is_alive()])
+
+    @property
+    def processes(self) -> List[multiprocessing.Process]:
+        """Return list of worker processes."""
+        return self._processes
+
+    def start(self) -> None:
+        """Start worker processes and wait until all of them are bound."""
+        address, port = self.server_address
+        ready = multiprocessing.Queue()
+        self._stop.clear()
+
+        # first worker selects free port if port is 0, others join it
+        self._spawn(0, address, port, ready)
+        self._wait_ready(ready, 1)
+
+        for index in range(1, self.workers):
+            self._spawn(index, address, self.server_address[1], ready)
+
+        self._wait_ready(ready, self.workers - 1)
+
+    def _spawn(self, index: int, address: str, port: int, ready: Any) -> None:
+        """Start worker process."""
+        process = multiprocessing.Process(
+            target=_serve_pool_worker,
+            args=(self.server_class, address, port, self.workers if self.pin else 0,
+                  self._kwargs, ready, self._stop),
+            name='OSCServerPool-%d' % index,
+            daemon=True)
+        process.start()
+        self._processes.append(process)
+
+    def _wait_ready(self, ready: Any, count: int) -> None:
+        """Wait until `count` workers are bound and store bound port."""
+        try:
+            for _ in range(count):
+                self.server_address = (self.server_address[0], ready.get(timeout=self.start_timeout))
+        except queue.Empty:
+            self.stop(0)
+
+            raise OSError("OSC server workers failed to start")
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop worker processes.
+
+        Args:
+            timeout (float): seconds to wait for every worker before terminating it
+        """
+        self._stop.set()
+
+        for process in self._processes:
+            process.join(timeout)
+
+            if process.is_alive():
+                process.terminate()
+                process.join()
+
+        self._processes = []
+
+
+class OSCStreamServer(_OSCServerMixin, socketserver.ThreadingMixIn, socketserver.TCPServer):
+    """OSC server for TCP streams with SLIP (OSC 1.1) or length prefixed (OSC 1.0) framing.
+
+    Every connection is served in its own thread, packets are passed
+    to `handle` method the same way as in `OSCServer`.
+    """
+
+    allow_reuse_address = True
+    daemon_threads = True
+    block_on_close = False
+
+    # number of bytes to read from socket at once
+    read_size = 65536
+
+    def __init__(self, address: str = '127.0.0.1', port: int = 9000,
+                 framing: str = 'slip', lazy: bool = False):
+        """Initialize OSCStreamServer class.
+
+        Args:
+            address (string): string representation of ip address, for example: '127.0.0.1'
+            port (int): port of server
+            framing (str): OSCStreamDecoder.SLIP or OSCStreamDecoder.LENGTH
+            lazy (bool): decode arguments of received messages only when they are accessed
+        """
+        if framing not in (OSCStreamDecoder.SLIP, OSCStreamDecoder.LENGTH):
+            raise ValueError("Unknown OSC stream framing '%s'" % framing)
+
+        self.framing = framing
+        self._setup(lazy)
+
+        super(OSCStreamServer, self).__init__((address, port), _TCPRequestHandler)
+
+
+class _AsyncOSCProtocol(asyncio.DatagramProtocol):
+    """Datagram protocol which passes received datagrams to AsyncOSCServer."""
+
+    def __init__(self, server: AsyncOSCServer):
+        """Create protocol for server."""
+        self._server = server
+
+    def datagram_received(self, data: bytes, address: Tuple[str, int]) -> None:
+        """Pass datagram to server."""
+        self._server.datagram_received(data, address)
+
+    def error_received(self, exc: Exception) -> None:
+        """Log socket errors, they are not fatal for datagram endpoints."""
+        logging.warning("OSC socket error: %s" % exc)
+
+
+class AsyncOSCServer(object):
+    """OSC server running in asyncio event loop.
+
+    Packets are parsed the same way as in `OSCServer`, override `handle`
+    method to process them. If `handle` returns a coroutine it is scheduled
+    as a task in the event loop. Use `AsyncOSCServer.create` to start server.
+    """
+
+    def __init__(self, lazy: bool = False):
+        """Create server, use `AsyncOSCServer.create` to bind it.
+
+        Args:
+            lazy (bool): decode arguments of received messages only when they are accessed
+        """
+        self.lazy = lazy
+        self.scheduler: Optional[OSCScheduler] = None
+        self.dispatcher = OSCDispatcher()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._transport: Optional[asyncio.DatagramTransport] = None
+
+    @classmethod
+    async def create(cls, loop: asyncio.AbstractEventLoop, address: str = '127.0.0.1',
+                     port: int = 9000, **kwargs) -> AsyncOSCServer:
+        """Create server and bind it to address and port.
+
+        Args:
+            loop: event loop to run server in
+            address (str): ip address to listen on
+            port (int): port to listen on
+            **kwargs: arguments passed to server constructor
+        Returns:
+            AsyncOSCServer instance
+        """
+        server = cls(**kwargs)
+        server._loop = loop
+        server.scheduler = OSCScheduler(server._call_handle, loop)
+        server._transport, _ = await loop.create_datagram_endpoint(
+            lambda: _AsyncOSCProtocol(server), local_addr=(address, port))
+
+        return server
+
+    @property
+    def server_address(self) -> Tuple[str, int]:
+        """Return address and port server is bound to."""
+        return self._transport.get_extra_info('sockname')[0:2]
+
+    def datagram_received(self, data: bytes, address: Tuple[str, int]) -> None:
+        """Parse datagram and call `handle`.
+
+        Args:
+            data (bytes): received datagram
+            address: tuple (host, port) of sender
+        """
+        if not (OSCBundle.is_valid(data) or OSCMessage.is_valid(data)):
+            return
+
+        try:
+            packet = OSCPacket(data, self.lazy)
+        except OSCParseError:
+            logging.warning("OSCParseError: Could not parse OSC packet")
+
+            return
+
+        self.scheduler.dispatch(address, packet.message, packet.time)
+
+    def _call_handle(self, address: Tuple[str, int],
+                     message: Union[OSCMessage, OSCBundle], date: float) -> None:
+        """Call `handle` and schedule returned coroutine."""
+        result = self.handle(address, message, date)
+
+        if asyncio.iscoroutine(result):
+            self._loop.create_task(result)
+
     def handle(self, address: Tuple[str, int],
-               message: Union[OSCMessage, OSCBundle], date: int) -> None:
+               message: Union[OSCMessage, OSCBundle], date: float) -> Any:
         """Handle receiving of OSCMessage or OSCBundle.
 
         Args:
             address: tuple (host, port)
             message: OSCMessage or OSCBundle
-            date: int number which represents time of message
+            date: system time when packet was received
+        """
+        self.dispatcher.dispatch(message)
+
+    def close(self) -> None:
+        """Close server transport and cancel scheduled bundles."""
+        if self.scheduler:
+            self.scheduler.stop()
+
+        if self._transport:
+            self._transport.close()
+            self._transport = None
+
+
+class AsyncOSCClient(_OSCRecipients):
+    """Send OSCMessage's and OSCBundle's to multiple servers from asyncio event loop.
+
+    Use `AsyncOSCClient.create` to open transport.
+    """
+
+    def __init__(self):
+        """Create client, use `AsyncOSCClient.create` to open transport."""
+        super(AsyncOSCClient, self).__init__()
+
+        self._transport: Optional[asyncio.DatagramTransport] = None
+
+    @classmethod
+    async def create(cls, loop: asyncio.AbstractEventLoop, address: Optional[str] = None,
+                     port: Optional[int] = None) -> AsyncOSCClient:
+        """Create client and open datagram transport.
+
+        Args:
+            loop: event loop to run client in
+            address (str): recipient ip address
+            port (int): recipient port
+        Returns:
+            AsyncOSCClient instance
+        """
+        client = cls()
+        client._transport, _ = await loop.create_datagram_endpoint(
+            asyncio.DatagramProtocol, family=socket.AF_INET)
+
+        if address and port:
+            client.add(address, port)
+
+        return client
+
+    def send(self, message: Union[OSCMessage, OSCBundle]) -> None:
+        """Send an OSCBundle or OSCMessage to the servers.
+
+        Transport buffers datagrams if socket is not ready, so this method never blocks.
+
+        Args:
+            message (OSCMessage, OSCBundle): a OSCMessage or OSCBundle to send
         Raises:
-            NotImplementedError if you don't override it
+            ValueError if message is not OSCMessage or OSCBundle
         """
-        raise NotImplementedError("Re-implement this method")
+        if not (isinstance(message, OSCMessage) or isinstance(message, OSCBundle)):
+            raise ValueError("Given message is not a OSCMessage or OSCBundle")
+
+        if self._transport is None:
+            raise OSError("Client is closed")
+
+        dgram = message.build().dgram
+
+        for address in self._clients:
+            self._transport.sendto(dgram, address)
+
+    def close(self) -> None:
+        """Close client transport."""
+        if self._transport:
+            self._transport.close()
+            self._transport = None
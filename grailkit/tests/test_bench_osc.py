@@ -0,0 +1,54 @@
+# -*- coding: UTF-8 -*-
+"""
+Tests for OSC benchmark module.
+
+:copyright: (c) 2017-2020 by Oleksii Lytvyn (http://alexlitvin.name).
+:license: MIT, see LICENSE for more details.
+"""
+
+import unittest
+
+from grailkit.bench import osc
+
+
+class TestOSCBenchmark(unittest.TestCase):
+
+    def test_percentile(self):
+
+        values = list(range(1000))
+
+        self.assertEqual(500, osc.percentile(values, 0.5))
+        self.assertEqual(999, osc.percentile(values, 0.999))
+        self.assertEqual(0, osc.percentile([], 0.5))
+
+    def test_run(self):
+
+        report = osc.run(iterations=5, network=False, match='mixed')
+        names = [result['name'] for result in report['results']]
+
+        self.assertIn('message.build/mixed', names)
+        self.assertNotIn('message.build/empty', names)
+
+        for result in report['results']:
+            self.assertEqual(5, sum(result['histogram'].values()))
+            self.assertLessEqual(result['p50_ns'], result['p999_ns'])
+
+    def test_round_trip(self):
+
+        results = osc.round_trip(5, warmup=1)
+
+        self.assertEqual(['round_trip/empty', 'round_trip/mixed'], [result['name'] for result in results])
+
+    def test_run_matches_round_trip_names(self):
+
+        names = [result['name'] for result in osc.run(iterations=10, match='round_trip/empty')['results']]
+
+        self.assertEqual(['round_trip/empty'], names)
+
+        names = [result['name'] for result in osc.run(iterations=1, match='message.build/int')['results']]
+
+        self.assertEqual(['message.build/int'], names)
+
+
+if __name__ == "__main__":
+    unittest.main()
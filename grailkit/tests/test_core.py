@@ -28,6 +28,25 @@ class TestGrailkitCore(unittest.TestCase):
 
         self.assertEqual(len(signal), 1)
 
+    def test_signal_disconnect(self):
+        """Test that disconnected slot names are not reused"""
+
+        first = Mock()
+        second = Mock()
+        third = Mock()
+
+        signal = Signal()
+        signal.connect(first)
+        signal.connect(second)
+        signal.disconnect(first)
+        signal.connect(third)
+        signal.emit()
+
+        first.assert_not_called()
+        second.assert_called_once_with()
+        third.assert_called_once_with()
+        self.assertEqual(len(signal), 2)
+
     def test_signal_types(self):
         """Test signal types template"""
 
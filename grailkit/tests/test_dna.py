@@ -76,9 +76,9 @@ class TestGrailkitDNA(unittest.TestCase):
         signal.emit(bucket)
         signal.emit(bucket, name='slot')
 
-        # count signals an calls
-        self.assertEqual(len(signal), 4)
-        self.assertEqual(len(bucket), 10)
+        # count signals an calls, unknown name calls all remaining slots
+        self.assertEqual(len(signal), 3)
+        self.assertEqual(len(bucket), 11)
 
     def test_dna_create(self):
         """Test creation of new DNA file"""
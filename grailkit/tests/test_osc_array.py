@@ -0,0 +1,144 @@
+# -*- coding: UTF-8 -*-
+"""
+Tests for OSC arrays and typed blobs.
+
+:copyright: (c) 2017-2020 by Oleksii Lytvyn (http://alexlitvin.name).
+:license: MIT, see LICENSE for more details.
+"""
+
+import array
+import struct
+import unittest
+import unittest.mock
+
+from grailkit import osc
+
+
+class TestOSCArray(unittest.TestCase):
+
+    def test_tag(self):
+
+        self.assertEqual(osc.OSCType.tag([1, 2.0, 'a']), '[ifs]')
+        self.assertEqual(osc.OSCType.tag(array.array('f', [1, 2, 3])), '[fff]')
+        self.assertEqual(osc.OSCType.tag(array.array('d', [1])), '[d]')
+        self.assertEqual(osc.OSCType.tag(array.array('q', [1, 2])), '[hh]')
+        self.assertEqual(osc.OSCType.tag(memoryview(b'abc')), 'b')
+        self.assertEqual(osc.OSCType.tag(bytearray(b'abc')), 'b')
+
+    def test_is_supported(self):
+
+        self.assertTrue(osc.OSCType.is_supported('[ff]'))
+        self.assertTrue(osc.OSCType.is_supported('[i[ff]]'))
+        self.assertFalse(osc.OSCType.is_supported('[ff'))
+        self.assertFalse(osc.OSCType.is_supported('[fX]'))
+
+    def test_wire_format(self):
+
+        message = osc.OSCMessage('/a', [[1, 2]])
+
+        self.assertEqual(message.build().dgram,
+                         b'/a\0\0,[ii]\0\0\0' + struct.pack('>ii', 1, 2))
+
+    def test_round_trip(self):
+
+        message = osc.OSCMessage('/px', [1, array.array('f', [0.5, 1.5]), [2, 's', [3.0, 4.0]], 'end'])
+        parsed = osc.OSCMessage.parse(message.build().dgram)
+
+        self.assertEqual(parsed.typetag, 'i[ff][is[ff]]s')
+        self.assertEqual(parsed.args, [1, [0.5, 1.5], [2, 's', [3.0, 4.0]], 'end'])
+        self.assertEqual(list(parsed)[1], ('[ff]', [0.5, 1.5]))
+
+    def test_lazy_round_trip(self):
+
+        message = osc.OSCMessage('/px', [[1, 2], 'a'])
+        parsed = osc.OSCMessage.parse(message.build().dgram, lazy=True)
+
+        self.assertEqual(parsed.args, [[1, 2], 'a'])
+
+    def test_large_array_is_one_segment(self):
+
+        codec = osc.OSCCodec.compile('[' + 'f' * 512 + ']')
+        values = [float(index) for index in range(512)]
+
+        dgram = codec.pack('/a', [values])
+
+        self.assertEqual(len(codec._segments), 1)
+        self.assertEqual(osc.OSCMessage.parse(dgram).args, [values])
+
+    def test_memoryview(self):
+
+        view = memoryview(array.array('i', [1, 2, 3, 4]))
+        parsed = osc.OSCMessage.parse(osc.OSCMessage('/m', [view]).build().dgram)
+
+        self.assertEqual(parsed.args, [[1, 2, 3, 4]])
+
+    def test_length_mismatch(self):
+
+        codec = osc.OSCCodec.compile('[ff]')
+
+        self.assertRaises(osc.OSCBuildError, codec.pack, '/a', [[1.0]])
+        self.assertRaises(osc.OSCBuildError, codec.pack, '/a', [1.0, 2.0])
+
+    def test_unbalanced_brackets(self):
+
+        self.assertEqual(osc.OSCCodec.compile('[ff').unknown, '[')
+        self.assertEqual(osc.OSCCodec.compile('ff]').unknown, ']')
+        self.assertRaises(osc.OSCBuildError, osc.OSCCodec.compile('ff]').pack, '/a', [1.0, 2.0])
+
+    def test_template_rejects_arrays(self):
+
+        self.assertRaises(osc.OSCBuildError, osc.OSCTemplate, osc.OSCMessage('/a', [[1.0, 2.0]]))
+
+
+class TestOSCTypedBlob(unittest.TestCase):
+
+    def test_round_trip(self):
+
+        values = array.array('f', [0.25, 0.5, 1.0])
+        message = osc.OSCMessage('/blob')
+        message.add(values, osc.OSCType.TYPE_BLOB)
+
+        parsed = osc.OSCMessage.parse(message.build().dgram)
+        blob = parsed.args[0]
+
+        self.assertEqual(len(blob), 12)
+        self.assertEqual(osc.OSCType.blob_to_array(blob, 'f').tolist(), values.tolist())
+
+    def test_typed_blob_is_view_of_datagram(self):
+
+        message = osc.OSCMessage('/blob', ['a'])
+        message.add(array.array('i', [1, 2, 3]), osc.OSCType.TYPE_BLOB)
+        dgram = bytes(message.build().dgram)
+
+        parsed = osc.OSCMessage.parse(dgram)
+        view = parsed.typed_blob(1, 'i')
+
+        self.assertIsInstance(parsed.args[1], bytes)
+        self.assertIs(view.obj, dgram)
+        self.assertEqual(view.tolist(), [1, 2, 3])
+        self.assertRaises(ValueError, parsed.typed_blob, 0, 'i')
+
+    def test_big_endian_view(self):
+
+        blob = memoryview(b'\x01\0\x02\0')
+
+        with unittest.mock.patch.object(osc.sys, 'byteorder', 'big'):
+            view = osc.OSCType.blob_to_array(blob, 'h')
+
+        self.assertEqual(view.tobytes(), b'\0\x01\0\x02')
+
+    def test_little_endian(self):
+
+        self.assertEqual(osc.OSCType.blob_from_array(array.array('h', [1, 2])), b'\x01\0\x02\0')
+
+    def test_zero_copy(self):
+
+        blob = bytearray(osc.OSCType.blob_from_array(array.array('i', [7, 8])))
+        view = osc.OSCType.blob_to_array(blob, 'i')
+        blob[0] = 9
+
+        self.assertEqual(view[0], 9)
+
+
+if __name__ == "__main__":
+    unittest.main()
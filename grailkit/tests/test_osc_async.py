@@ -0,0 +1,58 @@
+# -*- coding: UTF-8 -*-
+"""
+Tests for AsyncOSCServer and AsyncOSCClient classes.
+
+:copyright: (c) 2017-2020 by Oleksii Lytvyn (http://alexlitvin.name).
+:license: MIT, see LICENSE for more details.
+"""
+
+import asyncio
+import unittest
+
+from grailkit import osc
+
+
+class TestServer(osc.AsyncOSCServer):
+
+    def __init__(self, *args, **kwargs):
+        super(TestServer, self).__init__(*args, **kwargs)
+
+        self.log = []
+
+    def handle(self, address, message, date):
+        self.log.append((address, message, date))
+
+
+class TestAsyncOSC(unittest.TestCase):
+
+    def test_send_receive(self):
+
+        async def run():
+            loop = asyncio.get_event_loop()
+            server = await TestServer.create(loop, '127.0.0.1', 0)
+            client = await osc.AsyncOSCClient.create(loop, *server.server_address)
+
+            for value in ["This is example string", 123, True]:
+                client.send(osc.OSCMessage("/debug", [value]))
+
+            for _ in range(100):
+                if len(server.log) == 3:
+                    break
+
+                await asyncio.sleep(0.01)
+
+            client.close()
+            server.close()
+
+            return server.log
+
+        log = asyncio.run(run())
+
+        self.assertEqual(3, len(log))
+        self.assertEqual('127.0.0.1', log[0][0][0])
+        self.assertEqual("/debug", log[0][1].address)
+        self.assertEqual([123], log[1][1].args)
+
+
+if __name__ == "__main__":
+    unittest.main()
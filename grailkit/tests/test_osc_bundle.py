@@ -6,6 +6,7 @@ Tests for OSCBundle class.
 :license: MIT, see LICENSE for more details.
 """
 
+import struct
 import unittest
 from grailkit import osc
 
@@ -141,6 +142,21 @@ class TestOSCBundle(unittest.TestCase):
         self.assertRaises(osc.OSCParseError, osc.OSCBundle.parse, _DGRAM_INVALID)
         self.assertRaises(osc.OSCParseError, osc.OSCBundle.parse, _DGRAM_INVALID_INDEX)
 
+    def test_nested_contents_datagram(self):
+
+        bundle = osc.OSCBundle.parse(_DGRAM_TWO_MESSAGES_IN_BUNDLE)
+
+        self.assertEqual(16, bundle[0].size)
+        self.assertEqual(_DGRAM_TWO_MESSAGES_IN_BUNDLE[20:36], bundle[0].dgram)
+        self.assertEqual(_DGRAM_TWO_MESSAGES_IN_BUNDLE[40:], bundle[1].dgram)
+
+    def test_parse_memoryview(self):
+
+        bundle = osc.OSCBundle.parse(memoryview(_DGRAM_TWO_MESSAGES_IN_BUNDLE))
+
+        self.assertEqual(2, bundle.length)
+        self.assertEqual(_DGRAM_TWO_MESSAGES_IN_BUNDLE, bundle.dgram)
+
     def test_unknown_type(self):
 
         bundle = osc.OSCBundle.parse(_DGRAM_UNKNOWN_TYPE)
@@ -197,6 +213,56 @@ class TestOSCBundleBuilder(unittest.TestCase):
 
         self.assertEqual(5, bundle.length)
 
+    def test_build_does_not_parse(self):
+
+        bundle = osc.OSCBundle(messages=[osc.OSCMessage('/a', [1])])
+
+        self.assertIs(bundle, bundle.build())
+
+    def test_build_nested_sizes(self):
+
+        inner = osc.OSCBundle(messages=[osc.OSCMessage('/b', [2.0, 'c'])])
+        bundle = osc.OSCBundle(messages=[osc.OSCMessage('/a', [1])])
+        bundle.add(inner)
+
+        dgram = bundle.build().dgram
+        parsed = osc.OSCBundle.parse(dgram)
+        inner_dgram = inner.build().dgram
+
+        self.assertEqual(struct.unpack_from('>i', dgram, 16)[0], 12)
+        self.assertEqual(struct.unpack_from('>i', dgram, 32)[0], len(inner_dgram))
+        self.assertEqual(dgram[36:], inner_dgram)
+        self.assertEqual([1], parsed[0].args)
+        self.assertEqual([2.0, 'c'], parsed[1][0].args)
+
+    def test_build_uses_current_arguments(self):
+
+        message = osc.OSCMessage('/a', [1])
+        bundle = osc.OSCBundle(messages=[message])
+        message.add(2)
+
+        self.assertEqual([1, 2], osc.OSCBundle.parse(bundle.build().dgram)[0].args)
+
+    def test_build_sets_contents_datagrams(self):
+
+        message = osc.OSCMessage('/x', [1, 2])
+        bundle = osc.OSCBundle()
+        bundle.append(message)
+        bundle.append(osc.OSCBundle(messages=[osc.OSCMessage('/y', ['z'])]))
+        bundle.build()
+
+        self.assertEqual(osc.OSCMessage('/x', [1, 2]).build().dgram, message.dgram)
+        self.assertEqual(len(message.dgram), message.size)
+        self.assertEqual(osc.OSCMessage('/y', ['z']).build().dgram, bundle[1][0].dgram)
+        self.assertEqual(['z'], osc.OSCBundle.parse(bundle[1].dgram)[0].args)
+
+    def test_build_parsed_bundle(self):
+
+        dgram = osc.OSCBundle(messages=[osc.OSCMessage('/a', ['x'])]).build().dgram
+
+        self.assertEqual(dgram, osc.OSCBundle.parse(dgram).build().dgram)
+        self.assertEqual(dgram, osc.OSCBundle.parse(dgram, lazy=True).build().dgram)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,102 @@
+# -*- coding: UTF-8 -*-
+"""
+Tests for OSCRecorder and OSCReplayer classes.
+
+:copyright: (c) 2017-2020 by Oleksii Lytvyn (http://alexlitvin.name).
+:license: MIT, see LICENSE for more details.
+"""
+
+import os
+import time
+import tempfile
+import unittest
+import unittest.mock
+
+from grailkit import osc
+
+
+class TestOSCCapture(unittest.TestCase):
+
+    def setUp(self):
+
+        handle, self.path = tempfile.mkstemp(suffix='.oscap')
+        os.close(handle)
+        os.remove(self.path)
+
+    def tearDown(self):
+
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def test_record_and_read(self):
+
+        with osc.OSCRecorder(self.path) as recorder:
+            recorder.record(b'/a\0\0', ('127.0.0.1', 9000), 1000)
+            recorder.record(b'/b\0\0', ('::1', 9001), 2000)
+
+            self.assertEqual(2, len(recorder))
+
+        # records are appended to existing capture
+        with osc.OSCRecorder(self.path) as recorder:
+            recorder.record(b'/c\0\0', ('10.0.0.1', 9002), 3000)
+
+        self.assertEqual([(1000, ('127.0.0.1', 9000), b'/a\0\0'),
+                          (2000, ('::1', 9001), b'/b\0\0'),
+                          (3000, ('10.0.0.1', 9002), b'/c\0\0')], list(osc.OSCRecorder.read(self.path)))
+
+    def test_truncated_record_is_ignored(self):
+
+        with osc.OSCRecorder(self.path) as recorder:
+            recorder.record(b'/a\0\0', ('127.0.0.1', 9000), 1000)
+            recorder.record(b'/b\0\0', ('127.0.0.1', 9000), 2000)
+
+        with open(self.path, 'r+b') as file:
+            file.truncate(os.path.getsize(self.path) - 2)
+
+        self.assertEqual(1, len(list(osc.OSCRecorder.read(self.path))))
+
+    def test_invalid_file(self):
+
+        with open(self.path, 'wb') as file:
+            file.write(b'not a capture')
+
+        self.assertRaises(osc.OSCParseError, osc.OSCRecorder, self.path)
+        self.assertRaises(osc.OSCParseError, list, osc.OSCRecorder.read(self.path))
+
+    def test_server_records(self):
+
+        server = osc.OSCServer('127.0.0.1', 0)
+        server.recorder = osc.OSCRecorder(self.path)
+        server.process_packet(osc.OSCMessage('/a', [1]).build().dgram, ('127.0.0.1', 9000))
+        server.recorder.close()
+        server.server_close()
+
+        records = list(osc.OSCRecorder.read(self.path))
+
+        self.assertEqual(1, len(records))
+        self.assertEqual('/a', osc.OSCMessage.parse(records[0][2]).address)
+
+    @unittest.mock.patch('socket.socket')
+    def test_replay(self, mock_socket_ctor):
+        mock_socket = mock_socket_ctor.return_value
+
+        with osc.OSCRecorder(self.path) as recorder:
+            recorder.record(b'/a\0\0', ('127.0.0.1', 9000), 0)
+            recorder.record(b'/b\0\0', ('127.0.0.1', 9000), 50000000)
+
+        client = osc.OSCClient('127.0.0.1', 31337)
+
+        started = time.perf_counter()
+        self.assertEqual(2, osc.OSCReplayer(self.path, client).play())
+        elapsed = time.perf_counter() - started
+
+        self.assertGreaterEqual(elapsed, 0.05)
+        mock_socket.sendto.assert_called_with(b'/b\0\0', ('127.0.0.1', 31337))
+
+        started = time.perf_counter()
+        self.assertEqual(2, osc.OSCReplayer(self.path, client, speed=0).play())
+        self.assertLess(time.perf_counter() - started, 0.05)
+
+
+if __name__ == "__main__":
+    unittest.main()
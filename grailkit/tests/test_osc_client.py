@@ -6,6 +6,9 @@ Tests for OSCClient class.
 :license: MIT, see LICENSE for more details.
 """
 
+import socket
+import threading
+import time
 import unittest
 
 from grailkit import osc
@@ -25,6 +28,237 @@ class TestOSCClient(unittest.TestCase):
         self.assertTrue(mock_socket.sendto.called)
         mock_socket.sendto.assert_called_once_with(msg.build().dgram, ('::1', 31337))
 
+    @unittest.mock.patch('socket.socket')
+    def test_send_many(self, mock_socket_ctor):
+        mock_socket = mock_socket_ctor.return_value
+
+        messages = [osc.OSCMessage('/a', [1]), osc.OSCMessage('/b', [2.0])]
+
+        client = osc.OSCClient('127.0.0.1', 31337)
+        client.add('127.0.0.1', 31338)
+
+        self.assertEqual(4, client.send_many(messages))
+        self.assertEqual(4, mock_socket.sendto.call_count)
+        mock_socket.sendto.assert_called_with(messages[1].dgram, ('127.0.0.1', 31338))
+
+    @unittest.mock.patch('socket.socket')
+    def test_queue_and_flush(self, mock_socket_ctor):
+        mock_socket = mock_socket_ctor.return_value
+
+        client = osc.OSCClient('127.0.0.1', 31337)
+        client.queue(osc.OSCMessage('/a'))
+        client.queue(osc.OSCMessage('/b'))
+
+        self.assertEqual(2, client.pending)
+        self.assertFalse(mock_socket.sendto.called)
+        self.assertEqual(2, client.flush())
+        self.assertEqual(0, client.pending)
+
+    @unittest.mock.patch('select.select')
+    @unittest.mock.patch('socket.socket')
+    def test_blocked_send_is_counted(self, mock_socket_ctor, mock_select):
+        mock_socket = mock_socket_ctor.return_value
+        mock_socket.sendto.side_effect = BlockingIOError()
+        mock_select.return_value = ([], [], [])
+
+        client = osc.OSCClient('127.0.0.1', 31337)
+        client.add('127.0.0.1', 31338)
+
+        self.assertEqual(0, client.send_many([osc.OSCMessage('/a')]))
+        self.assertEqual(2, client.dropped)
+
+    @unittest.mock.patch('socket.socket')
+    def test_multicast_options(self, mock_socket_ctor):
+        mock_socket = mock_socket_ctor.return_value
+
+        client = osc.OSCClient('239.255.0.1', 31337)
+        client.set_multicast(ttl=4, loopback=False, interface='127.0.0.1')
+        client.set_broadcast()
+
+        mock_socket.setsockopt.assert_any_call(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 4)
+        mock_socket.setsockopt.assert_any_call(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 0)
+        mock_socket.setsockopt.assert_any_call(socket.IPPROTO_IP, socket.IP_MULTICAST_IF,
+                                               socket.inet_aton('127.0.0.1'))
+        mock_socket.setsockopt.assert_any_call(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+
+        # options are restored on socket created after close
+        client.close()
+        mock_socket.setsockopt.reset_mock()
+        client.send(osc.OSCMessage('/a'))
+
+        self.assertEqual(4, mock_socket.setsockopt.call_count)
+        mock_socket.sendto.assert_called_with(b'/a\0\0', ('239.255.0.1', 31337))
+
+    @unittest.mock.patch('socket.socket')
+    def test_sender_thread(self, mock_socket_ctor):
+        mock_socket = mock_socket_ctor.return_value
+        sent = []
+        mock_socket.sendto.side_effect = lambda dgram, address: sent.append((dgram, address))
+
+        client = osc.OSCClient('127.0.0.1', 31337)
+        client.enable_sender_thread()
+
+        def produce(index):
+            for value in range(100):
+                client.send(osc.OSCMessage('/thread/%d' % index, [value]))
+
+        threads = [threading.Thread(target=produce, args=(index,)) for index in range(4)]
+
+        for thread in threads:
+            thread.start()
+
+        client.add('127.0.0.1', 31338)
+        client.remove('127.0.0.1', 31338)
+
+        for thread in threads:
+            thread.join()
+
+        client.close()
+
+        messages = [osc.OSCMessage.parse(dgram) for dgram, address in sent if address[1] == 31337]
+
+        self.assertEqual(400, len(messages))
+        self.assertEqual(list(range(100)), [message.args[0] for message in messages
+                                            if message.address == '/thread/2'])
+        self.assertEqual(0, client.snapshot()['outbox'])
+
+    @unittest.mock.patch('socket.socket')
+    def test_sender_thread_stop_while_sending(self, mock_socket_ctor):
+        mock_socket = mock_socket_ctor.return_value
+
+        client = osc.OSCClient('127.0.0.1', 31337)
+        client.enable_sender_thread()
+
+        def produce():
+            for value in range(500):
+                client.send(osc.OSCMessage('/a', [value]))
+
+        threads = [threading.Thread(target=produce) for _ in range(4)]
+
+        for thread in threads:
+            thread.start()
+
+        client.disable_sender_thread()
+
+        for thread in threads:
+            thread.join()
+
+        # messages sent after the sender stopped are sent by their producers
+        self.assertEqual(2000, mock_socket.sendto.call_count)
+        self.assertEqual(0, client.dropped)
+
+    @unittest.mock.patch('socket.socket')
+    def test_sender_thread_survives_errors(self, mock_socket_ctor):
+        mock_socket = mock_socket_ctor.return_value
+
+        class BrokenMessage(osc.OSCMessage):
+
+            def build(self):
+                raise RuntimeError('broken')
+
+        client = osc.OSCClient('127.0.0.1', 31337)
+        client.enable_sender_thread()
+        client.send(BrokenMessage('/a'))
+        client.send(osc.OSCMessage('/b'))
+        client.disable_sender_thread()
+
+        mock_socket.sendto.assert_called_once_with(osc.OSCMessage('/b').build().dgram, ('127.0.0.1', 31337))
+        self.assertEqual(1, client.errors)
+
+    @unittest.mock.patch('socket.socket')
+    def test_sender_thread_drops_when_full(self, mock_socket_ctor):
+
+        client = osc.OSCClient('127.0.0.1', 31337)
+        client.enable_sender_thread(max_size=0)
+        client.send(osc.OSCMessage('/a'))
+        client.close()
+
+        self.assertEqual(1, client.dropped)
+        self.assertFalse(mock_socket_ctor.return_value.sendto.called)
+
+    @unittest.mock.patch('socket.socket')
+    def test_bundling(self, mock_socket_ctor):
+        mock_socket = mock_socket_ctor.return_value
+
+        client = osc.OSCClient('127.0.0.1', 31337)
+        client.enable_bundling(window=10)
+        client.send(osc.OSCMessage('/a', [1]))
+        client.send(osc.OSCMessage('/b', [2]))
+
+        self.assertFalse(mock_socket.sendto.called)
+
+        client.flush_bundle()
+
+        dgram = mock_socket.sendto.call_args[0][0]
+        bundle = osc.OSCBundle.parse(dgram)
+
+        self.assertEqual(1, mock_socket.sendto.call_count)
+        self.assertEqual(['/a', '/b'], [message.address for message in bundle])
+
+    @unittest.mock.patch('socket.socket')
+    def test_bundling_max_size(self, mock_socket_ctor):
+        mock_socket = mock_socket_ctor.return_value
+
+        client = osc.OSCClient('127.0.0.1', 31337)
+        client.enable_bundling(window=10, max_size=64)
+
+        for index in range(4):
+            client.send(osc.OSCMessage('/sensor', [index]))
+
+        # two messages of 16 bytes fit into bundle of 64 bytes
+        self.assertEqual(1, mock_socket.sendto.call_count)
+
+        client.close()
+
+        self.assertEqual(2, mock_socket.sendto.call_count)
+
+    @unittest.mock.patch('socket.socket')
+    def test_bundling_single_message(self, mock_socket_ctor):
+        mock_socket = mock_socket_ctor.return_value
+        message = osc.OSCMessage('/a', [1])
+
+        client = osc.OSCClient('127.0.0.1', 31337)
+        client.enable_bundling(window=10)
+        client.send_many([message])
+
+        mock_socket.sendto.assert_called_once_with(message.build().dgram, ('127.0.0.1', 31337))
+
+    @unittest.mock.patch('socket.socket')
+    def test_bundling_window_uses_one_thread(self, mock_socket_ctor):
+        mock_socket = mock_socket_ctor.return_value
+
+        client = osc.OSCClient('127.0.0.1', 31337)
+        client.enable_bundling(window=0.002)
+        started = threading.active_count()
+
+        for index in range(20):
+            client.send(osc.OSCMessage('/a', [index]))
+            time.sleep(0.005)
+
+        self.assertLessEqual(threading.active_count() - started, 1)
+        self.assertGreaterEqual(mock_socket.sendto.call_count, 10)
+
+        client.close()
+
+        self.assertEqual(started, threading.active_count())
+
+    @unittest.mock.patch('socket.socket')
+    def test_bundle_add_after_disable_bundling(self, mock_socket_ctor):
+        mock_socket = mock_socket_ctor.return_value
+
+        client = osc.OSCClient('127.0.0.1', 31337)
+        client.enable_bundling(window=10)
+        client.disable_bundling()
+
+        # sender which saw bundling enabled before it was disabled
+        dgram = osc.OSCMessage('/a', [1]).build().dgram
+        client._bundle_add(dgram)
+
+        mock_socket.sendto.assert_called_once_with(dgram, ('127.0.0.1', 31337))
+        self.assertEqual([], client._bundle)
+
+        client.close()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,199 @@
+# -*- coding: UTF-8 -*-
+"""
+Tests for OSCClockSync class.
+
+:copyright: (c) 2017-2020 by Oleksii Lytvyn (http://alexlitvin.name).
+:license: MIT, see LICENSE for more details.
+"""
+
+import socket
+import threading
+import time
+import unittest
+
+from grailkit import osc
+
+
+class TestServer(osc.OSCServer):
+
+    def __init__(self, *args, **kwargs):
+        super(TestServer, self).__init__(*args, **kwargs)
+
+        self.log = []
+
+    def handle(self, address, message, date):
+        self.log.append((address, message, date))
+
+
+class TestOSCClockSync(unittest.TestCase):
+
+    def test_sample(self):
+
+        clock = osc.OSCClockSync()
+        peer = ('127.0.0.1', 9000)
+
+        # peer is 100 ms ahead, 10 ms each way, 2 ms in peer
+        offset, delay = clock.add_sample(peer, 1000000000, 1110000000, 1112000000, 1022000000)
+
+        self.assertEqual(100000000, offset)
+        self.assertEqual(20000000, delay)
+        self.assertEqual((100000000, 20000000), clock.estimate(peer))
+        self.assertAlmostEqual(10.1, clock.to_peer(peer, 10.0))
+        self.assertAlmostEqual(10.0, clock.from_peer(peer, 10.1))
+        self.assertEqual(osc.IMMEDIATELY, clock.to_peer(peer, osc.IMMEDIATELY))
+
+    def test_filter_prefers_smallest_delay(self):
+
+        clock = osc.OSCClockSync(samples=3)
+        peer = ('127.0.0.1', 9000)
+
+        clock.update(peer, 50, 900)
+        clock.update(peer, 10, 100)
+        clock.update(peer, 70, 500)
+
+        self.assertEqual(10, clock.offset(peer))
+
+        # oldest samples are replaced
+        clock.update(peer, 20, 300)
+        clock.update(peer, 30, 400)
+        clock.update(peer, 40, 600)
+
+        self.assertEqual(20, clock.offset(peer))
+        self.assertEqual(0, clock.offset(('127.0.0.1', 9001)))
+
+    def test_shift_timetags(self):
+
+        nested = osc.OSCBundle(200.0, [osc.OSCMessage('/b')])
+        bundle = osc.OSCBundle(100.0, [osc.OSCMessage('/a'), nested, osc.OSCBundle(osc.IMMEDIATELY)])
+
+        shifted = osc.OSCBundle.parse(osc._shift_timetags(bundle.build().dgram, 1500000000))
+
+        self.assertAlmostEqual(101.5, shifted.timestamp, places=6)
+        self.assertAlmostEqual(201.5, shifted[1].timestamp, places=6)
+        self.assertEqual(osc.IMMEDIATELY, shifted[2].timestamp)
+        self.assertEqual('/b', shifted[1][0].address)
+
+    def test_pong_rejects_malformed_ping(self):
+
+        clock = osc.OSCClockSync()
+        peer = ('127.0.0.1', 1)
+
+        for args in (['a', 'b', 'c'], [1, 2], [1.0, 2, 3], [True, 2, 3]):
+            dgram = osc.OSCMessage(osc.OSCClockSync.ADDRESS, args).build().dgram
+            self.assertIsNone(clock.pong(osc.OSCClockSync.ADDRESS, dgram, peer, 1))
+
+        self.assertIsNone(clock.pong(osc.OSCClockSync.ADDRESS, b'/grailkit/clock\0,i', peer, 1))
+        self.assertEqual(0, len(clock))
+
+
+class TestOSCClockExchange(unittest.TestCase):
+
+    def setUp(self):
+
+        self.server = TestServer('127.0.0.1', 0, clock_address=osc.OSCClockSync.ADDRESS)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.client = osc.OSCClient(*self.server.server_address)
+
+    def tearDown(self):
+
+        self.client.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_sync(self):
+
+        peer = self.server.server_address
+
+        self.assertEqual(1, self.client.sync_clock(rounds=4, timeout=1.0))
+
+        offset, delay = self.client.clock.estimate(peer)
+
+        # same host, so clocks agree
+        self.assertLess(abs(offset), 50000000)
+        self.assertGreaterEqual(delay, 0)
+
+        # server learns estimate from later pings and doesn't pass pings to handle
+        self.assertEqual(1, len(self.server.clock))
+        self.assertEqual([], self.server.log)
+
+    def test_malformed_ping_is_ignored_by_server(self):
+
+        dgram = osc.OSCMessage(osc.OSCClockSync.ADDRESS, ['a', 'b', 'c']).build().dgram
+
+        self.server.process_packet(dgram, ('127.0.0.1', 1))
+
+        self.assertEqual(0, len(self.server.clock))
+
+    def test_sync_closed_client_raises(self):
+
+        self.client.close()
+
+        self.assertRaises(ValueError, self.client.sync_clock)
+
+    def test_pong_from_other_address_is_ignored(self):
+
+        server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        server.bind(('127.0.0.1', 0))
+        server.settimeout(2)
+        other = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        client = osc.OSCClient(*server.getsockname())
+
+        def reply(sock):
+            data, address = server.recvfrom(1024)
+            t0 = osc.OSCMessage.parse(data).args[0]
+            pong = osc.OSCCodec.compile('hhh').pack(osc.OSCClockSync.ADDRESS + '/pong', [t0, t0, t0])
+            sock.sendto(pong, address)
+
+        thread = threading.Thread(target=reply, args=(other,))
+        thread.start()
+
+        self.assertEqual(0, client.sync_clock(rounds=1, timeout=0.3))
+        thread.join()
+
+        thread = threading.Thread(target=reply, args=(server,))
+        thread.start()
+
+        self.assertEqual(1, client.sync_clock(rounds=1, timeout=1.0))
+        thread.join()
+
+        client.close()
+        other.close()
+        server.close()
+
+    def test_translate_timetags(self):
+
+        peer = self.server.server_address
+        self.client.clock.update(peer, 5000000000, 0)
+        self.client.translate_timetags = True
+
+        due = time.time() + 60
+        self.client.send(osc.OSCBundle(due, [osc.OSCMessage('/cue')]))
+        self.client.send(osc.OSCMessage('/now'))
+
+        deadline = time.time() + 2.0
+
+        while not self.server.log and time.time() < deadline:
+            time.sleep(0.01)
+
+        self.assertEqual('/now', self.server.log[0][1].address)
+        self.assertEqual(1, len(self.server.scheduler))
+
+        # client clock is 5 seconds behind, server translates time tag to its own clock
+        self.client.translate_timetags = False
+        self.server.translate_timetags = True
+        self.server.clock.update(self.server.log[0][0], -5000000000, 0)
+        due = time.time() + 0.1
+        self.client.send(osc.OSCBundle(due - 5.0, [osc.OSCMessage('/due')]))
+
+        deadline = time.time() + 2.0
+
+        while len(self.server.log) < 2 and time.time() < deadline:
+            time.sleep(0.01)
+
+        self.assertEqual('/due', self.server.log[1][1][0].address)
+        self.assertAlmostEqual(due, self.server.log[1][1].timestamp, places=3)
+        self.assertEqual(1, len(self.server.scheduler))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+# -*- coding: UTF-8 -*-
+"""
+Tests for OSCCoalescer class.
+
+:copyright: (c) 2017-2020 by Oleksii Lytvyn (http://alexlitvin.name).
+:license: MIT, see LICENSE for more details.
+"""
+
+import threading
+import time
+import unittest
+import unittest.mock
+
+from grailkit import osc
+
+
+class TestOSCCoalescer(unittest.TestCase):
+
+    def test_newest_wins(self):
+
+        delivered = []
+        coalescer = osc.OSCCoalescer(delivered.append, interval=10)
+
+        for value in range(100):
+            message = osc.OSCMessage('/fader/1', [value])
+            coalescer.put(message, message)
+
+        coalescer.put(osc.OSCMessage('/button'), 'button')
+        message = osc.OSCMessage('/fader/2', [0.5])
+        coalescer.put(message, message)
+        coalescer.flush()
+
+        self.assertEqual([99, 'button', 0.5], [item if isinstance(item, str) else item.args[0]
+                                               for item in delivered])
+        self.assertEqual({'received': 102, 'delivered': 3, 'coalesced': 99}, coalescer.stats)
+
+    def test_key_arguments(self):
+
+        delivered = []
+        coalescer = osc.OSCCoalescer(delivered.append, interval=10, arguments=(0,))
+
+        for channel, value in ((1, 0.1), (2, 0.2), (1, 0.3)):
+            coalescer.put(osc.OSCMessage('/mixer', [channel, value]), value)
+
+        coalescer.flush()
+
+        self.assertEqual([0.2, 0.3], delivered)
+
+    def test_pass_through_keeps_order(self):
+
+        delivered = []
+        coalescer = osc.OSCCoalescer(delivered.append, interval=10)
+
+        coalescer.put(osc.OSCMessage('/a'), 'a')
+        coalescer.pass_through('bundle')
+
+        self.assertEqual(['a', 'bundle'], delivered)
+
+    def test_timer(self):
+
+        done = threading.Event()
+        coalescer = osc.OSCCoalescer(lambda item: done.set(), interval=0.01)
+        coalescer.put(osc.OSCMessage('/a'), 'a')
+
+        self.assertTrue(done.wait(2))
+        coalescer.close()
+
+    def test_one_tick_thread(self):
+
+        delivered = []
+        coalescer = osc.OSCCoalescer(lambda item: delivered.append(threading.current_thread()), interval=0.002)
+
+        for index in range(20):
+            coalescer.put(osc.OSCMessage('/a'), index)
+            time.sleep(0.005)
+
+        coalescer.close()
+
+        self.assertEqual(20, len(delivered))
+        self.assertEqual(1, len(set(delivered)))
+
+    def test_interval_must_be_positive(self):
+
+        self.assertRaises(ValueError, osc.OSCCoalescer, print, 0)
+        self.assertRaises(ValueError, osc.OSCClient().enable_coalescing, -1)
+
+    @unittest.mock.patch('socket.socket')
+    def test_client(self, mock_socket_ctor):
+        mock_socket = mock_socket_ctor.return_value
+
+        client = osc.OSCClient('127.0.0.1', 31337)
+        client.enable_coalescing(interval=10)
+
+        for value in range(10):
+            client.send(osc.OSCMessage('/fader', [value]))
+
+        self.assertFalse(mock_socket.sendto.called)
+
+        client.close()
+
+        mock_socket.sendto.assert_called_once_with(osc.OSCMessage('/fader', [9]).build().dgram,
+                                                   ('127.0.0.1', 31337))
+
+    @unittest.mock.patch('socket.socket')
+    def test_client_close_stops_coalescer(self, mock_socket_ctor):
+
+        client = osc.OSCClient('127.0.0.1', 31337)
+        client.enable_coalescing(interval=10)
+        client.send(osc.OSCMessage('/fader', [1]))
+
+        thread = client._coalescer._thread
+        client.close()
+
+        self.assertFalse(thread.is_alive())
+        self.assertIsNone(client._coalescer)
+
+    def test_server(self):
+
+        received = []
+
+        class Server(osc.OSCServer):
+
+            def handle(self, address, message, date):
+                received.append(message.args[0])
+
+        server = Server('127.0.0.1', 0, coalesce=10)
+
+        for value in range(10):
+            server.process_packet(osc.OSCMessage('/fader', [value]).build().dgram, ('127.0.0.1', 1))
+
+        self.assertEqual([], received)
+
+        server.server_close()
+
+        self.assertEqual([9], received)
+        self.assertEqual(9, server.snapshot()['coalescer']['coalesced'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+# -*- coding: UTF-8 -*-
+"""
+Tests for OSCCodec class.
+
+:copyright: (c) 2017-2020 by Oleksii Lytvyn (http://alexlitvin.name).
+:license: MIT, see LICENSE for more details.
+"""
+
+import unittest
+from grailkit import osc
+
+
+_DGRAM_ALL_STANDARD_TYPES_OF_PARAMS = (
+    b"/SYNC\x00\x00\x00"
+    b",ifsb\x00\x00\x00"
+    b"\x00\x00\x00\x03"  # 3
+    b"@\x00\x00\x00"  # 2.0
+    b"ABC\x00"  # "ABC"
+    b"\x00\x00\x00\x08stuff\x00\x00\x00")  # b"stuff\x00\x00\x00"
+
+
+class TestOSCCodec(unittest.TestCase):
+
+    def test_compile_is_cached(self):
+
+        self.assertIs(osc.OSCCodec.compile(',fffi'), osc.OSCCodec.compile(',fffi'))
+
+    def test_fixed_size(self):
+
+        self.assertEqual(16, osc.OSCCodec.compile('fffi').fixed)
+        self.assertEqual(8, osc.OSCCodec.compile('fTFi').fixed)
+        self.assertIsNone(osc.OSCCodec.compile('fs').fixed)
+
+    def test_pack(self):
+
+        codec = osc.OSCCodec.compile('ifsb')
+        dgram = codec.pack('/SYNC', [3, 2.0, 'ABC', b'stuff\x00\x00\x00'])
+
+        self.assertEqual(_DGRAM_ALL_STANDARD_TYPES_OF_PARAMS, dgram)
+
+    def test_unpack(self):
+
+        codec = osc.OSCCodec.compile('ifsb')
+        values, index = codec.unpack(_DGRAM_ALL_STANDARD_TYPES_OF_PARAMS, 16)
+
+        self.assertEqual([3, 2.0, 'ABC', b'stuff\x00\x00\x00'], values)
+        self.assertEqual(len(_DGRAM_ALL_STANDARD_TYPES_OF_PARAMS), index)
+
+    def test_round_trip(self):
+
+        codec = osc.OSCCodec.compile('ifcTNhdS')
+        values = [-7, 0.25, 'x', True, None, 2 ** 40, 3.1415, 'текст']
+        dgram = codec.pack('/a', values)
+
+        self.assertEqual(values, codec.unpack(dgram, 4 + 12)[0])
+
+    def test_pack_raises(self):
+
+        codec = osc.OSCCodec.compile('f')
+
+        self.assertRaises(osc.OSCBuildError, codec.pack, '/a', ['not a float'])
+        self.assertRaises(osc.OSCBuildError, codec.pack, '/a', [1.0, 2.0])
+        self.assertRaises(osc.OSCBuildError, osc.OSCCodec.compile('b').pack, '/a', [b''])
+
+    def test_unpack_raises_on_short_datagram(self):
+
+        self.assertRaises(osc.OSCParseError, osc.OSCCodec.compile('ii').unpack, b'\x00\x00\x00\x01', 0)
+        self.assertRaises(osc.OSCParseError, osc.OSCCodec.compile('s').unpack, b'abc', 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
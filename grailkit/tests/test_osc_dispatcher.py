@@ -0,0 +1,142 @@
+# -*- coding: UTF-8 -*-
+"""
+Tests for OSCDispatcher class.
+
+:copyright: (c) 2017-2020 by Oleksii Lytvyn (http://alexlitvin.name).
+:license: MIT, see LICENSE for more details.
+"""
+
+import unittest
+from unittest.mock import Mock
+
+from grailkit import osc
+
+
+class TestOSCDispatcher(unittest.TestCase):
+
+    def test_literal_address(self):
+
+        func = Mock()
+        message = osc.OSCMessage('/cue/1/go')
+
+        dispatcher = osc.OSCDispatcher()
+        dispatcher.connect('/cue/1/go', func)
+        dispatcher.dispatch(message)
+        dispatcher.dispatch(osc.OSCMessage('/cue/2/go'))
+
+        func.assert_called_once_with(message)
+
+    def test_patterns(self):
+
+        dispatcher = osc.OSCDispatcher()
+
+        for pattern in ['/cue/*/go', '/cue/?/go', '/cue/[0-5]/go', '/cue/[!0-5]/go',
+                        '/cue/{1,12}/go', '/cue/1*', '/*/*/*']:
+            dispatcher.connect(pattern, Mock())
+
+        self.assertEqual({'/cue/*/go', '/cue/?/go', '/cue/[0-5]/go', '/cue/{1,12}/go', '/*/*/*'},
+                         set(dispatcher.match('/cue/1/go')))
+        self.assertEqual({'/cue/*/go', '/cue/{1,12}/go', '/*/*/*'},
+                         set(dispatcher.match('/cue/12/go')))
+        self.assertEqual({'/cue/*/go', '/cue/?/go', '/cue/[!0-5]/go', '/*/*/*'},
+                         set(dispatcher.match('/cue/7/go')))
+        self.assertEqual({'/cue/1*'}, set(dispatcher.match('/cue/1')))
+        self.assertEqual((), dispatcher.match('/light/1'))
+
+    def test_cache_invalidated_on_connect(self):
+
+        dispatcher = osc.OSCDispatcher()
+        dispatcher.connect('/a/b', Mock())
+
+        self.assertEqual(('/a/b',), dispatcher.match('/a/b'))
+
+        dispatcher.connect('/a/*', Mock())
+
+        self.assertEqual({'/a/b', '/a/*'}, set(dispatcher.match('/a/b')))
+
+    def test_disconnect(self):
+
+        class Listener(object):
+
+            def handle(self, message):
+                pass
+
+        # bound methods are kept as weak references
+        first = Listener().handle
+        second = Listener().handle
+
+        dispatcher = osc.OSCDispatcher()
+        dispatcher.connect('/a/*', first)
+        dispatcher.connect('/a/*', second)
+        dispatcher.connect('/a/b', first)
+
+        self.assertEqual({'/a/b', '/a/*'}, set(dispatcher.match('/a/b')))
+
+        dispatcher.disconnect('/a/*', first)
+
+        self.assertEqual({'/a/b', '/a/*'}, set(dispatcher.match('/a/b')))
+
+        dispatcher.disconnect('/a/*', second)
+
+        self.assertEqual(('/a/b',), dispatcher.match('/a/b'))
+        self.assertEqual((), dispatcher.match('/a/c'))
+
+        dispatcher.disconnect('/a/b', first)
+
+        self.assertEqual((), dispatcher.match('/a/b'))
+        self.assertEqual({}, dispatcher._root.literals)
+
+    def test_disconnect_function(self):
+
+        func = Mock()
+        other = Mock()
+
+        dispatcher = osc.OSCDispatcher()
+        dispatcher.connect('/cue/*/go', func)
+        dispatcher.connect('/cue/*/go', other)
+        dispatcher.disconnect('/cue/*/go', func)
+        dispatcher.dispatch(osc.OSCMessage('/cue/1/go'))
+
+        func.assert_not_called()
+        other.assert_called_once()
+
+        dispatcher.disconnect('/cue/*/go', other)
+
+        self.assertEqual((), dispatcher.match('/cue/1/go'))
+        self.assertEqual({}, dispatcher._root.literals)
+
+    def test_invalid_pattern_is_not_connected(self):
+
+        dispatcher = osc.OSCDispatcher()
+
+        for pattern in ('/a/[b', '/a/{x', '/b/*/[c'):
+            self.assertRaises(ValueError, dispatcher.connect, pattern, Mock())
+            self.assertEqual(0, dispatcher.slot_length(pattern))
+
+        self.assertRaises(ValueError, dispatcher.connect, '/c', 'not callable')
+
+        self.assertEqual(0, dispatcher.slot_length('/c'))
+        self.assertEqual({}, dispatcher._root.literals)
+        self.assertEqual([], dispatcher._root.patterns)
+
+    def test_bundle(self):
+
+        func = Mock()
+        bundle_func = Mock()
+        bundle = osc.OSCBundle(messages=[osc.OSCMessage('/a'), osc.OSCMessage('/b')])
+
+        dispatcher = osc.OSCDispatcher()
+        dispatcher.connect('/?', func)
+        dispatcher.connect_bundle(bundle_func)
+        dispatcher.dispatch(bundle)
+
+        bundle_func.assert_called_once_with(bundle)
+        self.assertEqual(2, func.call_count)
+
+    def test_invalid_address_raises(self):
+
+        self.assertRaises(ValueError, osc.OSCDispatcher().connect, 'cue', Mock())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+# -*- coding: UTF-8 -*-
+"""
+Tests for OSCIngestQueue class.
+
+:copyright: (c) 2017-2020 by Oleksii Lytvyn (http://alexlitvin.name).
+:license: MIT, see LICENSE for more details.
+"""
+
+import socketserver
+import time
+import threading
+import unittest
+import unittest.mock
+
+from grailkit import osc
+
+
+class TestOSCIngestQueue(unittest.TestCase):
+
+    def _fill(self, policy):
+
+        ingest = osc.OSCIngestQueue(3, policy)
+
+        for index in range(5):
+            ingest.put(index)
+
+        return ingest, [ingest.get(0) for _ in range(len(ingest))]
+
+    def test_drop_oldest(self):
+
+        ingest, items = self._fill(osc.OSCIngestQueue.DROP_OLDEST)
+
+        self.assertEqual([2, 3, 4], items)
+        self.assertEqual(2, ingest.stats['dropped'])
+
+    def test_drop_newest(self):
+
+        ingest, items = self._fill(osc.OSCIngestQueue.DROP_NEWEST)
+
+        self.assertEqual([0, 1, 2], items)
+        self.assertEqual(2, ingest.stats['dropped'])
+
+    def test_block(self):
+
+        ingest = osc.OSCIngestQueue(1, osc.OSCIngestQueue.BLOCK)
+        ingest.put(0)
+
+        thread = threading.Thread(target=ingest.put, args=(1,))
+        thread.start()
+        time.sleep(0.05)
+
+        self.assertTrue(thread.is_alive())
+        self.assertEqual(0, ingest.get(1))
+
+        thread.join(1)
+
+        self.assertEqual(1, ingest.get(1))
+        self.assertEqual(0, ingest.stats['dropped'])
+
+    def test_priority(self):
+
+        ingest = osc.OSCIngestQueue(2, priorities={'/cue': 10, '/meter': -1, '#bundle': 5})
+
+        self.assertEqual(10, ingest.priority(b'/cue/go\0,i\0\0'))
+        self.assertEqual(-1, ingest.priority(b'/meter\0\0'))
+        self.assertEqual(5, ingest.priority(osc.OSCBundle._BUNDLE_PREFIX))
+        self.assertEqual(0, ingest.priority(b'/other\0\0'))
+
+        ingest.put('meter', -1)
+        ingest.put('other', 0)
+
+        # low priority packet is evicted for important one, and lower one is dropped
+        self.assertTrue(ingest.put('cue', 10))
+        self.assertFalse(ingest.put('meter', -1))
+        self.assertEqual(['cue', 'other'], [ingest.get(0), ingest.get(0)])
+        self.assertEqual({-1: 2}, ingest.stats['dropped_by_priority'])
+
+    def test_close(self):
+
+        ingest = osc.OSCIngestQueue(1)
+        ingest.put(0)
+        ingest.close()
+
+        self.assertFalse(ingest.put(1))
+        self.assertEqual(0, ingest.get())
+        self.assertIsNone(ingest.get())
+
+    def test_invalid_policy(self):
+
+        self.assertRaises(ValueError, osc.OSCIngestQueue, 1, 'unknown')
+
+
+class TestOSCServerIngest(unittest.TestCase):
+
+    def test_server(self):
+
+        received = []
+        done = threading.Event()
+
+        class Server(osc.OSCServer):
+
+            def handle(self, address, message, date):
+                received.append(message.args[0])
+
+                if len(received) == 3:
+                    done.set()
+
+        server = Server('127.0.0.1', 0, queue_size=8)
+
+        for index in range(3):
+            server.process_packet(osc.OSCMessage('/value', [index]).build().dgram, ('127.0.0.1', 1))
+
+        self.assertTrue(done.wait(2))
+        self.assertEqual([0, 1, 2], received)
+        self.assertEqual(3, server.snapshot()['ingest']['accepted'])
+
+        server.server_close()
+
+    def test_threading_server_queues_in_receiving_thread(self):
+
+        received = []
+        done = threading.Event()
+
+        class Server(socketserver.ThreadingMixIn, osc.OSCServer):
+
+            def handle(self, address, message, date):
+                received.append(message.args[0])
+
+                if len(received) == 20:
+                    done.set()
+
+        server = Server('127.0.0.1', 0, queue_size=64)
+        client = osc.OSCClient(*server.server_address)
+
+        with unittest.mock.patch.object(socketserver.ThreadingMixIn, 'process_request') as process_request:
+            for index in range(20):
+                client.send(osc.OSCMessage('/value', [index]))
+                server.handle_request()
+
+            self.assertTrue(done.wait(2))
+            self.assertFalse(process_request.called)
+
+        self.assertEqual(list(range(20)), received)
+
+        client.close()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    unittest.main()
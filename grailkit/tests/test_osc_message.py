@@ -98,6 +98,23 @@ class TestOSCMessage(unittest.TestCase):
         self.assertEqual(False, msg.args[1])
         self.assertEqual(2, len(list(msg)))
 
+    def test_lazy_parse(self):
+        msg = osc.OSCMessage.parse(_DGRAM_ALL_STANDARD_TYPES_OF_PARAMS, lazy=True)
+
+        self.assertEqual("/SYNC", msg.address)
+        self.assertFalse(msg.is_decoded)
+        self.assertEqual("ifsb", msg.typetag)
+        self.assertFalse(msg.is_decoded)
+        self.assertEqual(3, msg[0][1])
+        self.assertTrue(msg.is_decoded)
+        self.assertEqual("ABC", msg.args[2])
+
+    def test_lazy_parse_raises_on_access(self):
+        msg = osc.OSCMessage.parse(_DGRAM_ALL_STANDARD_TYPES_OF_PARAMS[:-4], lazy=True)
+
+        self.assertEqual("/SYNC", msg.address)
+        self.assertRaises(osc.OSCParseError, len, msg)
+
     def test_raises_on_empty_datargram(self):
         self.assertRaises(osc.OSCParseError, osc.OSCMessage.parse, b'')
 
@@ -176,6 +193,57 @@ class TestOSCMessage(unittest.TestCase):
         builder.add('this is not a float', osc.OSCType.TYPE_FLOAT)
         self.assertRaises(osc.OSCBuildError, builder.build)
 
+    def test_built_dgram_is_bytes(self):
+
+        self.assertIsInstance(osc.OSCMessage("/a", [1]).build().dgram, bytes)
+        self.assertIsInstance(osc.OSCMessage("/a").build().dgram, bytes)
+
+
+class TestOSCMessageMemory(unittest.TestCase):
+
+    def test_slots(self):
+
+        message = osc.OSCMessage.parse(osc.OSCMessage('/a', [1]).build().dgram)
+
+        self.assertFalse(hasattr(message, '__dict__'))
+        self.assertFalse(hasattr(osc.OSCBundle(), '__dict__'))
+
+    def test_shared_constants(self):
+
+        dgram = osc.OSCMessage('/a', [True, None, osc.OSCImpulse()]).build().dgram
+        first = list(osc.OSCMessage.parse(dgram))
+        second = list(osc.OSCMessage.parse(dgram))
+
+        self.assertIs(osc.IMPULSE, osc.OSCImpulse())
+        self.assertEqual([True, None, osc.IMPULSE], [arg[1] for arg in first])
+
+        for one, other in zip(first, second):
+            self.assertIs(one, other)
+
+    def test_pool(self):
+
+        osc.OSCMessage.pool_size = 1
+
+        try:
+            message = osc.OSCMessage.parse(osc.OSCMessage('/a', [1]).build().dgram)
+            message.release()
+
+            reused = osc.OSCMessage.parse(osc.OSCMessage('/b', ['b']).build().dgram)
+
+            self.assertIs(message, reused)
+            self.assertEqual('/b', reused.address)
+            self.assertEqual(['b'], reused.args)
+
+            # pool is full, message is left to garbage collector
+            osc.OSCMessage('/c').release()
+            reused.release()
+            osc.OSCMessage.parse(b'/c\0\0').release()
+
+            self.assertEqual(1, len(osc.OSCMessage._pool))
+        finally:
+            osc.OSCMessage.pool_size = 0
+            osc.OSCMessage._pool.clear()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,130 @@
+# -*- coding: UTF-8 -*-
+"""
+Tests for OSCMetrics class.
+
+:copyright: (c) 2017-2020 by Oleksii Lytvyn (http://alexlitvin.name).
+:license: MIT, see LICENSE for more details.
+"""
+
+import socket
+import unittest
+
+from grailkit import osc
+
+
+class TestOSCMetrics(unittest.TestCase):
+
+    def test_counters(self):
+
+        metrics = osc.OSCMetrics()
+        metrics.received(('127.0.0.1', 1), 16)
+        metrics.received(('127.0.0.1', 1), 32)
+        metrics.sent(('127.0.0.1', 2), 3, 48)
+        metrics.parse_failed('truncated')
+        metrics.handled(1000)
+        metrics.handled(3000)
+
+        stats = metrics.snapshot()
+
+        self.assertEqual(2, stats['received_packets'])
+        self.assertEqual(48, stats['received_bytes'])
+        self.assertEqual((3, 48), stats['sent'][('127.0.0.1', 2)])
+        self.assertEqual({'truncated': 1}, stats['parse_errors'])
+        self.assertEqual(2, stats['handler']['count'])
+        self.assertEqual(2000, stats['handler']['mean_ns'])
+        self.assertEqual({1024: 1, 4096: 1}, stats['handler']['histogram'])
+
+        metrics.reset()
+
+        self.assertEqual(0, metrics.snapshot()['received_packets'])
+
+    def test_processed(self):
+
+        metrics = osc.OSCMetrics()
+        metrics.processed(('127.0.0.1', 1), 16, 1000)
+
+        stats = metrics.snapshot()
+
+        self.assertEqual((1, 16), stats['received'][('127.0.0.1', 1)])
+        self.assertEqual(1, stats['handler']['count'])
+
+    def test_peer_limit(self):
+
+        metrics = osc.OSCMetrics()
+        metrics.max_peers = 2
+
+        for port in range(5):
+            metrics.received(('127.0.0.1', port), 1)
+
+        received = metrics.snapshot()['received']
+
+        self.assertEqual(3, len(received))
+        self.assertEqual((3, 3), received[('*', 0)])
+
+    def test_bundle(self):
+
+        metrics = osc.OSCMetrics()
+        metrics.received(('127.0.0.1', 1), 16)
+
+        bundle = osc.OSCBundle.parse(metrics.bundle('/stats', {'lateness_max': 0.5}).build().dgram)
+        addresses = [message.address for message in bundle]
+
+        self.assertIn('/stats/received/peer', addresses)
+        self.assertEqual([0.5], bundle[len(bundle) - 1].args)
+
+
+class TestOSCServerMetrics(unittest.TestCase):
+
+    def test_server(self):
+
+        server = osc.OSCServer('127.0.0.1', 0, stats_address='/stats')
+        client = osc.OSCClient(*server.server_address)
+
+        client.send(osc.OSCMessage('/value', [1]))
+        server.handle_request()
+        server.process_packet(b'/value\0\0,i\0\0', ('127.0.0.1', 1))
+
+        stats = server.snapshot()
+
+        self.assertEqual(2, stats['received_packets'])
+        self.assertEqual({'truncated': 1}, stats['parse_errors'])
+        self.assertEqual(1, stats['handler']['count'])
+        self.assertIn('scheduler', stats)
+        self.assertEqual(1, client.snapshot()['sent_packets'])
+
+        # metrics are sent back to sender of stats request
+        receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        receiver.bind(('127.0.0.1', 0))
+        receiver.settimeout(2)
+        receiver.sendto(osc.OSCMessage('/stats').build().dgram, server.server_address)
+        server.handle_request()
+
+        bundle = osc.OSCBundle.parse(receiver.recv(65535))
+
+        self.assertIn('/stats/handler', [message.address for message in bundle])
+
+        receiver.close()
+        client.close()
+        server.server_close()
+
+    def test_parse_error_reasons(self):
+
+        server = osc.OSCServer('127.0.0.1', 0)
+        address = ('127.0.0.1', 1)
+
+        server.process_packet(b'/a\0\0,i\0\0', address)
+        server.process_packet(b'/a\0\0\0\0\0\0', address)
+        server.process_packet(b'#bundle\0' + bytes(8) + b'\xff\xff\xff\xf0', address)
+        server.process_packet(b'/a\0\0,s\0\0abcd', address)
+
+        stats = server.snapshot()
+
+        self.assertEqual({osc.OSCParseError.TRUNCATED: 1, osc.OSCParseError.BAD_TYPETAG: 1,
+                          osc.OSCParseError.BAD_SIZE: 1, osc.OSCParseError.BAD_STRING: 1}, stats['parse_errors'])
+        self.assertEqual(4, stats['received_packets'])
+
+        server.server_close()
+
+
+if __name__ == "__main__":
+    unittest.main()
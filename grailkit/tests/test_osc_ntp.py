@@ -0,0 +1,63 @@
+# -*- coding: UTF-8 -*-
+"""
+Tests for NTP time tag conversion.
+
+:copyright: (c) 2017-2020 by Oleksii Lytvyn (http://alexlitvin.name).
+:license: MIT, see LICENSE for more details.
+"""
+
+import struct
+import unittest
+
+from grailkit import osc
+
+
+class TestNTP(unittest.TestCase):
+
+    def test_fraction_is_binary(self):
+
+        # 0x80000000 fraction is half of a second, not 0.2147483648
+        dgram = struct.pack('>II', 2208988800 + 10, 0x80000000)
+
+        self.assertEqual(10.5, osc.OSCType.timetag_unpack(dgram, 0)[0])
+        self.assertEqual(10500000000, osc.ntp_to_ns(struct.unpack('>Q', dgram)[0]))
+
+    def test_immediately(self):
+
+        self.assertEqual((osc.IMMEDIATELY, 8), osc.OSCType.timetag_unpack(osc.NTP_IMMEDIATELY, 0))
+
+    def test_time_round_trip(self):
+
+        date = 1600000000.123456
+
+        dgram = osc.time_to_ntp(date)
+        value, index = osc.OSCType.timetag_unpack(memoryview(dgram), 0)
+
+        self.assertEqual(8, index)
+        self.assertAlmostEqual(date, value, delta=1e-6)
+
+    def test_ns_round_trip(self):
+
+        for ns in (0, 1, 999999999, 1600000000123456789):
+            self.assertEqual(ns, osc.ntp_to_ns(osc.ns_to_ntp(ns)))
+
+    def test_batch(self):
+
+        times = [0, 1500000000000000000, 1600000000123456789]
+        timetags = osc.ns_to_ntp_batch(times)
+        dgram = b''.join(struct.pack('>Q', ntp) for ntp in timetags)
+
+        self.assertEqual([osc.ns_to_ntp(ns) for ns in times], timetags)
+        self.assertEqual(times, osc.ntp_to_ns_batch(timetags))
+        self.assertEqual(times, osc.timetags_unpack(dgram))
+        self.assertEqual(times[1:], osc.timetags_unpack(dgram, 8, 2))
+
+    def test_out_of_range(self):
+
+        self.assertRaises(osc.NTPError, osc.ns_to_ntp, -osc._NTP_DELTA_NS - 1)
+        self.assertRaises(osc.NTPError, osc.time_to_ntp, float('inf'))
+        self.assertRaises(osc.OSCParseError, osc.timetags_unpack, b'\0' * 8, 0, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
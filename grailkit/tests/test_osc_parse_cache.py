@@ -0,0 +1,98 @@
+# -*- coding: UTF-8 -*-
+"""
+Tests for OSCParseCache class.
+
+:copyright: (c) 2017-2020 by Oleksii Lytvyn (http://alexlitvin.name).
+:license: MIT, see LICENSE for more details.
+"""
+
+import time
+import unittest
+
+from grailkit import osc
+
+
+class TestOSCParseCache(unittest.TestCase):
+
+    def test_hit(self):
+
+        cache = osc.OSCParseCache()
+        dgram = osc.OSCMessage('/heartbeat', [1]).build().dgram
+
+        first = cache.parse(dgram)
+        second = cache.parse(bytearray(dgram))
+
+        self.assertIs(first, second)
+        self.assertIsInstance(first, osc.OSCMessage)
+        self.assertEqual([1], first.args)
+        self.assertEqual({'hits': 1, 'misses': 1, 'bypassed': 0, 'size': 1}, cache.stats)
+
+    def test_read_only(self):
+
+        cache = osc.OSCParseCache()
+        bundle = osc.OSCBundle(messages=[osc.OSCMessage('/a', [1])]).build()
+        cached = cache.parse(bundle.dgram)
+
+        self.assertRaises(TypeError, cached.add, osc.OSCMessage('/b'))
+        self.assertRaises(TypeError, cached[0].add, 2)
+        self.assertRaises(TypeError, setattr, cached[0], 'address', '/b')
+
+        copy = cached[0].copy()
+        copy.add(2)
+
+        self.assertEqual([1, 2], copy.args)
+
+    def test_arrays_are_tuples(self):
+
+        cache = osc.OSCParseCache()
+        dgram = osc.OSCMessage('/a', [[1, [2.0, 3.0]], 'b']).build().dgram
+
+        cached = cache.parse(dgram)
+
+        self.assertEqual([(1, (2.0, 3.0)), 'b'], cached.args)
+        self.assertIs(cached, cache.parse(dgram))
+        self.assertEqual([[1, [2.0, 3.0]], 'b'], cached.copy().args)
+
+    def test_lru(self):
+
+        cache = osc.OSCParseCache(max_size=2)
+        dgrams = [osc.OSCMessage('/%d' % index).build().dgram for index in range(3)]
+
+        cache.parse(dgrams[0])
+        cache.parse(dgrams[1])
+        cache.parse(dgrams[0])
+        cache.parse(dgrams[2])
+
+        self.assertEqual(2, len(cache))
+        cache.parse(dgrams[0])
+        self.assertEqual(2, cache.stats['hits'])
+        cache.parse(dgrams[1])
+        self.assertEqual(4, cache.stats['misses'])
+
+    def test_bypass(self):
+
+        cache = osc.OSCParseCache(max_dgram_size=64)
+        future = osc.OSCBundle(time.time() + 60, [osc.OSCMessage('/a')]).build().dgram
+        large = osc.OSCMessage('/a', [b'\0' * 128]).build().dgram
+
+        self.assertIsNot(cache.parse(future), cache.parse(future))
+        self.assertIsNot(cache.parse(large), cache.parse(large))
+        self.assertEqual(4, cache.stats['bypassed'])
+        self.assertEqual(0, len(cache))
+
+    def test_server(self):
+
+        server = osc.OSCServer('127.0.0.1', 0)
+        server.parse_cache = osc.OSCParseCache()
+        dgram = osc.OSCMessage('/a', [1]).build().dgram
+
+        for _ in range(3):
+            server.process_packet(dgram, ('127.0.0.1', 1))
+
+        server.server_close()
+
+        self.assertEqual(2, server.snapshot()['parse_cache']['hits'])
+
+
+if __name__ == "__main__":
+    unittest.main()
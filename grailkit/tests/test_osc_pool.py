@@ -0,0 +1,72 @@
+# -*- coding: UTF-8 -*-
+"""
+Tests for OSCServerPool class.
+
+:copyright: (c) 2017-2020 by Oleksii Lytvyn (http://alexlitvin.name).
+:license: MIT, see LICENSE for more details.
+"""
+
+import os
+import queue
+import socket
+import unittest
+import multiprocessing
+
+from grailkit import osc
+
+
+class PoolServer(osc.OSCServer):
+
+    def __init__(self, *args, log=None, **kwargs):
+        super(PoolServer, self).__init__(*args, **kwargs)
+
+        self.log = log
+
+    def handle(self, address, message, date):
+        self.log.put((os.getpid(), message.args[0]))
+
+
+@unittest.skipUnless(hasattr(socket, 'SO_REUSEPORT'), "SO_REUSEPORT is not supported")
+class TestOSCServerPool(unittest.TestCase):
+
+    def _receive(self, pin):
+
+        log = multiprocessing.Queue()
+        pool = osc.OSCServerPool(PoolServer, '127.0.0.1', 0, workers=2, pin=pin, log=log)
+        pool.start()
+
+        self.assertEqual(2, len(pool))
+
+        client = osc.OSCClient(*pool.server_address)
+        received = []
+
+        try:
+            for index in range(20):
+                client.send(osc.OSCMessage('/sensor', [index]))
+
+            for _ in range(20):
+                received.append(log.get(timeout=5))
+        except queue.Empty:
+            pass
+        finally:
+            client.close()
+            pool.stop(5)
+
+        self.assertEqual(0, len(pool))
+
+        return received
+
+    def test_receive(self):
+
+        self.assertEqual(20, len(self._receive(False)))
+
+    def test_pinned_sender_keeps_order(self):
+
+        received = self._receive(True)
+
+        self.assertEqual(list(range(20)), [value for _, value in received])
+        self.assertEqual(1, len({pid for pid, _ in received}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+# -*- coding: UTF-8 -*-
+"""
+Tests for OSCScheduler class.
+
+:copyright: (c) 2017-2020 by Oleksii Lytvyn (http://alexlitvin.name).
+:license: MIT, see LICENSE for more details.
+"""
+
+import time
+import unittest
+
+from grailkit import osc
+
+
+class TestOSCScheduler(unittest.TestCase):
+
+    def setUp(self):
+
+        self.log = []
+        self.scheduler = osc.OSCScheduler(lambda address, message, date: self.log.append(message))
+
+    def tearDown(self):
+
+        self.scheduler.stop()
+
+    def test_immediate(self):
+
+        message = osc.OSCMessage('/go')
+        bundle = osc.OSCBundle(timestamp=osc.IMMEDIATELY)
+
+        self.assertFalse(self.scheduler.dispatch(('127.0.0.1', 9000), message, time.time()))
+        self.assertFalse(self.scheduler.dispatch(('127.0.0.1', 9000), bundle, time.time()))
+        self.assertEqual([message, bundle], self.log)
+
+    def test_future_bundles_fire_in_order(self):
+
+        now = time.time()
+        late = osc.OSCBundle(timestamp=now + 0.2)
+        early = osc.OSCBundle(timestamp=now + 0.1)
+
+        self.assertTrue(self.scheduler.dispatch(('127.0.0.1', 9000), late, now))
+        self.assertTrue(self.scheduler.dispatch(('127.0.0.1', 9000), early, now))
+        self.assertEqual([], self.log)
+        self.assertEqual(2, len(self.scheduler))
+
+        time.sleep(0.4)
+
+        self.assertEqual([early, late], self.log)
+        self.assertEqual(2, self.scheduler.stats['fired'])
+        self.assertEqual(0, self.scheduler.stats['pending'])
+        self.assertGreaterEqual(self.scheduler.stats['lateness_max'], 0.0)
+
+    def test_nested_bundles_fire_at_own_time(self):
+
+        now = time.time()
+        go = osc.OSCMessage('/go')
+        later = osc.OSCMessage('/later')
+        earlier = osc.OSCMessage('/earlier')
+        nested = osc.OSCBundle(timestamp=now + 0.2, messages=[later])
+        nested.add(osc.OSCBundle(timestamp=now - 10, messages=[earlier]))
+        bundle = osc.OSCBundle(timestamp=osc.IMMEDIATELY, messages=[go])
+        bundle.add(nested)
+
+        self.assertFalse(self.scheduler.is_due(bundle))
+        self.assertTrue(self.scheduler.dispatch(('127.0.0.1', 9000), bundle, now))
+        self.assertEqual(1, len(self.log))
+        self.assertEqual([go], list(self.log[0]))
+
+        time.sleep(0.4)
+
+        # earlier time tag of nested bundle is raised to time tag of its parent
+        self.assertEqual(2, len(self.log))
+        self.assertEqual(now + 0.2, self.log[1].timestamp)
+        self.assertEqual(later, self.log[1][0])
+        self.assertEqual([earlier], list(self.log[1][1]))
+
+    def test_only_nested_bundle_is_scheduled(self):
+
+        now = time.time()
+        bundle = osc.OSCBundle(timestamp=osc.IMMEDIATELY)
+        bundle.add(osc.OSCBundle(timestamp=now + 60, messages=[osc.OSCMessage('/later')]))
+
+        self.assertTrue(self.scheduler.dispatch(('127.0.0.1', 9000), bundle, now))
+        self.assertEqual([], self.log)
+        self.assertEqual(1, len(self.scheduler))
+
+    def test_stop_drops_pending(self):
+
+        self.scheduler.dispatch(('127.0.0.1', 9000), osc.OSCBundle(timestamp=time.time() + 60), time.time())
+        self.scheduler.stop()
+
+        self.assertEqual(0, len(self.scheduler))
+        self.assertEqual([], self.log)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,6 +6,9 @@ Tests for OSCServer class.
 :license: MIT, see LICENSE for more details.
 """
 
+import socket
+import threading
+import time
 import unittest
 from threading import Timer
 
@@ -65,3 +68,74 @@ class TestOSCServer(unittest.TestCase):
         self.assertEqual(addr[0], '127.0.0.1')
         self.assertEqual(len(self.server.log), 4)
         self.assertEqual(self.server.log[0][1].address, "/debug")
+
+
+class TestOSCServerBurst(unittest.TestCase):
+
+    def test_drains_pending_datagrams(self):
+
+        server = TestServer('127.0.0.1', 0, burst=16)
+        client = osc.OSCClient(*server.server_address)
+
+        for index in range(10):
+            client.send(osc.OSCMessage('/burst', [index]))
+
+        client.close()
+
+        # one wakeup of server loop receives all pending datagrams
+        server.handle_request()
+        server.server_close()
+
+        self.assertEqual(list(range(10)), [log[1].args[0] for log in server.log])
+
+    def test_skips_short_datagram_after_valid_one(self):
+
+        server = TestServer('127.0.0.1', 0, burst=4)
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        batch = []
+
+        sock.sendto(osc.OSCMessage('/valid').build().dgram, server.server_address)
+
+        while not batch:
+            batch += server.receive_batch()
+
+        # empty datagram lands in the buffer still holding the valid one
+        sock.sendto(b'', server.server_address)
+        sock.sendto(b'x', server.server_address)
+        sock.close()
+        time.sleep(0.05)
+
+        batch += server.receive_batch()
+        server.server_close()
+
+        self.assertEqual([b'/valid\0\0'], [data for data, address in batch])
+        self.assertEqual({'not_osc': 2}, server.metrics.snapshot()['parse_errors'])
+
+
+class TestOSCServerMulticast(unittest.TestCase):
+
+    def test_group_send(self):
+
+        try:
+            server = TestServer('0.0.0.0', 0, groups=['239.255.0.77'], interface='127.0.0.1')
+        except OSError as e:
+            self.skipTest('Multicast is not available: %s' % e)
+
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        client = osc.OSCClient('239.255.0.77', server.server_address[1])
+        client.set_multicast(interface='127.0.0.1')
+        client.send(osc.OSCMessage('/group', [1]))
+        client.close()
+
+        deadline = time.time() + 2.0
+
+        while not server.log and time.time() < deadline:
+            time.sleep(0.01)
+
+        server.leave_group('239.255.0.77')
+        server.shutdown()
+        server.server_close()
+
+        self.assertEqual({}, server.groups)
+        self.assertEqual([1], server.log[0][1].args)
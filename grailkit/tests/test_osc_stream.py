@@ -0,0 +1,88 @@
+# -*- coding: UTF-8 -*-
+"""
+Tests for OSC stream transport.
+
+:copyright: (c) 2017-2020 by Oleksii Lytvyn (http://alexlitvin.name).
+:license: MIT, see LICENSE for more details.
+"""
+
+import time
+import unittest
+import threading
+
+from grailkit import osc
+
+
+class TestServer(osc.OSCStreamServer):
+
+    def __init__(self, *args, **kwargs):
+        super(TestServer, self).__init__(*args, **kwargs)
+
+        self.log = []
+
+    def handle(self, address, message, date):
+        self.log.append((address, message, date))
+
+
+class TestOSCStreamDecoder(unittest.TestCase):
+
+    def test_slip_partial_reads(self):
+
+        dgram = b'/a\x00\x00,b\x00\x00\x00\x00\x00\x02\xc0\xdb\x00\x00'
+        data = osc.OSCStreamDecoder.encode(dgram) * 2
+        decoder = osc.OSCStreamDecoder()
+        frames = []
+
+        for index in range(len(data)):
+            frames.extend(decoder.feed(data[index:index + 1]))
+
+        self.assertEqual([dgram, dgram], frames)
+        self.assertEqual(0, len(decoder))
+
+    def test_length_partial_reads(self):
+
+        dgram = osc.OSCMessage('/a', [1, 'text']).build().dgram
+        data = osc.OSCStreamDecoder.encode(dgram, osc.OSCStreamDecoder.LENGTH) * 3
+        decoder = osc.OSCStreamDecoder(osc.OSCStreamDecoder.LENGTH)
+
+        self.assertEqual([dgram], decoder.feed(data[:len(data) // 2]))
+        self.assertEqual([dgram, dgram], decoder.feed(data[len(data) // 2:]))
+
+    def test_too_large_packet_raises(self):
+
+        decoder = osc.OSCStreamDecoder(osc.OSCStreamDecoder.LENGTH, max_size=16)
+
+        self.assertRaises(osc.OSCParseError, decoder.feed, b'\x00\x00\x01\x00')
+
+
+class TestOSCStream(unittest.TestCase):
+
+    def test_send_receive(self):
+
+        for framing in (osc.OSCStreamDecoder.SLIP, osc.OSCStreamDecoder.LENGTH):
+            server = TestServer('127.0.0.1', 0, framing=framing)
+            thread = threading.Thread(target=server.serve_forever)
+            thread.start()
+
+            client = osc.OSCStreamClient(*server.server_address, framing=framing)
+            client.send(osc.OSCMessage('/cue', [b'\xc0' * 4096]))
+            client.send_many([osc.OSCMessage('/go', [1]), osc.OSCMessage('/go', [2])])
+
+            for _ in range(100):
+                if len(server.log) == 3:
+                    break
+
+                time.sleep(0.01)
+
+            client.close()
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+            self.assertEqual(3, len(server.log))
+            self.assertEqual(b'\xc0' * 4096, server.log[0][1].args[0])
+            self.assertEqual([2], server.log[2][1].args)
+
+
+if __name__ == "__main__":
+    unittest.main()
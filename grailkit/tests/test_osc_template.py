@@ -0,0 +1,62 @@
+# -*- coding: UTF-8 -*-
+"""
+Tests for OSCTemplate class.
+
+:copyright: (c) 2017-2020 by Oleksii Lytvyn (http://alexlitvin.name).
+:license: MIT, see LICENSE for more details.
+"""
+
+import unittest
+import unittest.mock
+
+from grailkit import osc
+
+
+class TestOSCTemplate(unittest.TestCase):
+
+    def test_set_arguments(self):
+
+        template = osc.OSCTemplate(osc.OSCMessage('/fader', [0.0, 1, True]))
+        buffer = template.buffer
+
+        template[0] = 0.5
+        template[1] = 7
+        template[2] = False
+
+        self.assertIs(buffer, template.buffer)
+        self.assertEqual(0.5, template[0])
+        self.assertEqual(False, template[2])
+        self.assertEqual(osc.OSCMessage('/fader', [0.5, 7, False]).build().dgram, template.dgram)
+
+    def test_update(self):
+
+        template = osc.OSCTemplate(osc.OSCMessage('/xy', [0.0, 0.0]))
+        template.update([0.25, 0.75])
+
+        self.assertEqual([0.25, 0.75], template.message().args)
+
+    def test_variable_size_raises(self):
+
+        self.assertRaises(osc.OSCBuildError, osc.OSCTemplate, osc.OSCMessage('/name', ['text']))
+
+    def test_wrong_value_raises(self):
+
+        template = osc.OSCTemplate(osc.OSCMessage('/fader', [0.0, osc.OSCImpulse()]))
+
+        self.assertRaises(osc.OSCBuildError, template.__setitem__, 0, 'text')
+        self.assertRaises(osc.OSCBuildError, template.__setitem__, 1, True)
+
+    @unittest.mock.patch('socket.socket')
+    def test_send(self, mock_socket_ctor):
+        mock_socket = mock_socket_ctor.return_value
+
+        template = osc.OSCTemplate(osc.OSCMessage('/fader', [0.0]))
+
+        client = osc.OSCClient('127.0.0.1', 31337)
+        client.send(template)
+
+        mock_socket.sendto.assert_called_once_with(template.buffer, ('127.0.0.1', 31337))
+
+
+if __name__ == "__main__":
+    unittest.main()
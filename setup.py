@@ -25,7 +25,7 @@ setup(
     url='https://bitbucket.org/alexlitvin/grailkit',
     download_url='https://bitbucket.org/alexlitvin/grailkit/get/default.zip',
     platforms='any',
-    packages=['grailkit'],
+    packages=['grailkit', 'grailkit.bench'],
     keywords=['framework', 'grail', 'development', 'osc', 'utilities'],
     zip_safe=False,
     classifiers=[